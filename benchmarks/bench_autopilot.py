@@ -0,0 +1,91 @@
+"""Бенчмарк bench_autopilot - цена копии состояния и поиска бота.
+
+Замеряет:
+- GameState.capture(), fork() и step() в микросекундах (copy.deepcopy
+  самих Player и Obstacle невозможен - pygame.Surface не копируется);
+- решения Autopilot в нескольких играх: среднее и худшее время решения,
+  худшее число шагов прогноза на решение (предел max_steps), ветвлений
+  на решение и сколько миллисекунд поиска приходится на кадр 60 FPS;
+- то же с пределом времени на решение, как в main.py --autopilot;
+- счет бота против случайных прыжков с теми же зернами.
+
+Запуск: python benchmarks/bench_autopilot.py [--games N] [--max-seconds N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from game.autopilot import Autopilot
+from game.game_state import GameState
+from game.simulation import Simulation
+
+
+def per_call_us(function, repeat):
+    """Среднее время вызова function() в микросекундах."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Цена копии состояния и решений Autopilot')
+    parser.add_argument('--games', type=int, default=5, help='Количество игр бота')
+    parser.add_argument('--max-seconds', type=int, default=120, help='Ограничение игрового времени одной игры')
+    parser.add_argument('--horizon', type=float, default=1.5, help='Глубина прогноза бота в секундах')
+    parser.add_argument('--time-budget', type=float, default=0.4 / 60, help='Предел времени на решение во втором прогоне')
+    args = parser.parse_args()
+
+    sim = Simulation(seed=3)
+    sim.game.lives = 1000
+    sim.run(max_ticks=700)      # на поле есть препятствия
+    state = GameState.capture(sim.game)
+
+    def rollout():      # вариант будущего на горизонт 1.5 секунды без прыжков
+        branch = state.fork()
+        for _ in range(180):
+            branch.step(1 / 120)
+    print(f"obstacles on screen: {len(state.shapes)}")
+    print(f"GameState.capture       {per_call_us(lambda: GameState.capture(sim.game), 2000):>10.2f} us")
+    print(f"GameState.fork          {per_call_us(state.fork, 100000):>10.2f} us")
+    print(f"GameState.step          {per_call_us(rollout, 500) / 180:>10.2f} us")
+    print()
+
+    for time_budget in (None, args.time_budget):
+        print(f"time budget: {'none' if time_budget is None else f'{time_budget * 1e3:.1f} ms'}")
+        print(f"{'seed':>5}{'random':>8}{'autopilot':>11}{'decisions':>11}{'branches':>10}"
+              f"{'avg ms':>8}{'worst ms':>10}{'worst steps':>13}{'ms/frame':>10}")
+        for seed in range(args.games):
+            rng = random.Random(seed)
+            baseline = Simulation(seed=seed).run(controller=lambda game, tick: rng.random() < 0.02)
+
+            pilot = Autopilot(horizon=args.horizon, time_budget=time_budget)
+            times = []
+            steps = []
+            def controller(game, tick):
+                started = time.perf_counter()
+                jump = pilot.decide(game)
+                times.append(time.perf_counter() - started)
+                steps.append(pilot.steps)
+                return jump
+            result = Simulation(seed=seed).run(controller=controller, max_ticks=args.max_seconds * 120)
+
+            searched = sorted(times)[-pilot.decisions:]     # вызовы, в которых шел поиск
+            frames = len(times) * 60 / 120      # кадров 60 FPS за игру (120 шагов в секунду)
+            print(f"{seed:>5}{baseline['score']:>8}{result['score']:>11}{pilot.decisions:>11}"
+                  f"{pilot.total_branches / pilot.decisions:>10.1f}{sum(searched) / len(searched) * 1e3:>8.2f}"
+                  f"{max(searched) * 1e3:>10.2f}{max(steps):>13}{sum(times) / frames * 1e3:>10.2f}")
+        print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Бенчмарк bench_batch_env - пропускная способность пакета игр BatchEnv.
+
+Для нескольких размеров пакета N игры с одной и той же случайной
+стратегией (прыжок с вероятностью --jump-prob на каждом шаге) идут
+заданное число шагов. Печатается, сколько шагов игр в секунду и сколько
+законченных эпизодов в минуту получается. Для сравнения те же эпизоды
+проигрываются по одному в Simulation (объекты Python, одна игра за раз).
+Средние счет и длина эпизода у пакета занижены: за --steps шагов
+заканчиваются только короткие эпизоды (совпадение правил с игрой
+проверяет TestBatchEnv.test_matches_simulation).
+
+Запуск: python benchmarks/bench_batch_env.py [--sizes 1 64 1024 4096] [--steps N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+import numpy as np
+from game.batch_env import BatchEnv
+from game.simulation import Simulation
+
+
+def measure_batch(size, steps, jump_prob):
+    """Играет steps шагов в пакете из size игр.
+
+    Returns:
+        tuple: (шагов игр в секунду, эпизодов в минуту, средний счет, средняя длина эпизода).
+    """
+    env = BatchEnv(size, seed=0)
+    actions = np.random.default_rng(1)
+    scores, lengths = [], []
+    started = time.perf_counter()
+    for _ in range(steps):
+        obs, rewards, dones, info = env.step(actions.random(size) < jump_prob)
+        if dones.any():
+            scores.extend(info['score'][dones].tolist())
+            lengths.extend(info['ticks'][dones].tolist())
+    elapsed = time.perf_counter() - started
+    return (size * steps / elapsed, len(scores) / elapsed * 60,
+            np.mean(scores) if scores else 0.0, np.mean(lengths) if lengths else 0.0)
+
+
+def measure_simulation(games, jump_prob):
+    """Играет games эпизодов по одному в Simulation.
+
+    Returns:
+        tuple: (шагов в секунду, эпизодов в минуту, средний счет, средняя длина эпизода).
+    """
+    scores, lengths = [], []
+    started = time.perf_counter()
+    for seed in range(games):
+        actions = random.Random(seed)
+        sim = Simulation(seed=seed)
+        result = sim.run(controller=lambda game, tick: actions.random() < jump_prob)
+        scores.append(result['score'])
+        lengths.append(sim.ticks)
+    elapsed = time.perf_counter() - started
+    return sum(lengths) / elapsed, games / elapsed * 60, np.mean(scores), np.mean(lengths)
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Шагов и эпизодов в секунду у BatchEnv и Simulation')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 64, 1024, 4096], help='Размеры пакета')
+    parser.add_argument('--steps', type=int, default=3000, help='Шагов на каждый размер пакета')
+    parser.add_argument('--games', type=int, default=30, help='Эпизодов Simulation для сравнения')
+    parser.add_argument('--jump-prob', type=float, default=0.02, help='Вероятность прыжка на шаге')
+    args = parser.parse_args()
+
+    print(f"{'backend':<14}{'steps/s':>12}{'episodes/min':>14}{'mean score':>12}{'mean ticks':>12}")
+    rate, episodes, score, ticks = measure_simulation(args.games, args.jump_prob)
+    print(f"{'Simulation':<14}{rate:>12.0f}{episodes:>14.0f}{score:>12.2f}{ticks:>12.0f}")
+    for size in args.sizes:
+        rate, episodes, score, ticks = measure_batch(size, args.steps, args.jump_prob)
+        print(f"{'BatchEnv ' + str(size):<14}{rate:>12.0f}{episodes:>14.0f}{score:>12.2f}{ticks:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Бенчмарк bench_collision - пропуски и стоимость проверки столкновений.
+
+Для набора скоростей препятствие проходит мимо стоящего игрока шагами
+по 1/60 секунды. Для обычной проверки collides_with (только конец шага)
+и для swept_collides (весь отрезок движения) считается, сколько проходов
+закончилось без столкновения, и среднее время одной проверки.
+
+Запуск: python benchmarks/bench_collision.py [--max-speed N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+import pygame
+from game.player import Player
+from game.obstacle import Obstacle
+from game.collision import swept_collides
+
+
+def run(check, speeds, dt):
+    """Прогоняет препятствие мимо игрока на каждой скорости.
+
+    Returns:
+        tuple: (количество пропусков, количество проверок, время в секундах).
+    """
+    random.seed(1)
+    player = Player(100, 500)
+    misses = checks = 0
+    elapsed = 0.0
+    for speed in speeds:
+        obstacle = Obstacle(player.rect.right + 5, 490, speed=speed)
+        hit = False
+        while not hit and obstacle.rect.right > player.rect.left - 5:
+            player.save_position()
+            obstacle.save_position()
+            obstacle.update(dt)
+            started = time.perf_counter()
+            hit = check(player, obstacle)
+            elapsed += time.perf_counter() - started
+            checks += 1
+        misses += not hit
+    return misses, checks, elapsed
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Пропуски столкновений на большой скорости')
+    parser.add_argument('--max-speed', type=int, default=200000, help='Максимальная скорость препятствия, пикс/с')
+    parser.add_argument('--step', type=int, default=400, help='Шаг перебора скоростей')
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    speeds = range(args.step, args.max_speed + 1, args.step)
+
+    print(f"{'check':<16}{'misses':>8}{'checks':>10}{'us/check':>10}")
+    for name, check in (('collides_with', Player.collides_with), ('swept_collides', swept_collides)):
+        misses, checks, elapsed = run(check, speeds, 1 / 60)
+        print(f"{name:<16}{misses:>8}{checks:>10}{elapsed / checks * 1e6:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
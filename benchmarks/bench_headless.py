@@ -0,0 +1,50 @@
+"""Бенчмарк bench_headless - скорость симуляции без окна.
+
+Несколько игр с разными зернами проигрываются в Simulation с прыжками
+через равные промежутки. Печатается, сколько шагов в секунду выполняется
+и во сколько раз это быстрее реального времени (120 шагов в секунду).
+Окно и звук не создаются совсем.
+
+Запуск: python benchmarks/bench_headless.py [--games N] [--max-seconds N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from game.simulation import Simulation
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Шагов в секунду у симуляции без окна')
+    parser.add_argument('--games', type=int, default=10, help='Количество игр')
+    parser.add_argument('--max-seconds', type=int, default=300, help='Ограничение игрового времени одной игры')
+    parser.add_argument('--jump-every', type=int, default=97, help='Прыжок каждые N шагов')
+    parser.add_argument('--tick-rate', type=int, default=120, help='Шагов симуляции в секунду игрового времени')
+    args = parser.parse_args()
+
+    print(f"{'seed':>5}{'score':>7}{'lives':>7}{'ticks':>8}{'ticks/s':>10}{'x realtime':>12}")
+    total_ticks = 0
+    total_time = 0.0
+    for seed in range(args.games):
+        started = time.perf_counter()
+        sim = Simulation(tick_rate=args.tick_rate, seed=seed)
+        result = sim.run(jumps=range(0, args.max_seconds * args.tick_rate, args.jump_every),
+                         max_ticks=args.max_seconds * args.tick_rate)
+        elapsed = time.perf_counter() - started
+        total_ticks += sim.ticks
+        total_time += elapsed
+        print(f"{seed:>5}{result['score']:>7}{result['lives']:>7}{sim.ticks:>8}"
+              f"{sim.ticks / elapsed:>10.0f}{sim.game_time() / elapsed:>12.0f}")
+
+    rate = total_ticks / total_time
+    print(f"{'all':>5}{'':>7}{'':>7}{total_ticks:>8}{rate:>10.0f}{rate / args.tick_rate:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""Бенчмарк bench_idle - загрузка процессора на паузе.
+
+Сравнивает два варианта главного цикла, пока игра стоит на паузе:
+
+- busy - старый цикл: clock.tick(fps), обработка событий и полная перерисовка каждый кадр;
+- idle - цикл из main.py: pygame.event.wait с таймаутом, без перерисовки неподвижной сцены.
+
+Загрузка процессора считается как процессорное время (time.process_time)
+деленное на реальное время замера. С драйвером dummy SDL ждет событие,
+опрашивая очередь каждую миллисекунду, поэтому в окне настоящего драйвера
+(x11, wayland, windows) загрузка в режиме idle еще ниже.
+
+Запуск: python benchmarks/bench_idle.py [--seconds N] [--fps N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+import pygame
+from game.game_manager import GameManager
+from main import wait_for_events, draw_frame
+
+
+def busy_loop(game_manager, screen, seconds, fps):
+    """Старый цикл: рисует паузу с частотой fps.
+
+    Returns:
+        int: Количество нарисованных кадров.
+    """
+    clock = pygame.time.Clock()
+    frames = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        dt = clock.tick(fps) / 1000.0
+        game_manager.handle_events()
+        game_manager.update(dt)
+        draw_frame(game_manager, screen)
+        frames += 1
+    return frames
+
+
+def idle_loop(game_manager, screen, seconds, timeout_ms):
+    """Цикл простоя из main.py: ждет события и не перерисовывает неподвижную сцену.
+
+    Returns:
+        int: Количество нарисованных кадров.
+    """
+    frames = 0
+    drawn = False
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        events = wait_for_events(timeout_ms)
+        game_manager.handle_events(events)
+        if drawn and not events:
+            continue
+        draw_frame(game_manager, screen)
+        drawn = True
+        frames += 1
+    return frames
+
+
+def measure(loop, *args):
+    """Запускает цикл и считает загрузку процессора.
+
+    Returns:
+        tuple: (загрузка процессора в процентах, количество кадров).
+    """
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    frames = loop(*args)
+    cpu = time.process_time() - cpu_started
+    wall = time.perf_counter() - wall_started
+    return cpu / wall * 100, frames
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Загрузка процессора на паузе')
+    parser.add_argument('--seconds', type=float, default=3.0, help='Длительность каждого замера')
+    parser.add_argument('--fps', type=int, default=60, help='Частота кадров старого цикла')
+    parser.add_argument('--timeout', type=int, default=500, help='Таймаут pygame.event.wait в мс')
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+    game_manager = GameManager()
+    game_manager.is_paused = True       # меряем простой на паузе
+
+    busy_cpu, busy_frames = measure(busy_loop, game_manager, screen, args.seconds, args.fps)
+    idle_cpu, idle_frames = measure(idle_loop, game_manager, screen, args.seconds, args.timeout)
+
+    print(f"{'mode':<6} {'CPU':>8} {'frames':>8}")
+    print(f"{'busy':<6} {busy_cpu:>7.1f}% {busy_frames:>8}")
+    print(f"{'idle':<6} {idle_cpu:>7.1f}% {idle_frames:>8}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
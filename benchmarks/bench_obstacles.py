@@ -0,0 +1,84 @@
+"""Бенчмарк bench_obstacles - стоимость шага при большом количестве препятствий.
+
+Одинаковый набор препятствий обновляется через список объектов Obstacle
+(update_obstacle_list) и через массивы NumPy (update_obstacle_array).
+Препятствия разбросаны по ширине экрана и почти все далеко от игрока,
+поэтому замер показывает стоимость движения, подсчета очков, грубой
+проверки столкновений и удаления, а не попиксельных проверок.
+
+Запуск: python benchmarks/bench_obstacles.py [--steps N] [--counts 100 1000 ...]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+import pygame
+from game.game_manager import GameManager
+from game.obstacle import Obstacle
+from game.obstacle_array import ObstacleArray
+
+
+def fill(gm, count):
+    """Создает count препятствий за пределами пути игрока."""
+    random.seed(3)
+    for _ in range(count):
+        x = random.uniform(gm.player.rect.right + 50, gm.screen_width * 4)
+        y = random.uniform(0, gm.player.rect.top - 60)      # выше игрока - столкновений нет
+        if gm.obstacle_array is not None:
+            gm.obstacle_array.add(x, y, 60, 40, gm.game_speed, True)
+        else:
+            gm.obstacles.append(Obstacle(x, y, 60, 40, speed=gm.game_speed, obstacle_type='bird'))
+
+
+def run(backend, count, steps, dt):
+    """Выполняет steps шагов с count препятствиями.
+
+    Returns:
+        float: Среднее время шага в микросекундах.
+    """
+    gm = GameManager(obstacle_backend=backend)
+    gm.is_paused = False
+    fill(gm, count)
+    update = gm.update_obstacle_array if backend == 'array' else gm.update_obstacle_list
+
+    started = time.perf_counter()
+    for _ in range(steps):
+        gm.player.save_position()
+        for obstacle in gm.obstacles:
+            obstacle.save_position()
+        update(dt)
+    return (time.perf_counter() - started) / steps * 1e6
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Шаг симуляции: список объектов против массивов NumPy')
+    parser.add_argument('--steps', type=int, default=50, help='Количество шагов на замер')
+    parser.add_argument('--counts', type=int, nargs='+', default=[100, 1000, 5000, 10000],
+                        help='Количество препятствий')
+    args = parser.parse_args()
+
+    if not ObstacleArray.available():
+        print("NumPy не установлен - сравнивать не с чем")
+        return
+
+    pygame.init()
+    pygame.display.set_mode((1200, 800))
+    print(f"{'obstacles':>10}{'list us/step':>14}{'array us/step':>15}{'speedup':>9}")
+    for count in args.counts:
+        list_time = run('list', count, args.steps, 1 / 120)
+        array_time = run('array', count, args.steps, 1 / 120)
+        print(f"{count:>10}{list_time:>14.0f}{array_time:>15.0f}{list_time / array_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
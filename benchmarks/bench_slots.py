@@ -0,0 +1,114 @@
+"""Бенчмарк bench_slots - память и доступ к атрибутам объектов со слотами.
+
+Для Player, Obstacle и записи облака Cloud сравнивается:
+- сколько байт занимает один объект (сам объект плюс словарь __dict__, если он есть);
+- сколько стоит типичная работа шага: чтение и запись полей в цикле.
+
+Для сравнения строятся "двойники" со словарем __dict__ с теми же
+атрибутами и значениями, а облако сравнивается со словарем
+{'x', 'y', 'speed'}, которым облака хранились раньше.
+
+Запуск: python benchmarks/bench_slots.py [--count N] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+import pygame
+from game.player import Player
+from game.obstacle import Obstacle
+from game.scenery import Cloud
+
+
+class DictObject:
+    """Объект со словарем __dict__ - как игровые объекты до слотов."""
+
+
+def slot_names(obj):
+    """Все имена слотов объекта с учетом родительских классов."""
+    names = []
+    for cls in type(obj).__mro__:
+        names.extend(getattr(cls, '__slots__', ()))
+    return names
+
+
+def dict_twin(obj):
+    """Копия объекта со словарем __dict__ и теми же атрибутами."""
+    twin = DictObject()
+    for name in slot_names(obj):
+        setattr(twin, name, getattr(obj, name))
+    return twin
+
+
+def object_size(obj):
+    """Размер объекта в байтах вместе со словарем атрибутов."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def step_objects(objects, repeat):
+    """Цикл шага для препятствий: сохранить положение и сдвинуть X."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for obj in objects:
+            obj.prev_x = obj.pos_x
+            obj.pos_x -= obj.speed * 0.008
+            obj.passed = obj.passed or obj.pos_x < 0
+    return time.perf_counter() - started
+
+
+def read_clouds(clouds, repeat, by_key):
+    """Цикл отрисовки облаков: чтение координат."""
+    started = time.perf_counter()
+    total = 0
+    for _ in range(repeat):
+        if by_key:
+            for cloud in clouds:
+                total += cloud['x'] + cloud['y']
+        else:
+            for cloud in clouds:
+                total += cloud.x + cloud.y
+    return time.perf_counter() - started
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Слоты против __dict__ для игровых объектов')
+    parser.add_argument('--count', type=int, default=1000, help='Количество объектов в цикле')
+    parser.add_argument('--repeat', type=int, default=200, help='Сколько раз пройти цикл')
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    player = Player(100, 500)
+    obstacles = [Obstacle(1250 + i, 490, speed=400) for i in range(args.count)]
+    clouds = [Cloud(i, 100, 40) for i in range(args.count)]
+
+    print(f"{'object':<10}{'dict bytes':>12}{'slots bytes':>13}")
+    for name, obj in (('Player', player), ('Obstacle', obstacles[0]), ('Cloud', clouds[0])):
+        print(f"{name:<10}{object_size(dict_twin(obj)):>12}{object_size(obj):>13}")
+
+    twins = [dict_twin(obstacle) for obstacle in obstacles]
+    cloud_dicts = [{'x': cloud.x, 'y': cloud.y, 'speed': cloud.speed} for cloud in clouds]
+    updates = args.count * args.repeat
+    print()
+    print(f"{'loop':<16}{'dict ns/obj':>13}{'slots ns/obj':>14}")
+    print(f"{'obstacle step':<16}{step_objects(twins, args.repeat) / updates * 1e9:>13.1f}"
+          f"{step_objects(obstacles, args.repeat) / updates * 1e9:>14.1f}")
+    print(f"{'cloud draw':<16}{read_clouds(cloud_dicts, args.repeat, True) / updates * 1e9:>13.1f}"
+          f"{read_clouds(clouds, args.repeat, False) / updates * 1e9:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
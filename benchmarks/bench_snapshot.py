@@ -0,0 +1,71 @@
+"""Бенчмарк bench_snapshot - цена снимка состояния игры и восстановления из него.
+
+Замеряет GameSnapshot.capture(), restore() и save() в микросекундах и
+размер снимка в байтах для обоих хранилищ препятствий, а также сколько
+стоит запись SnapshotHistory на каждом шаге игры (снимок раз в секунду).
+
+Запуск: python benchmarks/bench_snapshot.py [--ticks N] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from game.obstacle_array import ObstacleArray
+from game.simulation import Simulation
+from game.snapshot import GameSnapshot, SnapshotHistory
+
+
+def per_call_us(function, repeat):
+    """Среднее время вызова function() в микросекундах."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Цена снимка состояния игры и восстановления')
+    parser.add_argument('--ticks', type=int, default=3000, help='Шагов игры до снимка')
+    parser.add_argument('--repeat', type=int, default=5000, help='Повторов каждого замера')
+    args = parser.parse_args()
+
+    backends = ('list', 'array') if ObstacleArray.available() else ('list',)
+    path = os.path.join(tempfile.mkdtemp(), 'bench.snap')
+    print(f"{'backend':<8}{'obstacles':>10}{'bytes':>7}{'capture us':>12}{'restore us':>12}{'save us':>9}")
+    for backend in backends:
+        sim = Simulation(seed=5, obstacle_backend=backend)
+        sim.game.lives = 1000       # игра не кончается до снимка
+        sim.run(jumps=range(0, args.ticks, 61), max_ticks=args.ticks)
+        data = GameSnapshot.capture(sim.game)
+        target = Simulation(seed=6, obstacle_backend=backend).game
+        print(f"{backend:<8}{len(sim.game.obstacles) + len(sim.game.obstacle_array or ()):>10}{len(data):>7}"
+              f"{per_call_us(lambda: GameSnapshot.capture(sim.game), args.repeat):>12.1f}"
+              f"{per_call_us(lambda: GameSnapshot.restore(target, data), args.repeat):>12.1f}"
+              f"{per_call_us(lambda: GameSnapshot.save(sim.game, path), args.repeat // 10):>9.1f}")
+    os.remove(path)
+    print()
+
+    for history in (None, SnapshotHistory()):
+        sim = Simulation(seed=5)
+        sim.game.lives = 1000
+        started = time.perf_counter()
+        for tick in range(args.ticks):
+            sim.step(tick % 61 == 0)
+            if history:
+                history.record(sim.game)
+        per_tick = (time.perf_counter() - started) / args.ticks * 1e6
+        print(f"{'step with history' if history else 'step':<18}{per_tick:>10.1f} us")
+
+
+if __name__ == '__main__':
+    main()
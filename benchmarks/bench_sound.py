@@ -0,0 +1,79 @@
+"""Бенчмарк bench_sound - цена загрузки звуков и переключения музыки.
+
+Замеряет:
+- SoundManager.preload() без кэша (декодирование MP3), с теплым дисковым
+  кэшем PCM (DiskAssetCache во временной папке) и с кэшем в памяти
+  процесса (SoundManager.sound_cache);
+- задержку включения и выключения музыки: старый способ (mixer.music
+  открывает и читает файл при каждом включении) и канал с заранее
+  декодированной музыкой (toggle_music - пауза канала).
+
+Запуск: python benchmarks/bench_sound.py [--repeat N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+import pygame
+
+from game.asset_cache import DiskAssetCache
+from game.sound_manager import SoundManager
+
+
+def per_call_us(function, repeat):
+    """Среднее время вызова function() в микросекундах."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Цена загрузки звуков и переключения музыки')
+    parser.add_argument('--repeat', type=int, default=200, help='Повторов замера переключения')
+    args = parser.parse_args()
+
+    pygame.mixer.init()
+    cache_dir = tempfile.mkdtemp()
+    print(f"{'preload':<14}{'ms':>8}{'pcm MB':>8}")
+    for label in ('decode', 'disk cache', 'memory cache'):
+        if label != 'memory cache':
+            SoundManager.sound_cache.clear()        # память пустая - звуки с диска или из MP3
+        DiskAssetCache.enable(cache_dir)
+        manager = SoundManager()
+        manager.preload()
+        pcm = sum(len(sound.get_raw()) for sound in [manager.music, *manager.sounds.values()] if sound)
+        print(f"{label:<14}{manager.load_time * 1000:>8.1f}{pcm / 2 ** 20:>8.1f}")
+    DiskAssetCache.disable()
+    shutil.rmtree(cache_dir)
+    print()
+
+    music_path = os.path.join(SoundManager.SOUNDS_PATH, SoundManager.MUSIC_NAME + '.mp3')
+
+    def reload_music():     # прежний toggle_music: стоп и заново load + play файла
+        pygame.mixer.music.stop()
+        pygame.mixer.music.load(music_path)
+        pygame.mixer.music.play(-1)
+    print(f"toggle mixer.music {per_call_us(reload_music, args.repeat):>10.1f} us")
+    pygame.mixer.music.stop()
+
+    manager.play_music()
+    print(f"toggle channel     {per_call_us(manager.toggle_music, args.repeat * 10):>10.1f} us "
+          f"(last toggle_time {manager.toggle_time * 1e6:.1f} us)")
+    manager.stop_music()
+    pygame.mixer.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Бенчмарк bench_spawn_schedule - непроходимые препятствия и цена расписания.
+
+Замеряет:
+- долю непроходимых цепочек из куска (chunk_size) подряд идущих случайных
+  препятствий (как их выбирает Obstacle.random_spawn) при разных скоростях
+  и интервалах и сколько препятствий SpawnSchedule пришлось отодвинуть или
+  выбрать заново;
+- время расчета куска расписания (в фоновом потоке) и шага игры
+  GameManager.update со случайными препятствиями и с расписанием;
+- счет Autopilot на случайных препятствиях и на расписании с теми же зернами.
+
+Запуск: python benchmarks/bench_spawn_schedule.py [--windows N] [--games N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from game.autopilot import Autopilot
+from game.simulation import Simulation
+from game.spawn_schedule import ScheduledSpawn, SpawnSchedule
+
+SETTINGS = ((400, 1.5), (700, 1.0), (1000, 1.0), (400, 0.6), (700, 0.5))      # (скорость, интервал)
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Непроходимые препятствия и цена SpawnSchedule')
+    parser.add_argument('--windows', type=int, default=2000, help='Случайных цепочек препятствий на настройку')
+    parser.add_argument('--games', type=int, default=3, help='Игр Autopilot на каждый способ')
+    parser.add_argument('--max-seconds', type=int, default=120, help='Ограничение игрового времени одной игры')
+    args = parser.parse_args()
+
+    sim = Simulation(seed=0)
+    game = sim.game
+    print(f"{'speed':>6}{'interval':>9}{'random impossible':>19}{'delayed':>9}{'resampled':>11}"
+          f"{'forced':>8}{'ms/chunk':>10}")
+    for speed, interval in SETTINGS:
+        schedule = SpawnSchedule(0, game.screen_width, game.ground_y, game.player, threaded=False)
+        rng = random.Random(speed)
+        impossible = 0
+        for _ in range(args.windows):
+            window = [ScheduledSpawn.random(game.screen_width, game.ground_y, rng) for _ in range(schedule.chunk_size)]
+            impossible += not schedule.reachability.passable(window, speed, interval)
+
+        game.game_speed, game.obstacle_interval = speed, interval
+        game.speed_increase_interval = 10 ** 6      # одна скорость на весь замер
+        for _ in range(200):
+            schedule.pop(game)
+        spawned = schedule.chunks * schedule.chunk_size
+        print(f"{speed:>6}{interval:>9.2f}{impossible / args.windows:>19.1%}{schedule.delayed / spawned:>9.1%}"
+              f"{schedule.resampled:>11}{schedule.forced:>8}{schedule.plan_time * 1000 / schedule.chunks:>10.2f}")
+    print()
+
+    for spawn_schedule in (False, True):
+        sim = Simulation(seed=1, spawn_schedule=spawn_schedule)
+        sim.game.lives = 1000
+        started = time.perf_counter()
+        sim.run(jumps=range(0, 120 * 120, 61), max_ticks=120 * 120)
+        per_tick = (time.perf_counter() - started) / sim.ticks * 1e6
+        if spawn_schedule:
+            stats = sim.game.spawn_schedule.stats()
+            per_tick -= stats['plan_ms'] * 1000 / sim.ticks     # без окна куски считаются сразу - не в шаге игры
+        print(f"update with {'schedule' if spawn_schedule else 'random':<9}{per_tick:>8.1f} us per tick")
+    print()
+
+    print(f"{'seed':>5}{'random':>8}{'schedule':>10}")
+    for seed in range(args.games):
+        scores = [Simulation(seed=seed, spawn_schedule=spawn_schedule).run(
+            controller=Autopilot().controller, max_ticks=args.max_seconds * 120)['score']
+            for spawn_schedule in (False, True)]
+        print(f"{seed:>5}{scores[0]:>8}{scores[1]:>10}")
+
+
+if __name__ == '__main__':
+    main()
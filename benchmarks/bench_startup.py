@@ -0,0 +1,86 @@
+"""Бенчмарк bench_startup - время запуска игры с дисковым кэшем ресурсов и без него.
+
+Каждый замер выполняется в отдельном процессе, чтобы кэши в памяти
+(SpriteLoader.cache, AssetManifest) не влияли на результат:
+
+- off      - кэш выключен, все PNG и MP3 декодируются последовательно;
+- parallel - кэш выключен, файлы декодируются в пуле потоков (ParallelAssetLoader);
+- cold     - кэш включен, но пуст (первый запуск: декодирование + запись);
+- warm     - кэш заполнен предыдущим запуском (второй запуск).
+
+Запуск: python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Код дочернего процесса: создает окно и GameManager, печатает время загрузки
+CHILD = '''
+import os, sys
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+import pygame
+from game.asset_cache import DiskAssetCache
+pygame.init()
+pygame.display.set_mode((1200, 800))
+if sys.argv[1]:
+    DiskAssetCache.enable(sys.argv[1])
+from game.game_manager import GameManager
+from game.sound_manager import SoundManager
+from game.asset_loader import ParallelAssetLoader
+load_time = 0.0
+if sys.argv[2] == 'parallel':
+    load_time = ParallelAssetLoader(GameManager.sprite_requests(), SoundManager().sound_files()).run()
+print('STARTUP', load_time + GameManager().startup_time)
+'''
+
+
+def measure(cache_dir, loading='sequential'):
+    """Запускает игру в отдельном процессе и возвращает время загрузки.
+
+    Args:
+        cache_dir (str): Папка дискового кэша или пустая строка (кэш выключен).
+        loading (str): 'sequential' или 'parallel' (загрузка в пуле потоков).
+
+    Returns:
+        float: Время загрузки ресурсов и создания GameManager в секундах.
+    """
+    output = subprocess.run([sys.executable, '-c', CHILD, cache_dir, loading], cwd=PROJECT_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    for line in output.splitlines():
+        if line.startswith('STARTUP'):
+            return float(line.split()[1])
+    raise RuntimeError(output)
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description='Время запуска Moti Runner с дисковым кэшем ресурсов')
+    parser.add_argument('--runs', type=int, default=5, help='Количество замеров для каждого режима')
+    args = parser.parse_args()
+
+    results = {'off': [], 'parallel': [], 'cold': [], 'warm': []}
+    for _ in range(args.runs):
+        cache_dir = tempfile.mkdtemp(prefix='moti_asset_cache_')
+        try:
+            results['off'].append(measure(''))
+            results['parallel'].append(measure('', 'parallel'))
+            results['cold'].append(measure(cache_dir))
+            results['warm'].append(measure(cache_dir))
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print(f"{'mode':<10}{'best, ms':>10}{'median, ms':>12}")
+    for mode, times in results.items():
+        times.sort()
+        print(f"{mode:<10}{times[0] * 1000:>10.1f}{times[len(times) // 2] * 1000:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
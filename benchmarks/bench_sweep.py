@@ -0,0 +1,51 @@
+"""Бенчмарк bench_sweep - масштабирование прогона игр по процессам.
+
+Один и тот же набор игр (бот random:0.02, зерна 0..N-1) проигрывается
+через run_sweep с разным числом процессов пула. Печатается, сколько игр
+в секунду получается и какая доля от идеального линейного ускорения
+относительно одного процесса достигнута.
+
+Запуск: python benchmarks/bench_sweep.py [--games N] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from game.sweep import run_sweep
+
+
+def main():
+    """Выполняет замеры и печатает таблицу результатов."""
+    cores = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    parser = argparse.ArgumentParser(description='Игр в секунду у run_sweep при разном числе процессов')
+    parser.add_argument('--games', type=int, default=400, help='Количество игр')
+    parser.add_argument('--workers', type=int, nargs='+', default=default_workers, help='Числа процессов')
+    parser.add_argument('--chunk-size', type=int, default=25, help='Зерен в одной задаче процесса')
+    args = parser.parse_args()
+
+    settings = {'speed': 400, 'obstacle_interval': 1.5, 'speed_increase_interval': 5}
+    print(f"ядер: {cores}")
+    print(f"{'workers':>8}{'games/s':>10}{'speedup':>9}{'efficiency':>12}")
+    base = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in args.workers:
+            output = os.path.join(tmp, f'{workers}.jsonl')
+            started = time.perf_counter()
+            run_sweep([settings], ['random:0.02'], range(args.games), output, workers, args.chunk_size)
+            rate = args.games / (time.perf_counter() - started)
+            base = base or rate
+            print(f"{workers:>8}{rate:>10.1f}{rate / base:>9.2f}{rate / base / workers:>12.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,6 +9,26 @@ from .player import Player
 from .obstacle import Obstacle
 from .game_manager import GameManager
 from .sprite_loader import SpriteLoader
+from .sprite_cache import SpriteCache
+from .asset_manifest import AssetManifest, AssetEntry
+from .texture_atlas import TextureAtlas
+from .asset_cache import DiskAssetCache
+from .asset_loader import ParallelAssetLoader
+from .dirty_renderer import DirtyRectRenderer
+from .text_cache import TextCache
+from .fixed_step import FixedTimestep
+from .collision import swept_aabb, swept_collides
+from .obstacle_array import ObstacleArray
+from .obstacle_pool import ObstaclePool
+from .scenery import Cloud
+from .simulation import Simulation
+from .replay import Replay, ReplayRecorder, ReplayPlayer
+from .batch_env import BatchEnv
+from .sweep import run_sweep, SweepStats
+from .game_state import GameState
+from .autopilot import Autopilot
+from .snapshot import GameSnapshot, SnapshotHistory
+from .spawn_schedule import SpawnSchedule
 from .sound_manager import SoundManager
 
 __all__ = [
@@ -17,6 +37,32 @@ __all__ = [
     'Obstacle',
     'GameManager',
     'SpriteLoader',
+    'SpriteCache',
+    'AssetManifest',
+    'AssetEntry',
+    'TextureAtlas',
+    'DiskAssetCache',
+    'ParallelAssetLoader',
+    'DirtyRectRenderer',
+    'TextCache',
+    'FixedTimestep',
+    'swept_aabb',
+    'swept_collides',
+    'ObstacleArray',
+    'ObstaclePool',
+    'Cloud',
+    'Simulation',
+    'Replay',
+    'ReplayRecorder',
+    'ReplayPlayer',
+    'BatchEnv',
+    'run_sweep',
+    'SweepStats',
+    'GameState',
+    'Autopilot',
+    'GameSnapshot',
+    'SnapshotHistory',
+    'SpawnSchedule',
     'SoundManager'
 ]
 
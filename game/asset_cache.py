@@ -0,0 +1,263 @@
+"""Модуль asset_cache - дисковый кэш подготовленных ресурсов.
+
+Содержит класс DiskAssetCache, который сохраняет на диск уже декодированные
+и отмасштабированные пиксели картинок и декодированный PCM звуков.
+При следующем запуске игра читает готовые байты вместо декодирования
+PNG и MP3. Запись кэша считается устаревшей, если у исходного файла
+изменились время модификации и содержимое (хэш).
+"""
+
+import hashlib
+import os
+import struct
+import pygame
+
+
+class DiskAssetCache:
+    """Кэш готовых к использованию пикселей и PCM-звука на диске.
+
+    Формат файла картинки: заголовок IMAGE_HEADER и сырые байты RGB/RGBA.
+    Формат файла звука: заголовок SOUND_HEADER и сырые сэмплы в формате микшера.
+
+    Attributes:
+        cache_dir (str): Папка с файлами кэша.
+        hits (int): Количество ресурсов, прочитанных из кэша.
+        misses (int): Количество ресурсов, которых не было в кэше или они устарели.
+    """
+
+    VERSION = 1
+    IMAGE_MAGIC = b'MRIM'
+    SOUND_MAGIC = b'MRSN'
+    # магия, версия, есть ли альфа, ширина, высота, mtime источника, размер источника, sha1 источника
+    IMAGE_HEADER = struct.Struct('<4sBBIIqq20s')
+    # магия, версия, частота, формат сэмпла, каналы, mtime источника, размер источника, sha1 источника
+    SOUND_HEADER = struct.Struct('<4sBihBqq20s')
+    SOURCE_INFO = struct.Struct('<qq20s')     # общий хвост заголовков: mtime, размер, sha1 источника
+
+    active = None   # включенный кэш процесса, им пользуются SpriteLoader и SoundManager
+
+    def __init__(self, cache_dir=None):
+        """Инициализация кэша.
+
+        Args:
+            cache_dir (str, optional): Папка для файлов кэша.
+                По умолчанию .asset_cache в корне проекта.
+        """
+        if cache_dir is None:
+            project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            cache_dir = os.path.join(project_dir, '.asset_cache')
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def enable(cache_dir=None):
+        """Включает дисковый кэш для всего процесса.
+
+        Args:
+            cache_dir (str, optional): Папка для файлов кэша.
+
+        Returns:
+            DiskAssetCache: Включенный кэш.
+        """
+        DiskAssetCache.active = DiskAssetCache(cache_dir)
+        return DiskAssetCache.active
+
+    enable = staticmethod(enable)
+
+    def disable():
+        """Выключает дисковый кэш - ресурсы снова декодируются из исходных файлов."""
+        DiskAssetCache.active = None
+
+    disable = staticmethod(disable)
+
+    def _entry_path(self, source, params, extension):
+        """Строит путь к файлу кэша для ресурса.
+
+        Args:
+            source (str): Путь к исходному файлу.
+            params (tuple): Параметры подготовки (например, размер).
+            extension (str): Расширение файла кэша.
+
+        Returns:
+            str: Путь к файлу в папке кэша.
+        """
+        name = hashlib.sha1(f'{os.path.abspath(source)}|{params}'.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, name + extension)
+
+    def _file_digest(path):
+        """Считает sha1 содержимого файла.
+
+        Args:
+            path (str): Путь к файлу.
+
+        Returns:
+            bytes: 20 байт хэша.
+        """
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).digest()
+
+    _file_digest = staticmethod(_file_digest)
+
+    def _is_fresh(self, source, mtime, size, digest):
+        """Проверяет, что запись кэша соответствует исходному файлу.
+
+        Сначала сравниваются mtime и размер (один stat). Если mtime
+        поменялся (например, после git checkout), сравнивается хэш содержимого.
+
+        Returns:
+            int: Текущий mtime источника в наносекундах, если запись актуальна, иначе None.
+        """
+        stat = os.stat(source)
+        if stat.st_size != size:
+            return None
+        if stat.st_mtime_ns == mtime or DiskAssetCache._file_digest(source) == digest:
+            return stat.st_mtime_ns
+        return None
+
+    def _update_mtime(self, entry_path, header, mtime):
+        """Записывает в заголовок записи новый mtime источника.
+
+        Вызывается, когда mtime изменился, а содержимое нет: следующий
+        запуск снова обойдется одним stat, без хэширования файла.
+        """
+        offset = header.size - self.SOURCE_INFO.size       # mtime, размер и sha1 - в конце заголовка
+        try:
+            with open(entry_path, 'r+b') as f:
+                f.seek(offset)
+                f.write(struct.pack('<q', mtime))
+        except OSError:
+            pass    # не обновили - в следующий раз просто снова посчитаем хэш
+
+    def _read(self, entry_path, header, magic, source):
+        """Читает файл кэша и проверяет его заголовок.
+
+        Returns:
+            tuple: (поля заголовка, данные) или None, если записи нет или она устарела.
+        """
+        try:
+            with open(entry_path, 'rb') as f:
+                data = f.read()
+            fields = header.unpack_from(data)
+            if fields[0] != magic or fields[1] != self.VERSION:
+                return None
+            mtime = self._is_fresh(source, fields[-3], fields[-2], fields[-1])
+            if mtime is None:
+                return None
+            if mtime != fields[-3]:
+                self._update_mtime(entry_path, header, mtime)
+        except (OSError, struct.error):
+            return None
+        return fields, memoryview(data)[header.size:]
+
+    def _write(self, entry_path, header_bytes, payload):
+        """Атомарно записывает файл кэша (через временный файл)."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = entry_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(header_bytes)
+                f.write(payload)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            pass    # кэш - только ускорение, ошибка записи не должна мешать игре
+
+    def _source_info(source):
+        """Возвращает mtime, размер и хэш исходного файла.
+
+        Returns:
+            tuple: (mtime в наносекундах, размер в байтах, sha1).
+        """
+        stat = os.stat(source)
+        return stat.st_mtime_ns, stat.st_size, DiskAssetCache._file_digest(source)
+
+    _source_info = staticmethod(_source_info)
+
+    def read_image(self, source, width=None, height=None):
+        """Читает готовые пиксели картинки из кэша.
+
+        Args:
+            source (str): Путь к исходной картинке.
+            width (int, optional): Ширина, к которой картинка была отмасштабирована.
+            height (int, optional): Высота, к которой картинка была отмасштабирована.
+
+        Returns:
+            pygame.Surface: Несконвертированная поверхность или None при промахе.
+        """
+        result = self._read(self._entry_path(source, (width, height), '.img'),
+                            self.IMAGE_HEADER, self.IMAGE_MAGIC, source)
+        if result is None:
+            self.misses += 1
+            return None
+
+        fields, pixels = result
+        has_alpha, size = fields[2], (fields[3], fields[4])
+        self.hits += 1
+        return pygame.image.frombuffer(pixels, size, 'RGBA' if has_alpha else 'RGB')
+
+    def write_image(self, source, width, height, sprite):
+        """Сохраняет готовые пиксели картинки в кэш.
+
+        Args:
+            source (str): Путь к исходной картинке.
+            width (int): Ширина, к которой картинка была отмасштабирована (или None).
+            height (int): Высота, к которой картинка была отмасштабирована (или None).
+            sprite (pygame.Surface): Подготовленная поверхность.
+        """
+        has_alpha = bool(sprite.get_flags() & pygame.SRCALPHA)
+        pixels = pygame.image.tobytes(sprite, 'RGBA' if has_alpha else 'RGB')
+        header = self.IMAGE_HEADER.pack(self.IMAGE_MAGIC, self.VERSION, has_alpha,
+                                         sprite.get_width(), sprite.get_height(),
+                                         *DiskAssetCache._source_info(source))
+        self._write(self._entry_path(source, (width, height), '.img'), header, pixels)
+
+    def read_sound(self, source):
+        """Читает декодированный PCM звука из кэша.
+
+        Запись подходит, только если микшер открыт с теми же частотой,
+        форматом сэмпла и количеством каналов, с которыми она сохранялась.
+
+        Args:
+            source (str): Путь к исходному звуковому файлу.
+
+        Returns:
+            pygame.mixer.Sound: Звук или None при промахе.
+        """
+        mixer = pygame.mixer.get_init()
+        result = None
+        if mixer:
+            result = self._read(self._entry_path(source, mixer, '.pcm'),
+                                self.SOUND_HEADER, self.SOUND_MAGIC, source)
+        if result is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return pygame.mixer.Sound(buffer=result[1])
+
+    def write_sound(self, source, sound):
+        """Сохраняет декодированный PCM звука в кэш.
+
+        Args:
+            source (str): Путь к исходному звуковому файлу.
+            sound (pygame.mixer.Sound): Загруженный звук.
+        """
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            return
+        header = self.SOUND_HEADER.pack(self.SOUND_MAGIC, self.VERSION, *mixer,
+                                         *DiskAssetCache._source_info(source))
+        self._write(self._entry_path(source, mixer, '.pcm'), header, sound.get_raw())
+
+    def clear(self):
+        """Удаляет все файлы кэша.
+
+        Returns:
+            int: Количество удаленных файлов.
+        """
+        removed = 0
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(('.img', '.pcm', '.tmp')):
+                    os.remove(os.path.join(self.cache_dir, name))
+                    removed += 1
+        return removed
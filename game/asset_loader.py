@@ -0,0 +1,158 @@
+"""Модуль asset_loader - параллельная загрузка ресурсов с экраном загрузки.
+
+Содержит класс ParallelAssetLoader. Декодирование картинок и звуков
+выполняется в пуле рабочих потоков (pygame отпускает GIL на время
+декодирования), а в главном потоке остается только то, что требует окна:
+convert()/convert_alpha() и масштабирование. Пока идет загрузка, главный
+поток рисует простой экран с полосой прогресса.
+"""
+
+import os
+import time
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from .sprite_loader import SpriteLoader
+from .sprite_cache import SpriteCache
+from .sound_manager import SoundManager
+
+
+class ParallelAssetLoader:
+    """Загрузчик ресурсов, декодирующий файлы в пуле потоков.
+
+    Attributes:
+        sprite_requests (list): Список (путь, ширина, высота) спрайтов для загрузки.
+        sound_paths (list): Список путей к звукам для загрузки.
+        workers (int): Количество рабочих потоков.
+        loaded (int): Сколько ресурсов уже полностью готово.
+        total (int): Сколько ресурсов нужно загрузить.
+        errors (list): Пары (путь, исключение) для файлов, которые не удалось загрузить.
+        elapsed (float): Время загрузки в секундах (после завершения).
+    """
+
+    def __init__(self, sprite_requests, sound_paths=(), workers=None):
+        """Инициализация загрузчика.
+
+        Args:
+            sprite_requests (list): Список кортежей (путь, ширина, высота).
+            sound_paths (list, optional): Список путей к звуковым файлам.
+            workers (int, optional): Количество потоков. По умолчанию по числу ядер (не больше 8).
+        """
+        # одинаковые запросы (например, один файл у разных объектов) загружаем один раз
+        self.sprite_requests = list(dict.fromkeys(sprite_requests))
+        self.sound_paths = list(dict.fromkeys(sound_paths))
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self.loaded = 0
+        self.total = len(self.sprite_requests) + len(self.sound_paths)
+        self.errors = []
+        self.elapsed = 0.0
+        self._pending = []
+        self._executor = None
+        self._started = 0.0
+
+    def start(self):
+        """Отправляет все файлы на декодирование в пул потоков."""
+        self._started = time.perf_counter()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='asset-loader')
+
+        for path, width, height in self.sprite_requests:
+            future = self._executor.submit(SpriteLoader.read_sprite, path, width, height)
+            self._pending.append(('sprite', (path, width, height), future))
+
+        sound_manager = SoundManager()
+        for path in self.sound_paths:
+            future = self._executor.submit(sound_manager.load_sound, path)
+            self._pending.append(('sound', path, future))
+
+    def poll(self):
+        """Доделывает в главном потоке все уже декодированные ресурсы.
+
+        Returns:
+            bool: True если загрузка завершена.
+        """
+        still_pending = []
+        for kind, request, future in self._pending:
+            if not future.done():
+                still_pending.append((kind, request, future))
+                continue
+            try:
+                self._finish(kind, request, future.result())
+            except Exception as error:      # битый файл не должен останавливать загрузку остальных
+                self.errors.append((request, error))
+            self.loaded += 1
+        self._pending = still_pending
+
+        if self.done() and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self.elapsed = time.perf_counter() - self._started
+        return self.done()
+
+    def _finish(self, kind, request, result):
+        """Кладет готовый ресурс в общий кэш.
+
+        Args:
+            kind (str): 'sprite' или 'sound'.
+            request: Запрос (путь, ширина, высота) для спрайта или путь для звука.
+            result: Результат рабочего потока.
+        """
+        if kind == 'sprite':
+            path, width, height = request
+            raw, prepared = result
+            sprite = SpriteLoader.finish_sprite(raw, path, width, height, prepared)  # convert() только в главном потоке
+            SpriteLoader.cache.put(SpriteCache.make_key(path, width, height), sprite)
+        else:
+            SoundManager.sound_cache[os.path.abspath(request)] = result
+
+    def done(self):
+        """Проверяет, все ли ресурсы загружены.
+
+        Returns:
+            bool: True если загрузка завершена.
+        """
+        return self.loaded >= self.total
+
+    def progress(self):
+        """Возвращает долю загруженных ресурсов.
+
+        Returns:
+            float: Значение от 0.0 до 1.0.
+        """
+        return self.loaded / self.total if self.total else 1.0
+
+    def run(self, screen=None, on_frame=None):
+        """Загружает все ресурсы, рисуя экран загрузки, пока идет работа.
+
+        Args:
+            screen (pygame.Surface, optional): Окно для экрана загрузки.
+            on_frame (callable, optional): Вызывается каждый кадр (например, для обработки событий).
+
+        Returns:
+            float: Время загрузки в секундах.
+        """
+        self.start()
+        while not self.poll():
+            if screen is not None:
+                draw_loading_screen(screen, self.progress())
+                pygame.display.flip()
+            if on_frame is not None:
+                on_frame()
+            time.sleep(0.005)   # не крутим пустой цикл, пока потоки декодируют
+        return self.elapsed
+
+
+def draw_loading_screen(screen, progress):
+    """Рисует простой экран загрузки с полосой прогресса.
+
+    Args:
+        screen (pygame.Surface): Поверхность для отрисовки.
+        progress (float): Доля загруженных ресурсов от 0.0 до 1.0.
+    """
+    width, height = screen.get_size()
+    screen.fill((255, 200, 255))        # тот же розовый фон, что и в игре
+
+    bar = pygame.Rect(0, 0, width // 2, 30)
+    bar.center = (width // 2, height // 2)
+    pygame.draw.rect(screen, (220, 140, 190), bar, 3)      # рамка полосы
+    filled = bar.inflate(-10, -10)
+    filled.width = int(filled.width * max(0.0, min(1.0, progress)))
+    pygame.draw.rect(screen, (200, 100, 150), filled)      # заполненная часть
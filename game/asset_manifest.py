@@ -0,0 +1,315 @@
+"""Модуль asset_manifest - манифест игровых ресурсов.
+
+Содержит классы AssetEntry и AssetManifest. Манифест один раз при запуске
+просматривает папку assets (или читает сгенерированный файл manifest.json)
+и хранит в памяти список файлов по категориям, размеры картинок и готовые
+спрайты препятствий. После этого создание препятствия - это случайный
+выбор из таблицы в памяти, без обращений к файловой системе.
+"""
+
+import json
+import os
+import random
+import struct
+import sys
+from .sprite_loader import SpriteLoader
+
+
+class AssetEntry:
+    """Описание одного файла ресурса.
+
+    Attributes:
+        name (str): Имя файла, например "bone1.png".
+        path (str): Полный путь к файлу.
+        width (int): Ширина картинки в пикселях (None для не-картинок).
+        height (int): Высота картинки в пикселях (None для не-картинок).
+        kind (str): Вид препятствия: 'flying' или 'ground' (None для остальных файлов).
+        mtime (int): Время изменения файла в наносекундах на момент сканирования.
+        size (int): Размер файла в байтах на момент сканирования.
+        sprite (pygame.Surface): Заранее загруженный спрайт (None, пока не загружен).
+    """
+
+    def __init__(self, name, path, width=None, height=None, kind=None, mtime=None, size=None):
+        """Инициализация записи манифеста.
+
+        Args:
+            name (str): Имя файла.
+            path (str): Полный путь к файлу.
+            width (int, optional): Ширина картинки.
+            height (int, optional): Высота картинки.
+            kind (str, optional): Вид препятствия 'flying' или 'ground'.
+            mtime (int, optional): Время изменения файла в наносекундах.
+            size (int, optional): Размер файла в байтах.
+        """
+        self.name = name
+        self.path = path
+        self.width = width
+        self.height = height
+        self.kind = kind
+        self.mtime = mtime
+        self.size = size
+        self.sprite = None
+
+    def get_sprite(self):
+        """Возвращает спрайт записи, загружая его при первом обращении.
+
+        Returns:
+            pygame.Surface: Спрайт в исходном размере.
+        """
+        if self.sprite is None:
+            self.sprite = SpriteLoader.load_sprite(self.path)
+        return self.sprite
+
+    def is_fresh(self):
+        """Проверяет, что файл не меняли после сканирования.
+
+        Перезапись файла на месте не меняет время изменения папки, поэтому
+        каждый файл сверяется отдельно - по mtime и размеру, как в DiskAssetCache.
+
+        Returns:
+            bool: True если mtime и размер файла совпадают с записанными.
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:     # файл удалили
+            return False
+        return stat.st_mtime_ns == self.mtime and stat.st_size == self.size
+
+    def to_dict(self):
+        """Возвращает описание записи для сохранения в manifest.json.
+
+        Returns:
+            dict: Имя, размеры, вид, mtime и размер файла записи.
+        """
+        return {'name': self.name, 'width': self.width, 'height': self.height, 'kind': self.kind,
+                'mtime': self.mtime, 'size': self.size}
+
+
+class AssetManifest:
+    """Манифест ресурсов игры, построенный один раз при запуске.
+
+    Attributes:
+        assets_path (str): Путь к папке assets.
+        categories (dict): Категория (имя подпапки) -> список AssetEntry.
+        obstacles (dict): 'ground' и 'flying' -> список AssetEntry препятствий.
+    """
+
+    MANIFEST_FILE = 'manifest.json'     # имя сгенерированного файла манифеста в папке assets
+    VERSION = 2                         # версия формата manifest.json (2 - mtime и размер каждого файла)
+    IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+    FLYING_FILES = ('bird.png',)        # файлы летающих препятствий, остальные - наземные
+
+    _shared = None      # общий манифест процесса, создается при первом обращении
+
+    def __init__(self, assets_path=None):
+        """Инициализация пустого манифеста.
+
+        Args:
+            assets_path (str, optional): Путь к папке assets.
+                По умолчанию SpriteLoader.get_assets_path().
+        """
+        self.assets_path = assets_path or SpriteLoader.get_assets_path()
+        self.categories = {}
+        self.obstacles = {'ground': [], 'flying': []}
+
+    def shared():
+        """Возвращает общий манифест процесса, создавая его при первом вызове.
+
+        Returns:
+            AssetManifest: Манифест, загруженный из manifest.json или сканированием.
+        """
+        if AssetManifest._shared is None:
+            manifest = AssetManifest()
+            if not manifest.load():     # нет актуального manifest.json - сканируем папку
+                manifest.scan()
+            AssetManifest._shared = manifest
+        return AssetManifest._shared
+
+    shared = staticmethod(shared)
+
+    def reset_shared():
+        """Сбрасывает общий манифест (например, после изменения файлов ресурсов)."""
+        AssetManifest._shared = None
+
+    reset_shared = staticmethod(reset_shared)
+
+    def read_image_size(path):
+        """Читает размеры картинки без декодирования пикселей.
+
+        Для PNG размеры берутся из заголовка IHDR (первые 24 байта файла),
+        для других форматов картинка загружается целиком.
+
+        Args:
+            path (str): Путь к файлу изображения.
+
+        Returns:
+            tuple: (ширина, высота) или (None, None), если прочитать не удалось.
+        """
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(24)
+            if header[:8] == b'\x89PNG\r\n\x1a\n' and header[12:16] == b'IHDR':
+                return struct.unpack('>II', header[16:24])   # ширина и высота - big-endian uint32
+
+            import pygame
+            return pygame.image.load(path).get_size()
+        except Exception:
+            return None, None
+
+    read_image_size = staticmethod(read_image_size)
+
+    def scan(self):
+        """Один раз просматривает все подпапки assets и заполняет манифест."""
+        self.categories = {}
+        if not os.path.isdir(self.assets_path):
+            self._index_obstacles()
+            return
+
+        with os.scandir(self.assets_path) as folders:
+            for folder in folders:
+                if not folder.is_dir():
+                    continue
+                entries = []
+                with os.scandir(folder.path) as files:
+                    for file in files:
+                        if not file.is_file():
+                            continue
+                        stat = file.stat()
+                        entry = AssetEntry(file.name, file.path, mtime=stat.st_mtime_ns, size=stat.st_size)
+                        if file.name.lower().endswith(self.IMAGE_EXTENSIONS):
+                            entry.width, entry.height = AssetManifest.read_image_size(file.path)
+                        if folder.name == 'obstacles':
+                            entry.kind = 'flying' if file.name.lower() in self.FLYING_FILES else 'ground'
+                        entries.append(entry)
+                entries.sort(key=lambda e: e.name)      # порядок не зависит от файловой системы
+                self.categories[folder.name] = entries
+
+        self._index_obstacles()
+
+    def _index_obstacles(self):
+        """Раскладывает картинки препятствий по видам 'ground' и 'flying'."""
+        self.obstacles = {'ground': [], 'flying': []}
+        for entry in self.categories.get('obstacles', []):
+            if entry.kind in self.obstacles and entry.width:
+                self.obstacles[entry.kind].append(entry)
+
+    def _folder_mtimes(self):
+        """Возвращает время изменения каждой подпапки assets.
+
+        Returns:
+            dict: Имя подпапки -> время изменения в наносекундах.
+        """
+        return {name: os.stat(os.path.join(self.assets_path, name)).st_mtime_ns
+                for name in self.categories}
+
+    def write(self, path=None):
+        """Сохраняет манифест в файл.
+
+        Args:
+            path (str, optional): Путь к файлу. По умолчанию assets/manifest.json.
+
+        Returns:
+            str: Путь к записанному файлу.
+        """
+        path = path or os.path.join(self.assets_path, self.MANIFEST_FILE)
+        data = {
+            'version': self.VERSION,
+            'mtimes': self._folder_mtimes(),
+            'categories': {name: [entry.to_dict() for entry in entries]
+                           for name, entries in self.categories.items()}
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        return path
+
+    def load(self, path=None):
+        """Загружает манифест из файла, если он существует и не устарел.
+
+        Манифест считается устаревшим, если изменилось время модификации
+        любой из подпапок assets (файл добавили, удалили или переименовали)
+        или mtime либо размер любого файла (его перезаписали на месте).
+
+        Args:
+            path (str, optional): Путь к файлу. По умолчанию assets/manifest.json.
+
+        Returns:
+            bool: True если манифест загружен из файла, иначе False.
+        """
+        path = path or os.path.join(self.assets_path, self.MANIFEST_FILE)
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if data.get('version') != self.VERSION:
+            return False
+
+        self.categories = {}
+        for name, entries in data.get('categories', {}).items():
+            folder = os.path.join(self.assets_path, name)
+            self.categories[name] = [
+                AssetEntry(e['name'], os.path.join(folder, e['name']), e.get('width'), e.get('height'), e.get('kind'),
+                           e.get('mtime'), e.get('size'))
+                for e in entries
+            ]
+
+        try:
+            if self._folder_mtimes() != data.get('mtimes'):
+                return False
+        except OSError:     # одну из папок удалили
+            return False
+        if not all(entry.is_fresh() for entries in self.categories.values() for entry in entries):
+            return False
+
+        self._index_obstacles()
+        return True
+
+    def preload(self):
+        """Заранее загружает спрайты всех препятствий (без окна - в формате файла, только для масок)."""
+        for entries in self.obstacles.values():
+            for entry in entries:
+                entry.get_sprite()
+
+    def refresh_sprites(self):
+        """Заново берет спрайты препятствий из кэша (например, после построения атласа)."""
+        for entries in self.obstacles.values():
+            for entry in entries:
+                entry.sprite = None
+        self.preload()
+
+    def files(self, category):
+        """Возвращает записи одной категории.
+
+        Args:
+            category (str): Имя подпапки assets, например "sounds".
+
+        Returns:
+            list: Список AssetEntry (пустой, если категории нет).
+        """
+        return self.categories.get(category, [])
+
+    def random_obstacle(self, flying, rng=random):
+        """Выбирает случайный вариант препятствия за O(1).
+
+        Если летающих вариантов нет, выбирается наземный.
+
+        Args:
+            flying (bool): Нужно ли летающее препятствие.
+            rng (random.Random, optional): Генератор случайных чисел.
+
+        Returns:
+            AssetEntry: Выбранный вариант или None, если препятствий нет вовсе.
+        """
+        if flying and self.obstacles['flying']:
+            return rng.choice(self.obstacles['flying'])
+        if self.obstacles['ground']:
+            return rng.choice(self.obstacles['ground'])
+        return None
+
+
+if __name__ == '__main__':
+    # python -m game.asset_manifest [путь] - генерирует manifest.json заранее
+    manifest = AssetManifest()
+    manifest.scan()
+    print(f"Манифест записан: {manifest.write(sys.argv[1] if len(sys.argv) > 1 else None)}")
@@ -0,0 +1,189 @@
+"""Модуль autopilot - встроенный бот, который прыгает сам.
+
+Содержит класс Autopilot. В точках решения он снимает с игры
+GameState и перебирает варианты будущего на horizon секунд вперед по
+тем же правилам, что и GameManager.update: "прыгнуть сейчас" и "ждать",
+а внутри каждого варианта - моменты следующих прыжков. Поиск идет в
+глубину: общая часть вариантов просчитывается один раз, а в каждой
+точке ветвления состояние копируется через GameState.fork(). Вариант
+заканчивается, как только все известные препятствия позади, а поиск -
+как только найден вариант, доживающий до горизонта без потери жизни.
+
+Решения принимаются на сетке в decision_step шагов, но если ни "прыгнуть
+сейчас", ни "ждать" не спасают, бот проверяет и прыжки между точками
+сетки и выполняет найденный прыжок точно в свой шаг. Сетка начинается
+заново с приземления, чтобы первый возможный прыжок не ждал точки сетки.
+
+Поиск ограничен числом шагов прогноза на решение (max_steps) и, если
+задано, временем (time_budget), чтобы решение укладывалось в кадр. Предел
+шагов не зависит от машины - с ним игры Simulation повторяются; предел
+времени - для игры в окне.
+"""
+
+import time
+
+from .game_state import GameState
+
+
+class Autopilot:
+    """Бот с поиском по прогнозу игры.
+
+    Attributes:
+        step_dt (float): Длина шага прогноза - как шаг симуляции игры.
+        horizon_ticks (int): На сколько шагов вперед смотрит поиск.
+        decision_step (int): Через сколько шагов бот заново решает, прыгать ли.
+        max_jumps (int): Сколько прыжков подряд перебирается внутри одного варианта.
+        max_branches (int): Наибольшее число ветвлений на одно решение.
+        max_steps (int): Сколько шагов прогноза можно сделать на одно решение.
+        time_budget (float): Сколько секунд можно искать на одно решение (None - без предела).
+        branches (int): Сколько ветвлений сделало последнее решение.
+        steps (int): Сколько шагов прогноза сделало последнее решение.
+        jump_tick (int): Шаг игры, на котором назначен прыжок между точками сетки (None - не назначен).
+        grid_tick (int): Шаг, от которого отсчитывается сетка решений - первый шаг после приземления.
+        total_branches (int): Сколько ветвлений сделано всего.
+        decisions (int): Сколько раз выполнялся поиск.
+    """
+
+    def __init__(self, horizon=1.5, tick_rate=120, decision_step=4, max_jumps=2, max_branches=400,
+                 max_steps=1500, time_budget=None):
+        """Инициализация бота.
+
+        Args:
+            horizon (float, optional): Глубина прогноза в секундах. По умолчанию 1.5 -
+                чуть больше одного прыжка.
+            tick_rate (int, optional): Шагов симуляции в секунду. По умолчанию 120.
+            decision_step (int, optional): Шагов между решениями. По умолчанию 4.
+            max_jumps (int, optional): Прыжков в одном варианте. По умолчанию 2.
+            max_branches (int, optional): Предел ветвлений на решение. По умолчанию 400.
+            max_steps (int, optional): Предел шагов прогноза на решение. Новые ветвления
+                после него не начинаются, а начатые варианты досчитываются, поэтому
+                решение стоит не больше max_steps + (max_jumps + 1) * horizon шагов.
+                По умолчанию 1500 - порядка 10 мс при 3-7 мкс на шаг. Чтобы решение
+                точно укладывалось в кадр, задайте и time_budget.
+            time_budget (float, optional): Предел времени поиска на решение в секундах.
+                После него не начинаются ветвления, а начатые варианты обрываются
+                (засчитываются только прожитые шаги). Решения тогда зависят от
+                скорости машины. По умолчанию None - без предела.
+        """
+        self.step_dt = 1.0 / tick_rate
+        self.horizon_ticks = round(horizon * tick_rate)
+        self.decision_step = decision_step
+        self.max_jumps = max_jumps
+        self.max_branches = max_branches
+        self.max_steps = max_steps
+        self.time_budget = time_budget
+        self.deadline = None
+        self.branches = 0
+        self.steps = 0
+        self.jump_tick = None
+        self.grid_tick = None
+        self.total_branches = 0
+        self.decisions = 0
+
+    def decide(self, game):
+        """Решает, прыгать ли перед следующим шагом игры.
+
+        Args:
+            game (GameManager): Игра.
+
+        Returns:
+            bool: True если нужно прыгнуть сейчас.
+        """
+        player = game.player
+        if game.is_idle() or player.is_jumping or player.invulnerable:
+            self.grid_tick = None
+            return False  #прыжок все равно не сработает
+        if game.tick == self.jump_tick:
+            self.jump_tick = None
+            return True   #прыжок между точками сетки, найденный прошлым решением
+        if self.grid_tick is None:
+            self.grid_tick = game.tick    #сетка начинается с первого шага, когда прыжок снова возможен
+        if (game.tick - self.grid_tick) % self.decision_step:
+            return False  #решения принимаются только на сетке шагов, как ветвления в поиске
+
+        state = GameState.capture(game)
+        self.branches = 0
+        self.steps = 0
+        self.jump_tick = None
+        self.deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        self.decisions += 1
+        best = self._search(state.fork(), False, self.max_jumps, self.horizon_ticks)
+        best_delay = None   #None - ждать, 0 - прыгнуть сейчас, иначе прыгнуть через столько шагов
+        if best < self.horizon_ticks:
+            jump = self._search(state.fork(), True, self.max_jumps - 1, self.horizon_ticks)
+            if jump > best:
+                best, best_delay = jump, 0
+        for delay in range(1, self.decision_step):
+            #нужный прыжок может быть между точками сетки: ожидание его не найдет,
+            #а следующее решение будет уже поздно
+            if best >= self.horizon_ticks or self.out_of_budget():
+                break
+            lives = state.lives
+            state.step(self.step_dt)
+            self.steps += 1
+            if state.lives < lives or state.game_over or not state.can_jump():
+                break
+            jump = delay + self._search(state.fork(), True, self.max_jumps - 1, self.horizon_ticks - delay)
+            if jump > best:
+                best, best_delay = jump, delay
+        self.total_branches += self.branches
+        if best_delay:
+            self.jump_tick = game.tick + best_delay
+        return best_delay == 0
+
+    def out_of_budget(self):
+        """Проверяет, исчерпан ли предел шагов или времени текущего решения.
+
+        Returns:
+            bool: True если новые ветвления начинать нельзя.
+        """
+        if self.steps >= self.max_steps:
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def controller(self, game, tick):
+        """Контроллер для Simulation.run.
+
+        Args:
+            game (GameManager): Игра.
+            tick (int): Номер шага (не используется - решение берется по game.tick).
+
+        Returns:
+            bool: True если нужно прыгнуть.
+        """
+        return self.decide(game)
+
+    def _search(self, state, jump, jumps_left, horizon):
+        """Лучший исход варианта: прыжок сейчас или нет, дальше - лучшие моменты прыжков.
+
+        Args:
+            state (GameState): Состояние (изменяется).
+            jump (bool): Прыгнуть на первом шаге.
+            jumps_left (int): Сколько еще прыжков можно перебрать внутри варианта.
+            horizon (int): Сколько шагов осталось до горизонта.
+
+        Returns:
+            int: Сколько шагов игрок проживет без потери жизни (horizon - дожил до горизонта).
+        """
+        self.branches += 1
+        lives = state.lives
+        best = 0
+        state.step(self.step_dt, jump)
+        self.steps += 1
+        for ticks in range(1, horizon + 1):
+            if state.lives < lives or state.game_over:
+                return max(best, ticks - 1)
+            if ticks == horizon or state.is_clear():
+                return horizon      #дожил до горизонта или все известные препятствия позади
+            if self.deadline is not None and ticks % 16 == 0 and time.perf_counter() >= self.deadline:
+                return max(best, ticks)     #время вышло: дальше вариант не известен, считаем только прожитое
+            if (jumps_left and ticks % self.decision_step == 0 and state.can_jump()
+                    and self.branches < self.max_branches and not self.out_of_budget()):
+                #ветвление: прыжок здесь считается в копии, ожидание - дальше в этом же состоянии
+                outcome = ticks + self._search(state.fork(), True, jumps_left - 1, horizon - ticks)
+                if outcome >= horizon:
+                    return horizon
+                best = max(best, outcome)
+            state.step(self.step_dt)
+            self.steps += 1
+        return horizon
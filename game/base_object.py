@@ -6,6 +6,7 @@
 
 import pygame
 from .sprite_loader import SpriteLoader
+from .collision import masks_collide
 
 
 class BaseObject:
@@ -29,8 +30,19 @@ class BaseObject:
         current_animation (str): Имя текущей анимации (например, "бег").
         animation_frame (int): Индекс текущего кадра анимации.
         animation_timer (float): Таймер для смены кадров анимации.
+        pos_x (float): Точная координата X (с долями пикселя).
+        pos_y (float): Точная координата Y (с долями пикселя).
+        prev_x (float): Координата X на прошлом шаге симуляции.
+        prev_y (float): Координата Y на прошлом шаге симуляции.
     """
 
+    # атрибуты хранятся в слотах, а не в словаре __dict__ каждого объекта:
+    # объект меньше в памяти, а чтение и запись атрибутов в цикле шага быстрее
+    __slots__ = ('rect', 'color', 'width', 'height', 'sprite', 'sprites', 'current_animation',
+                 'animation_frame', 'animation_timer', 'pos_x', 'pos_y', 'prev_x', 'prev_y')
+
+    ANIMATION_FRAME_TIME = 0.15     # сколько секунд показывается один кадр анимации
+
     def __init__(self, x, y, width, height, color=(255, 255, 255)):
         """Инициализация базового объекта.
 
@@ -55,6 +67,11 @@ class BaseObject:
         self.animation_frame = 0  # индекс анмации "1"
         self.animation_timer = 0  # таймер для анимации
 
+        self.pos_x = float(x)  # точное (дробное) положение; rect - его округление для отрисовки и коллизий
+        self.pos_y = float(y)
+        self.prev_x = self.pos_x  # положение на прошлом шаге симуляции, для плавной отрисовки между шагами
+        self.prev_y = self.pos_y
+
     def load_sprite(self, sprite_path):
         """Загружает спрайт из файла.
 
@@ -91,7 +108,7 @@ class BaseObject:
         if self.current_animation and self.current_animation in self.sprites:
             self.animation_timer += dt
 
-            if self.animation_timer >= 0.15:  # если текущий кадр показывался уже 0.15 секунды или больше
+            if self.animation_timer >= self.ANIMATION_FRAME_TIME:  # если текущий кадр показывался уже 0.15 секунды или больше
                 self.animation_timer = 0
                 self.animation_frame = (self.animation_frame + 1) % len(self.sprites[self.current_animation])
                 # self.animation_frame + 1 - увеличивыем индекс кадра - берем следующий кадр
@@ -103,16 +120,79 @@ class BaseObject:
                 # (0 + 1) % 2 = 1 % 2 = 1
                 # ...
 
-    def draw(self, screen):  # screen - поверхность, где рисуются объекты
+    def get_frame(self):
+        """Возвращает поверхность, которая сейчас рисуется для объекта.
+
+        Returns:
+            pygame.Surface: Текущий кадр анимации, одиночный спрайт или None.
+        """
+        if self.current_animation and self.current_animation in self.sprites:
+            return self.sprites[self.current_animation][self.animation_frame]
+        return self.sprite
+
+    def sync_position(self):
+        """Подхватывает положение rect, если его изменили напрямую.
+
+        Сдвиг rect снаружи (rect.x = ..., rect.y = ...) считается телепортом:
+        точное положение становится равным rect.
+        """
+        if self.rect.x != round(self.pos_x) or self.rect.y != round(self.pos_y):
+            self.pos_x = float(self.rect.x)
+            self.pos_y = float(self.rect.y)
+
+    def set_position(self, x, y):
+        """Ставит объект в точку без интерполяции от старого положения.
+
+        Args:
+            x (float): Координата X левого верхнего угла.
+            y (float): Координата Y левого верхнего угла.
+        """
+        self.pos_x = self.prev_x = float(x)
+        self.pos_y = self.prev_y = float(y)
+        self.update_rect()
+
+    def update_rect(self):
+        """Один раз за шаг переносит точное положение в rect (с округлением)."""
+        self.rect.x = round(self.pos_x)  # то же округление, что и в sync_position
+        self.rect.y = round(self.pos_y)
+
+    def save_position(self):
+        """Запоминает текущее положение перед шагом симуляции."""
+        self.sync_position()
+        self.prev_x = self.pos_x
+        self.prev_y = self.pos_y
+
+    def render_rect(self, alpha=1.0):
+        """Возвращает прямоугольник для отрисовки между двумя шагами симуляции.
+
+        Args:
+            alpha (float, optional): 0.0 - положение на прошлом шаге, 1.0 - текущее.
+                По умолчанию 1.0.
+
+        Returns:
+            pygame.Rect: Прямоугольник в интерполированном положении.
+        """
+        if alpha >= 1.0:
+            return self.rect
+        x = self.prev_x + (self.pos_x - self.prev_x) * alpha
+        y = self.prev_y + (self.pos_y - self.prev_y) * alpha
+        return pygame.Rect(round(x), round(y), self.rect.width, self.rect.height)
+
+    def draw(self, screen, alpha=1.0):  # screen - поверхность, где рисуются объекты
         """Отрисовывает объект на экране.
 
         Args:
             screen (pygame.Surface): Поверхность, где рисуются объекты.
+            alpha (float, optional): Доля шага симуляции для интерполяции положения.
+                По умолчанию 1.0 (текущее положение).
+
+        Returns:
+            pygame.Rect: Область экрана, которую изменила отрисовка (None, если рисовать нечего).
         """
         if self.current_animation and self.current_animation in self.sprites:  # проверка есть ли анимация, и есть ли она в словаре
             frames = self.sprites[
                 self.current_animation]  # получаем список кадров frames = self.sprites["run"]  # = [кадр0, кадр1]
-            screen.blit(frames[self.animation_frame], self.rect)
+            return screen.blit(frames[self.animation_frame], self.render_rect(alpha))
             # bit - рисует одну картинку на другой
             # рисует текущий кадр в self.rect
             # self.rect.x, self.rect.y = координаты
@@ -120,17 +200,54 @@ class BaseObject:
             # frames[0]
 
         elif self.sprite:  # если у нас один спрайт, то рисуем его
-            screen.blit(self.sprite, self.rect)
+            return screen.blit(self.sprite, self.render_rect(alpha))
+        return None
+
+    def get_mask(self):
+        """Возвращает маску столкновений текущего кадра.
+
+        Маска берется из SpriteLoader.cache и строится один раз на кадр анимации.
+
+        Returns:
+            pygame.mask.Mask: Маска кадра или None, если у объекта нет спрайта.
+        """
+        frame = self.get_frame()
+        if frame is None or frame.get_size() != self.rect.size:
+            return None  # нет картинки или она не совпадает с прямоугольником - считаем по прямоугольнику
+        return SpriteLoader.cache.mask_for(frame)
 
     def collides_with(self, other):
-        """Проверка столкновения с другим объектом colliderect.
+        """Проверка столкновения с другим объектом.
+
+        Сначала дешевая проверка прямоугольников colliderect, и только если
+        они пересекаются - попиксельная проверка по маскам кадров.
+        Объект без спрайта считается сплошным прямоугольником.
+
         Args:
             other (BaseObject): Другой объект для проверки столкновения.
         Returns:
             bool: True если объекты пересекаются, False если нет.
         """
-        return self.rect.colliderect(other.rect)
-        # self.rect - текущий объект сталкивается с другим other.rect
+        return self.collides_at(self.rect, other, other.rect)
+
+    def collides_at(self, rect, other, other_rect):
+        """Проверка столкновения, если бы объекты стояли в заданных местах.
+
+        Нужна для проверки промежуточных положений во время шага
+        (см. модуль collision).
+
+        Args:
+            rect (pygame.Rect): Положение этого объекта.
+            other (BaseObject): Другой объект.
+            other_rect (pygame.Rect): Положение другого объекта.
+
+        Returns:
+            bool: True если объекты в этих положениях пересекаются.
+        """
+        if not rect.colliderect(other_rect):
+            return False  # прямоугольники не пересекаются - маски не нужны
+        # rect - текущий объект сталкивается с другим other_rect
+        return masks_collide(rect, self.get_mask(), other_rect, other.get_mask())
 
     def update(self, dt):  # вызывает родительский метод update_animation для создания дочерних методов
         """Обновляет состояние объекта.
@@ -0,0 +1,440 @@
+"""Модуль batch_env - пакет независимых игр для обучения ботов.
+
+Содержит класс BatchEnv: N игр Moti Runner, которые продвигаются одним
+вызовом step(actions). Состояние всех игр хранится в массивах NumPy
+(по строке на игру, препятствия - в таблице N x max_obstacles), поэтому
+стоимость шага растет с N как у векторных операций, а не как у количества
+объектов Python.
+
+Правила не копируются, а берутся у самой игры:
+- физика прыжка, размеры и кадры анимации - у Player, смена кадров -
+  BaseObject.ANIMATION_FRAME_TIME;
+- появление препятствий - Obstacle.random_spawn и AssetManifest.random_obstacle
+  (препятствие появляется раз в секунду с лишним, поэтому вызов Python на
+  каждое появление почти ничего не стоит);
+- начальный интервал, ускорение и неуязвимость - константы GameManager;
+- столкновения - как ObstacleArray.collisions: swept AABB прямоугольников
+  сразу для всех ячеек, затем для немногих кандидатов sweep_test по маске
+  текущего кадра игрока и маске спрайта препятствия (без спрайта -
+  сплошной прямоугольник), как swept_collides в GameManager.update.
+
+У каждой игры свой random.Random (его зерно берется из
+numpy.random.Generator(seed)), поэтому пакет с одним зерном повторяется,
+но не повторяет игры GameManager с тем же зерном: там тот же генератор
+тратится еще и на облака.
+"""
+
+import random
+import pygame
+from .asset_manifest import AssetManifest
+from .base_object import BaseObject
+from .collision import masks_collide, sweep_test
+from .game_manager import GameManager
+from .obstacle import Obstacle
+from .obstacle_array import np, slab_intervals
+from .player import Player
+from .sprite_loader import SpriteLoader
+
+
+class BatchEnv:
+    """N независимых игр с интерфейсом reset / step(actions) в стиле gym.
+
+    Attributes:
+        num_envs (int): Количество игр.
+        observation_size (int): Длина вектора наблюдения одной игры.
+        player_y (numpy.ndarray): Координата Y игрока в каждой игре.
+        velocity_y (numpy.ndarray): Вертикальная скорость игрока.
+        animation (numpy.ndarray): Номер анимации игрока в animations (-1 - без анимации).
+        animation_frame (numpy.ndarray): Кадр анимации игрока.
+        score (numpy.ndarray): Счет.
+        lives (numpy.ndarray): Жизни.
+        game_speed (numpy.ndarray): Текущая скорость игры.
+        ticks (numpy.ndarray): Шагов с начала текущего эпизода.
+        alive (numpy.ndarray): Таблица N x max_obstacles: занята ли ячейка препятствием.
+        geometry (numpy.ndarray): N x max_obstacles x len(GEOMETRY) - размер, летает ли и маска препятствия.
+        rngs (list): Генераторы случайных чисел игр (random.Random).
+        episodes (int): Сколько эпизодов завершено всего.
+        dropped_spawns (int): Сколько препятствий не появилось, потому что таблица была полна.
+        exact_checks (int): Сколько пар игрок-препятствие проверено по маскам.
+    """
+
+    # наблюдение: игрок, затем NEAREST ближайших препятствий впереди (dx - от правого края игрока)
+    PLAYER_FIELDS = ('height', 'velocity_y', 'jumping', 'invulnerable', 'game_speed')
+    OBSTACLE_FIELDS = ('dx', 'y', 'width', 'height', 'flying')
+    NEAREST = 2
+
+    # геометрия препятствия: размер, летает ли (как Obstacle.is_flying), номер маски в masks (-1 - прямоугольник)
+    GEOMETRY = ('width', 'height', 'flying', 'mask')
+
+    def __init__(self, num_envs, width=1200, height=800, speed=400, tick_rate=120, lives=3,
+                 max_obstacles=8, max_ticks=None, seed=None):
+        """Инициализация пакета игр.
+
+        Args:
+            num_envs (int): Количество одновременных игр.
+            width (int, optional): Ширина игрового поля. По умолчанию 1200.
+            height (int, optional): Высота игрового поля. По умолчанию 800.
+            speed (int, optional): Начальная скорость. По умолчанию 400.
+            tick_rate (int, optional): Шагов в секунду игрового времени. По умолчанию 120.
+            lives (int, optional): Жизней в начале эпизода. По умолчанию 3.
+            max_obstacles (int, optional): Ячеек под препятствия в каждой игре. По умолчанию 8
+                (на экране одновременно бывает не больше 4-5).
+            max_ticks (int, optional): Длина эпизода в шагах, после которой он обрывается.
+                None - эпизод идет до Game Over.
+            seed (int, optional): Зерно генератора случайных чисел.
+
+        Raises:
+            ImportError: Если NumPy не установлен.
+        """
+        if np is None:
+            raise ImportError("Для BatchEnv нужен NumPy (pip install numpy)")
+
+        self.num_envs = num_envs
+        self.screen_width = width
+        self.ground_y = height - GameManager.GROUND_MARGIN
+        self.initial_speed = speed
+        self.initial_lives = lives
+        self.dt = 1.0 / tick_rate
+        self.max_obstacles = max_obstacles
+        self.max_ticks = max_ticks
+        self.obstacle_interval_start = GameManager.OBSTACLE_INTERVAL
+        self.speed_increase_interval = GameManager.SPEED_INCREASE_INTERVAL
+        self.manifest = AssetManifest.shared()
+        self.episodes = 0
+        self.dropped_spawns = 0
+        self.exact_checks = 0
+
+        # физика, размеры и кадры берутся у настоящего игрока, чтобы не расходиться с Player
+        player = Player(100, self.ground_y)
+        self.player_x = player.rect.x
+        self.player_width = player.rect.width
+        self.player_height = player.rect.height
+        self.gravity = player.gravity
+        self.jump_force = player.jump_force
+        self._load_player_masks(player)
+
+        # маски спрайтов препятствий: вариант манифеста -> номер в masks
+        self.masks = []
+        self.variant_masks = {}
+
+        self.observation_size = len(self.PLAYER_FIELDS) + self.NEAREST * len(self.OBSTACLE_FIELDS)
+
+        shape = (num_envs, max_obstacles)
+        self.player_y = np.zeros(num_envs)
+        self.velocity_y = np.zeros(num_envs)
+        self.jumping = np.zeros(num_envs, dtype=bool)
+        self.animation = np.zeros(num_envs, dtype=np.int64)
+        self.animation_frame = np.zeros(num_envs, dtype=np.int64)
+        self.animation_timer = np.zeros(num_envs)
+        self.invulnerable = np.zeros(num_envs, dtype=bool)
+        self.invulnerable_timer = np.zeros(num_envs)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.lives = np.zeros(num_envs, dtype=np.int64)
+        self.game_speed = np.zeros(num_envs)
+        self.obstacle_interval = np.zeros(num_envs)
+        self.obstacle_timer = np.zeros(num_envs)
+        self.ticks = np.zeros(num_envs, dtype=np.int64)
+
+        self.alive = np.zeros(shape, dtype=bool)
+        self.passed = np.zeros(shape, dtype=bool)
+        self.obstacle_x = np.zeros(shape)
+        self.obstacle_y = np.zeros(shape)
+        self.obstacle_speed = np.zeros(shape)
+        self.geometry = np.zeros(shape + (len(self.GEOMETRY),))
+        self.reset(seed)
+
+    def _load_player_masks(self, player):
+        """Запоминает маски кадров игрока по анимациям (как BaseObject.get_mask).
+
+        Args:
+            player (Player): Игрок, с которого берутся кадры.
+        """
+        size = player.rect.size
+        self.animations = [name for name, frames in player.sprites.items() if frames]
+        self.player_masks = [[SpriteLoader.cache.mask_for(frame) if frame.get_size() == size else None
+                              for frame in player.sprites[name]] for name in self.animations]
+        self.frame_counts = np.array([len(frames) for frames in self.player_masks] or [1], dtype=np.int64)
+        self.sprite_mask = None     # кадр без анимации - одиночный спрайт
+        if player.sprite is not None and player.sprite.get_size() == size:
+            self.sprite_mask = SpriteLoader.cache.mask_for(player.sprite)
+        self.run_animation = self.animations.index('run') if 'run' in self.animations else -1
+        self.jump_animation = self.animations.index('jump') if 'jump' in self.animations else -1
+
+    def _variant_mask(self, variant):
+        """Номер маски спрайта варианта препятствия (-1 - спрайта нет, прямоугольник).
+
+        Args:
+            variant (AssetEntry): Вариант из манифеста.
+
+        Returns:
+            int: Номер в masks.
+        """
+        index = self.variant_masks.get(id(variant))
+        if index is None:
+            sprite = variant.get_sprite()
+            index = -1
+            if sprite is not None and sprite.get_size() == (variant.width, variant.height):
+                self.masks.append(SpriteLoader.cache.mask_for(sprite))
+                index = len(self.masks) - 1
+            self.variant_masks[id(variant)] = index
+        return index
+
+    def reset(self, seed=None):
+        """Начинает новый эпизод во всех играх.
+
+        Args:
+            seed (int, optional): Новое зерно генераторов случайных чисел. None при
+                повторном вызове - генераторы продолжают свою последовательность.
+
+        Returns:
+            numpy.ndarray: Наблюдения размером num_envs x observation_size.
+        """
+        if seed is not None or not hasattr(self, 'rngs'):
+            seeds = np.random.default_rng(seed).integers(2 ** 63, size=self.num_envs)
+            self.rngs = [random.Random(int(value)) for value in seeds]
+        self._reset_envs(np.arange(self.num_envs))
+        return self.observe()
+
+    def _reset_envs(self, envs):
+        """Возвращает выбранные игры к началу (как GameManager.__init__)."""
+        self.player_y[envs] = self.ground_y
+        self.velocity_y[envs] = 0.0
+        self.jumping[envs] = False
+        self.animation[envs] = self.run_animation       # Player.__init__ включает анимацию бега
+        self.animation_frame[envs] = 0
+        self.animation_timer[envs] = 0.0
+        self.invulnerable[envs] = False
+        self.invulnerable_timer[envs] = 0.0
+        self.score[envs] = 0
+        self.lives[envs] = self.initial_lives
+        self.game_speed[envs] = self.initial_speed
+        self.obstacle_interval[envs] = self.obstacle_interval_start
+        self.obstacle_timer[envs] = 0.0
+        self.ticks[envs] = 0
+        self.alive[envs] = False
+        self.passed[envs] = False
+
+    def _set_animation(self, envs, index):
+        """Смена анимации - как BaseObject.set_animation (кадр и таймер сбрасываются)."""
+        if index >= 0:
+            self.animation[envs] = index
+            self.animation_frame[envs] = 0
+            self.animation_timer[envs] = 0.0
+
+    def step(self, actions):
+        """Выполняет один шаг во всех играх.
+
+        Закончившиеся игры сразу начинаются заново (как в векторных средах gym):
+        наблюдение для них - первое наблюдение нового эпизода, а итог
+        закончившегося эпизода - в info.
+
+        Args:
+            actions (array-like): Прыгать ли в каждой игре (0/1 или bool), длина num_envs.
+
+        Returns:
+            tuple: (observations, rewards, dones, info):
+                observations - массив num_envs x observation_size;
+                rewards - +1 за пройденное препятствие, -1 за потерянную жизнь;
+                dones - закончился ли эпизод на этом шаге;
+                info - словарь с массивами 'score', 'ticks' (итог эпизода для закончившихся игр)
+                и 'truncated' (эпизод оборван по max_ticks).
+        """
+        dt = self.dt
+        actions = np.asarray(actions, dtype=bool)
+
+        # прыжок - как Player.jump: не в прыжке и не неуязвим
+        jump = actions & ~self.jumping & ~self.invulnerable
+        self.velocity_y[jump] = self.jump_force
+        self.jumping |= jump
+        self._set_animation(jump, self.jump_animation)
+
+        self.ticks += 1
+        prev_y = self.player_y.copy()
+        prev_x = self.obstacle_x.copy()
+
+        # физика игрока - как Player.update
+        self.velocity_y += self.gravity * dt
+        self.player_y += self.velocity_y * dt
+        landed = self.player_y >= self.ground_y
+        self.player_y[landed] = self.ground_y
+        self.velocity_y[landed] = 0.0
+        self.jumping[landed] = False
+        self._set_animation(landed & (self.animation != self.run_animation), self.run_animation)
+
+        # смена кадра - как BaseObject.update_animation
+        animated = self.animation >= 0
+        self.animation_timer[animated] += dt
+        turn = animated & (self.animation_timer >= BaseObject.ANIMATION_FRAME_TIME)
+        self.animation_timer[turn] = 0.0
+        self.animation_frame[turn] = (self.animation_frame[turn] + 1) % self.frame_counts[self.animation[turn]]
+
+        # появление препятствий по таймеру
+        self.obstacle_timer += dt
+        spawning = np.nonzero(self.obstacle_timer >= self.obstacle_interval)[0]
+        if len(spawning):
+            self._spawn(spawning, prev_x)
+            self.obstacle_timer[spawning] = 0.0
+
+        # движение всех препятствий одной операцией
+        self.obstacle_x -= self.obstacle_speed * dt
+
+        hits = self._swept_hits(prev_x, prev_y)
+        self.alive &= ~hits
+        lives_before = self.lives.copy()
+        self.lives = np.maximum(self.lives - hits.sum(axis=1), 0)
+        lost = lives_before - self.lives
+        over = self.lives <= 0
+        hurt = (lost > 0) & ~over
+        self.invulnerable[hurt] = True      # как GameManager.hit_obstacle
+        self.invulnerable_timer[hurt] = GameManager.INVULNERABLE_TIME
+
+        # очки за пройденные препятствия и ускорение каждые speed_increase_interval очков
+        rounded_x = np.rint(self.obstacle_x)
+        width = self.geometry[..., 0]
+        newly = self.alive & ~self.passed & (rounded_x + width < self.player_x) & ~over[:, None]
+        self.passed |= newly
+        points = newly.sum(axis=1)
+        steps_up = (self.score + points) // self.speed_increase_interval - self.score // self.speed_increase_interval
+        self.score += points
+        self.game_speed += GameManager.SPEED_STEP * steps_up
+        self.obstacle_interval = np.maximum(GameManager.MIN_OBSTACLE_INTERVAL,
+                                            self.obstacle_interval - GameManager.INTERVAL_STEP * steps_up)
+
+        # препятствия за левым краем экрана освобождают ячейки
+        self.alive &= ~(rounded_x < -width)
+
+        # неуязвимость - как Player.update_invulnerability (после Game Over не обновляется)
+        timed = self.invulnerable & ~over
+        self.invulnerable_timer[timed] -= dt
+        self.invulnerable[timed & (self.invulnerable_timer <= 0)] = False
+
+        rewards = (points - lost).astype(np.float32)
+        truncated = np.zeros(self.num_envs, dtype=bool) if self.max_ticks is None else (self.ticks >= self.max_ticks) & ~over
+        dones = over | truncated
+        info = {'score': self.score.copy(), 'ticks': self.ticks.copy(), 'truncated': truncated}
+
+        finished = np.nonzero(dones)[0]
+        if len(finished):
+            self.episodes += len(finished)
+            self._reset_envs(finished)
+        return self.observe(), rewards, dones, info
+
+    def _spawn(self, envs, prev_x):
+        """Создает по препятствию в играх envs - как Obstacle.create_random.
+
+        Параметры выбирают Obstacle.random_spawn и AssetManifest.random_obstacle
+        генератором этой игры; размер и "летает ли" берутся у варианта, как
+        в Obstacle.load_obstacle_sprite.
+
+        Args:
+            envs (numpy.ndarray): Номера игр.
+            prev_x (numpy.ndarray): X препятствий в начале шага - у нового препятствия
+                это точка появления (изменяется).
+        """
+        for env in envs.tolist():
+            rng = self.rngs[env]
+            x, y, width, height, _, obstacle_type = Obstacle.random_spawn(self.screen_width, self.ground_y, rng)
+            variant = self.manifest.random_obstacle(obstacle_type == 'bird', rng)
+            flying, mask = False, -1        # без картинки Obstacle.is_flying остается False
+            if variant is not None:
+                width, height = variant.width, variant.height
+                flying = variant.kind == 'flying'
+                mask = self._variant_mask(variant)
+
+            free = np.nonzero(~self.alive[env])[0]
+            if not len(free):
+                self.dropped_spawns += 1
+                continue
+            slot = free[0]
+            self.alive[env, slot] = True
+            self.passed[env, slot] = False
+            self.obstacle_x[env, slot] = prev_x[env, slot] = x
+            self.obstacle_y[env, slot] = y
+            self.obstacle_speed[env, slot] = self.game_speed[env]
+            self.geometry[env, slot] = (width, height, flying, mask)
+
+    def _player_mask(self, env):
+        """Маска текущего кадра игрока в игре env - как BaseObject.get_mask."""
+        animation = self.animation[env]
+        if animation < 0:
+            return self.sprite_mask
+        return self.player_masks[animation][self.animation_frame[env]]
+
+    def _swept_hits(self, prev_x, prev_y):
+        """Столкновения за весь шаг для всех ячеек - как ObstacleArray.collisions.
+
+        Сначала swept AABB прямоугольников (с запасом в пиксель на округление)
+        сразу для всех ячеек, затем для кандидатов - sweep_test по маскам, как
+        swept_collides: препятствие без маски - сплошной прямоугольник.
+
+        Args:
+            prev_x (numpy.ndarray): X препятствий в начале шага.
+            prev_y (numpy.ndarray): Y игрока в начале шага.
+
+        Returns:
+            numpy.ndarray: Таблица N x max_obstacles - было ли касание.
+        """
+        start_top = np.rint(prev_y)
+        end_top = np.rint(self.player_y)
+        width, height = self.geometry[..., 0], self.geometry[..., 1]
+        margin = 1
+
+        # препятствие движется относительно игрока, стоящего в начальном положении
+        move_x = self.obstacle_x - prev_x
+        move_y = np.broadcast_to(-(end_top - start_top)[:, None], move_x.shape)
+        enter_x, exit_x = slab_intervals(move_x, prev_x - margin, prev_x + width + margin,
+                                         self.player_x, self.player_x + self.player_width)
+        enter_y, exit_y = slab_intervals(move_y, self.obstacle_y - margin, self.obstacle_y + height + margin,
+                                         start_top[:, None], start_top[:, None] + self.player_height)
+        enter = np.maximum(np.maximum(enter_x, enter_y), 0.0)
+        exit_ = np.minimum(np.minimum(exit_x, exit_y), 1.0)
+        candidates = self.alive & (enter < exit_)
+
+        hits = np.zeros_like(candidates)
+        for env, slot in zip(*np.nonzero(candidates)):
+            self.exact_checks += 1
+            w, h, _, mask = self.geometry[env, slot]
+            w, h, y = int(w), int(h), int(self.obstacle_y[env, slot])
+            player_mask = self._player_mask(env)
+            obstacle_mask = self.masks[int(mask)] if mask >= 0 else None
+            test = lambda a, b: a.colliderect(b) and masks_collide(a, player_mask, b, obstacle_mask)
+            hits[env, slot] = sweep_test(
+                test,
+                pygame.Rect(self.player_x, int(start_top[env]), self.player_width, self.player_height),
+                pygame.Rect(self.player_x, int(end_top[env]), self.player_width, self.player_height),
+                pygame.Rect(round(prev_x[env, slot]), y, w, h),
+                pygame.Rect(round(self.obstacle_x[env, slot]), y, w, h))
+        return hits
+
+    def observe(self):
+        """Возвращает наблюдения всех игр.
+
+        Returns:
+            numpy.ndarray: float32, num_envs x observation_size. Поля - PLAYER_FIELDS,
+            затем OBSTACLE_FIELDS для NEAREST ближайших препятствий впереди игрока
+            (если препятствия нет: dx - ширина поля, остальное 0).
+        """
+        obs = np.zeros((self.num_envs, self.observation_size), dtype=np.float32)
+        obs[:, 0] = self.ground_y - self.player_y
+        obs[:, 1] = self.velocity_y
+        obs[:, 2] = self.jumping
+        obs[:, 3] = self.invulnerable
+        obs[:, 4] = self.game_speed
+
+        width, height, flying = self.geometry[..., 0], self.geometry[..., 1], self.geometry[..., 2]
+        ahead = self.alive & (self.obstacle_x + width >= self.player_x)
+        order = np.argsort(np.where(ahead, self.obstacle_x, np.inf), axis=1)[:, :self.NEAREST]
+
+        rows = np.arange(self.num_envs)[:, None]
+        present = ahead[rows, order]
+        dx = self.obstacle_x[rows, order] - (self.player_x + self.player_width)
+        fields = (np.where(present, dx, self.screen_width),
+                  np.where(present, self.obstacle_y[rows, order], 0.0),
+                  np.where(present, width[rows, order], 0.0),
+                  np.where(present, height[rows, order], 0.0),
+                  np.where(present, flying[rows, order], 0.0))
+        start = len(self.PLAYER_FIELDS)
+        step = len(self.OBSTACLE_FIELDS)
+        for i, values in enumerate(fields):
+            obs[:, start + i:start + self.NEAREST * step:step] = values
+        return obs
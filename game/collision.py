@@ -0,0 +1,148 @@
+"""Модуль collision - непрерывная (swept) проверка столкновений.
+
+Обычная проверка collides_with смотрит только на положения в конце шага.
+На большой скорости или при долгом кадре препятствие может за один шаг
+перескочить через игрока целиком ("туннелирование"). Здесь проверяется
+весь отрезок движения за шаг: сначала дешевым swept AABB (метод разделяющих
+полос по относительному движению), и только если прямоугольники за шаг
+пересекались - попиксельно в нескольких точках внутри этого интервала.
+"""
+
+import math
+import pygame
+from .sprite_loader import SpriteLoader
+
+
+MASK_STEP = 4       # шаг в пикселях между проверками масок внутри интервала пересечения
+
+
+def swept_aabb(start_a, end_a, start_b, end_b):
+    """Находит, когда за шаг пересекаются два движущихся прямоугольника.
+
+    Оба объекта движутся равномерно от start к end. Задача сводится
+    к движению A относительно неподвижного B, и для каждой оси считается
+    интервал времени, когда проекции перекрываются.
+
+    Args:
+        start_a (pygame.Rect): Положение A в начале шага.
+        end_a (pygame.Rect): Положение A в конце шага.
+        start_b (pygame.Rect): Положение B в начале шага.
+        end_b (pygame.Rect): Положение B в конце шага.
+
+    Returns:
+        tuple: (t_enter, t_exit) - доли шага от 0.0 до 1.0, когда прямоугольники
+        пересекаются, или None, если за шаг они не пересекались.
+    """
+    # относительное смещение A за шаг (B считаем неподвижным в начальном положении)
+    move_x = (end_a.x - start_a.x) - (end_b.x - start_b.x)
+    move_y = (end_a.y - start_a.y) - (end_b.y - start_b.y)
+
+    t_enter, t_exit = 0.0, 1.0
+    for move, a_min, a_max, b_min, b_max in (
+            (move_x, start_a.left, start_a.right, start_b.left, start_b.right),
+            (move_y, start_a.top, start_a.bottom, start_b.top, start_b.bottom)):
+        if move == 0:
+            if a_max <= b_min or a_min >= b_max:
+                return None     # по этой оси не движемся и не перекрываемся - пересечения не будет
+            continue
+        t1 = (b_min - a_max) / move     # момент касания одной стороной
+        t2 = (b_max - a_min) / move     # момент выхода с другой стороны
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_enter = max(t_enter, t1)
+        t_exit = min(t_exit, t2)
+        if t_enter >= t_exit:
+            return None         # интервалы по осям не перекрываются (касание краями - не столкновение)
+    return t_enter, t_exit
+
+
+def lerp_rect(start, end, t):
+    """Возвращает прямоугольник в промежуточном положении.
+
+    Args:
+        start (pygame.Rect): Положение в начале шага.
+        end (pygame.Rect): Положение в конце шага.
+        t (float): Доля шага от 0.0 до 1.0.
+
+    Returns:
+        pygame.Rect: Прямоугольник размера end в точке между start и end.
+    """
+    return pygame.Rect(round(start.x + (end.x - start.x) * t),
+                       round(start.y + (end.y - start.y) * t),
+                       end.width, end.height)
+
+
+def masks_collide(rect, mask, other_rect, other_mask):
+    """Попиксельная проверка двух объектов, прямоугольники которых уже пересекаются.
+
+    Объект без маски (None) считается сплошным прямоугольником своего размера.
+
+    Args:
+        rect (pygame.Rect): Положение первого объекта.
+        mask (pygame.mask.Mask): Маска первого объекта или None.
+        other_rect (pygame.Rect): Положение второго объекта.
+        other_mask (pygame.mask.Mask): Маска второго объекта или None.
+
+    Returns:
+        bool: True если непрозрачные пиксели пересекаются.
+    """
+    if mask is None and other_mask is None:
+        return True  # у обоих нет картинки - достаточно прямоугольников
+
+    if mask is None:
+        mask = SpriteLoader.cache.rect_mask(rect.size)
+    if other_mask is None:
+        other_mask = SpriteLoader.cache.rect_mask(other_rect.size)
+    offset = (other_rect.x - rect.x, other_rect.y - rect.y)  # положение other относительно первого
+    return mask.overlap(other_mask, offset) is not None
+
+
+def swept_collides(obj, other):
+    """Проверяет, столкнулись ли объекты в любой момент последнего шага.
+
+    Начало шага - положение, сохраненное save_position() (prev_x, prev_y),
+    конец - текущий rect.
+
+    Args:
+        obj (BaseObject): Первый объект (обычно игрок).
+        other (BaseObject): Второй объект (обычно препятствие).
+
+    Returns:
+        bool: True если объекты пересекались хотя бы в одной точке шага.
+    """
+    return sweep_test(lambda rect, other_rect: obj.collides_at(rect, other, other_rect),
+                      obj.render_rect(0.0), obj.rect, other.render_rect(0.0), other.rect)
+
+
+def sweep_test(test, start_a, end_a, start_b, end_b):
+    """Проверяет точное столкновение на отрезке движения за шаг.
+
+    Args:
+        test (callable): Точная проверка test(rect_a, rect_b) для двух положений
+            (например, по маскам).
+        start_a (pygame.Rect): Положение A в начале шага.
+        end_a (pygame.Rect): Положение A в конце шага.
+        start_b (pygame.Rect): Положение B в начале шага.
+        end_b (pygame.Rect): Положение B в конце шага.
+
+    Returns:
+        bool: True если test сработал в конце шага или в одной из точек интервала пересечения.
+    """
+    if test(end_a, end_b):
+        return True     # пересекаются в конце шага - как обычная проверка
+
+    hit = swept_aabb(start_a, end_a, start_b, end_b)
+    if hit is None:
+        return False    # прямоугольники за шаг не встречались - маски не нужны
+
+    t_enter, t_exit = hit
+    move_x = (end_a.x - start_a.x) - (end_b.x - start_b.x)
+    move_y = (end_a.y - start_a.y) - (end_b.y - start_b.y)
+    distance = math.hypot(move_x, move_y) * (t_exit - t_enter)     # путь внутри интервала в пикселях
+    samples = max(1, math.ceil(distance / MASK_STEP))
+
+    for i in range(samples + 1):
+        t = t_enter + (t_exit - t_enter) * i / samples
+        if test(lerp_rect(start_a, end_a, t), lerp_rect(start_b, end_b, t)):
+            return True
+    return False
@@ -0,0 +1,122 @@
+"""Модуль dirty_renderer - отрисовка только изменившихся областей экрана.
+
+Содержит класс DirtyRectRenderer. Вместо перерисовки всего окна каждый кадр
+он восстанавливает фон только под прошлым положением подвижных объектов
+и HUD, рисует их на новом месте и передает в pygame.display.update()
+список измененных прямоугольников.
+"""
+
+import pygame
+
+
+class DirtyRectRenderer:
+    """Рендерер "грязных" прямоугольников для GameManager.
+
+    Смена размера окна и первый кадр рисуются целиком. Меню паузы и экран
+    Game Over показываются целиком один раз, а пока их собранный кадр
+    не меняется, экран не обновляется вовсе. Если суммарная площадь измененных областей
+    больше порога, кадр тоже считается полным (дешевле обновить весь экран).
+
+    Attributes:
+        game_manager (GameManager): Игра, которую нужно рисовать.
+        threshold (float): Доля площади экрана, после которой выгоднее полный flip.
+        full_frames (int): Количество кадров, показанных целиком.
+        partial_frames (int): Количество кадров, показанных по прямоугольникам.
+        last_dirty_area (int): Площадь измененных областей в последнем кадре.
+    """
+
+    def __init__(self, game_manager, threshold=0.4):
+        """Инициализация рендерера.
+
+        Args:
+            game_manager (GameManager): Игра, которую нужно рисовать.
+            threshold (float, optional): Доля площади экрана для перехода на полный flip.
+                По умолчанию 0.4.
+        """
+        self.game_manager = game_manager
+        self.threshold = threshold
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.last_dirty_area = 0
+        self._previous = None   # прямоугольники прошлого кадра (None - нужен полный кадр)
+        self._state = None      # (game_over, is_paused, размер окна) прошлого кадра
+        self._frozen = None     # собранный кадр паузы / Game Over, уже показанный на экране
+
+    def invalidate(self):
+        """Требует полной перерисовки в следующем кадре."""
+        self._previous = None
+        self._frozen = None
+
+    def render(self, screen):
+        """Рисует кадр.
+
+        Args:
+            screen (pygame.Surface): Поверхность окна.
+
+        Returns:
+            list: Измененные прямоугольники для pygame.display.update()
+            (пустой, если кадр не изменился) или None, если кадр нужно
+            показать целиком через pygame.display.flip().
+        """
+        game = self.game_manager
+        overlay = game.game_over or game.is_paused
+        state = (game.game_over, game.is_paused, screen.get_size())
+
+        if overlay:
+            # меню паузы и Game Over - один собранный кадр; если он не изменился, экран не трогаем
+            frame = game.get_frozen_frame(screen.get_size())
+            if frame is self._frozen and state == self._state:
+                self.last_dirty_area = 0
+                return []
+            self._frozen = frame
+        else:
+            self._frozen = None
+
+        if overlay or self._previous is None or state != self._state:
+            self._state = state
+            rects = game.draw(screen)
+            # под меню паузы и Game Over подвижных частей нет - следующий кадр снова полный
+            self._previous = None if overlay else self._visible(rects)
+            self.full_frames += 1
+            self.last_dirty_area = screen.get_width() * screen.get_height()
+            return None
+
+        # восстанавливаем фон там, где объекты были в прошлом кадре
+        layer = game.background_layer
+        for rect in self._previous:
+            screen.blit(layer, rect, rect)
+
+        current = self._visible(game.draw_dynamic(screen))
+        dirty = self._previous + current
+        self._previous = current
+
+        self.last_dirty_area = sum(rect.width * rect.height for rect in dirty)
+        if self.last_dirty_area > self.threshold * screen.get_width() * screen.get_height():
+            self.full_frames += 1
+            return None     # изменилось слишком много - дешевле показать весь экран
+
+        self.partial_frames += 1
+        return dirty
+
+    def _visible(self, rects):
+        """Отбрасывает пустые прямоугольники (объекты за краем экрана).
+
+        Args:
+            rects (list): Прямоугольники, которые вернул blit.
+
+        Returns:
+            list: Только прямоугольники с ненулевой площадью.
+        """
+        return [rect for rect in rects if rect.width and rect.height]
+
+
+def present(rects):
+    """Показывает нарисованный кадр на экране.
+
+    Args:
+        rects (list): Результат DirtyRectRenderer.render: список прямоугольников или None.
+    """
+    if rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
@@ -0,0 +1,66 @@
+"""Модуль fixed_step - фиксированный шаг симуляции.
+
+Содержит класс FixedTimestep - накопитель времени для главного цикла.
+Время кадра (любое: 30, 60 или 144 FPS) складывается в накопитель,
+а симуляция продвигается только целыми шагами одинаковой длины. Поэтому
+прыжок и движение препятствий не зависят от частоты кадров, а долгий
+кадр (подвисание окна) не превращается в огромный dt.
+"""
+
+
+class FixedTimestep:
+    """Накопитель времени для симуляции с фиксированным шагом.
+
+    Attributes:
+        tick_rate (int): Количество шагов симуляции в секунду.
+        step_dt (float): Длина одного шага в секундах.
+        max_frame_time (float): Максимальное время кадра, которое учитывается (секунды).
+        accumulator (float): Накопленное, но еще не просимулированное время.
+        alpha (float): Доля шага между двумя последними состояниями для интерполяции (0.0 - 1.0).
+        steps (int): Всего выполнено шагов.
+    """
+
+    EPSILON = 1e-9      # запас на ошибку округления float при сложении времени кадров
+
+    def __init__(self, tick_rate=120, max_frame_time=0.25):
+        """Инициализация накопителя.
+
+        Args:
+            tick_rate (int, optional): Шагов симуляции в секунду. По умолчанию 120.
+            max_frame_time (float, optional): Ограничение времени одного кадра в секундах.
+                По умолчанию 0.25 (не больше 30 шагов за кадр при 120 шагах в секунду).
+        """
+        if tick_rate <= 0:
+            raise ValueError("tick_rate должен быть больше нуля")
+        self.tick_rate = tick_rate
+        self.step_dt = 1.0 / tick_rate
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.steps = 0
+
+    def advance(self, frame_dt):
+        """Добавляет время кадра и возвращает, сколько шагов нужно просимулировать.
+
+        Args:
+            frame_dt (float): Реальное время, прошедшее с прошлого кадра, в секундах.
+
+        Returns:
+            int: Количество шагов длиной step_dt.
+        """
+        self.accumulator += min(max(frame_dt, 0.0), self.max_frame_time)   # подвисание не ускоряет игру
+
+        steps = 0
+        while self.accumulator >= self.step_dt - self.EPSILON:
+            self.accumulator -= self.step_dt
+            steps += 1
+
+        self.accumulator = max(self.accumulator, 0.0)
+        self.alpha = self.accumulator / self.step_dt    # насколько отрисовка "впереди" последнего шага
+        self.steps += steps
+        return steps
+
+    def reset(self):
+        """Сбрасывает накопленное время (например, после паузы)."""
+        self.accumulator = 0.0
+        self.alpha = 0.0
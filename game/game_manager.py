@@ -6,11 +6,18 @@
 
 import pygame
 from .player import Player
-from .obstacle import Obstacle
 from .sprite_loader import SpriteLoader
+from .asset_manifest import AssetManifest
 from .sound_manager import SoundManager
+from .text_cache import TextCache
+from .collision import swept_collides
+from .obstacle_array import ObstacleArray
+from .obstacle_pool import ObstaclePool
+from .spawn_schedule import SpawnSchedule
+from .scenery import Cloud
 import os
 import random
+import time
 from .database import save_score
 
 
@@ -22,32 +29,104 @@ class GameManager:
         screen_height (int): Высота игрового окна.
         ground_y (int): Координата Y уровня земли.
         background_sprites (dict): Загруженные фоновые спрайты.
+        background_layer (pygame.Surface): Заранее нарисованный статичный фон (заливка, горы, земля).
+        asset_manifest (AssetManifest): Манифест ресурсов с вариантами препятствий.
         sound_manager (SoundManager): Менеджер звуков.
         player (Player): Объект игрока.
         obstacles (list): Список активных препятствий.
-        clouds (list): Список облаков.
+        obstacle_pool (ObstaclePool): Пул переиспользуемых препятствий для списка obstacles.
+        obstacle_array (ObstacleArray): Препятствия в массивах NumPy (None - используется список obstacles).
+        spawn_schedule (SpawnSchedule): Очередь проходимых препятствий (None - случайные препятствия).
+        clouds (list): Список облаков (записи Cloud).
         score (int): Текущий счет игрока.
         lives (int): Количество жизней.
         game_speed (int): Текущая скорость игры.
         game_over (bool): Флаг завершения игры.
         is_paused (bool): Флаг паузы.
+        text_cache (TextCache): Кэш отрисованных надписей HUD и меню.
+        frozen_frame (pygame.Surface): Собранный кадр паузы или Game Over (None, пока игра идет).
+        render_alpha (float): Доля шага симуляции, на которую отрисовка интерполирует положения.
+        startup_time (float): Время создания менеджера с загрузкой ресурсов, в секундах.
+        headless (bool): Менеджер без окна, шрифтов и звука - только симуляция (см. Simulation).
+        seed (int): Зерно генератора случайных чисел этой игры.
+        rng (random.Random): Генератор случайных чисел игры (облака, препятствия, выбор спрайтов).
+        tick (int): Сколько шагов симуляции выполнено (не сбрасывается при рестарте - это время записи повтора).
+        recorder (ReplayRecorder): Запись нажатий для повтора (None - не записываем).
     """
 
-    def __init__(self, screen_width=1200, screen_height=800, initial_speed=400):
+    #имя спрайта -> (файл, ширина, высота); None - исходный размер картинки
+    BACKGROUND_SPRITES = {
+        'ground': ('ground.png', None, None),
+        'cloud': ('cloud.png', 150, 90),
+        'mountain': ('mountain.png', 300, 225)
+    }
+    UI_SPRITES = {
+        'heart': ('heart.png', 45, 45),
+        'game_over': ('game_over.png', 600, 150)
+    }
+    SEED_RANGE = 2 ** 32    # зерно хранится в повторах и снимках как uint32
+
+    #правила игры - их же читают GameState, SpawnSchedule и BatchEnv
+    GROUND_MARGIN = 100 #земля на 100 пикселей выше нижнего края окна
+    OBSTACLE_INTERVAL = 1.5 #секунд между препятствиями в начале игры
+    SPEED_INCREASE_INTERVAL = 5 #каждые 5 очков игра ускоряется
+    SPEED_STEP = 50 #на столько растет скорость
+    INTERVAL_STEP = 0.05 #на столько сокращается интервал между препятствиями
+    MIN_OBSTACLE_INTERVAL = 1.0 #но не меньше этого
+    INVULNERABLE_TIME = 1.0 #секунд неуязвимости после потери жизни
+
+    def __init__(self, screen_width=1200, screen_height=800, initial_speed=400, obstacle_backend='list',
+                 headless=False, seed=None, spawn_schedule=False):
+        """Инициализация менеджера игры.
+
+        Args:
+            screen_width (int, optional): Ширина окна. По умолчанию 1200.
+            screen_height (int, optional): Высота окна. По умолчанию 800.
+            initial_speed (int, optional): Начальная скорость игры. По умолчанию 400.
+            obstacle_backend (str, optional): 'list' - список объектов Obstacle,
+                'array' - массивы NumPy (ObstacleArray).
+            headless (bool, optional): Без окна, шрифтов, звука и музыки. Спрайты
+                загружаются только ради масок столкновений, поэтому результат игры
+                тот же, что и с окном, но рисовать такой менеджер не может.
+                По умолчанию False.
+            seed (int, optional): Зерно случайных чисел. Одно зерно и одни и те же нажатия
+                на тех же шагах дают одну и ту же игру. None - случайное зерно.
+                Приводится к диапазону 0..2**32-1 (seed % SEED_RANGE).
+            spawn_schedule (bool, optional): Брать препятствия из SpawnSchedule -
+                заранее рассчитанной очереди, где подряд не бывает непроходимых
+                препятствий. False - каждое препятствие выбирается случайно
+                в момент появления. По умолчанию False.
+        """
+
+        startup_started = time.perf_counter() #засекаем время загрузки ресурсов
 
         #сохраняем ширину экрана в атрибуте объекта
         self.screen_width = screen_width
         #высоту
         self.screen_height = screen_height
         #определяем высоту, если выота всего экрана=800, то ground_y находится выше=700
-        self.ground_y = screen_height - 100
+        self.ground_y = screen_height - self.GROUND_MARGIN
+        self.headless = headless #только симуляция: ничего не рисуем и не проигрываем
 
-        #згрузка фоновых спрайтов
-        self.background_sprites = self.load_background_sprites()
+        #свой генератор случайных чисел: игру можно повторить по зерну
+        #зерно вне 0..2**32-1 приводим по модулю: повтор и снимок записывают его как uint32
+        self.seed = seed % self.SEED_RANGE if seed is not None else random.randrange(self.SEED_RANGE)
+        self.rng = random.Random(self.seed)
+        self.tick = 0 #номер шага симуляции
+        self.recorder = None #запись нажатий (ReplayRecorder)
+
+        #згрузка фоновых спрайтов (без окна фон не нужен)
+        self.background_sprites = dict.fromkeys(self.BACKGROUND_SPRITES) if headless else self.load_background_sprites()
+        self.background_layer = None #статичный фон рисуется один раз при первой отрисовке
 
-        #инициализация звуковой системы
+        #манифест ресурсов: один раз сканируем assets и заранее загружаем спрайты препятствий
+        self.asset_manifest = AssetManifest.shared()
+        self.asset_manifest.preload()
+
+        #инициализация звуковой системы (без окна звуки не загружаются и play_sound ничего не делает)
         self.sound_manager = SoundManager()
-        self.sound_manager.preload()
+        if not headless:
+            self.sound_manager.preload()
 
         #создаем игрока
         self.player = Player(100, self.ground_y)
@@ -57,6 +136,17 @@ class GameManager:
 
         #игровые параметры
         self.obstacles = [] #список препятсвий
+        self.obstacle_pool = ObstaclePool() #ушедшие препятствия не выбрасываются, а используются снова
+        self.obstacle_array = None #массивы NumPy вместо списка (obstacle_backend='array')
+        if obstacle_backend == 'array':
+            if ObstacleArray.available():
+                self.obstacle_array = ObstacleArray()
+            else:
+                print("NumPy не установлен - препятствия хранятся списком")
+        self.spawn_schedule = None #очередь проходимых препятствий (spawn_schedule=True)
+        if spawn_schedule:
+            self.spawn_schedule = SpawnSchedule(self.seed, screen_width, self.ground_y, self.player,
+                                                threaded=not headless)
         self.clouds = [] #список облаков
         self.score = 0 #начальный счет игрока
         self.lives = 3  #жизни
@@ -65,18 +155,58 @@ class GameManager:
         self.is_paused = True #флаг паузы, игра на паузе
         self.obstacle_timer = 0 #таймер для генерации препятствий, время с последнего созданного препятствия
         self.cloud_timer = 0 #таймер для облаков
-        self.obstacle_interval = 1.5 #Каждые 1.5 секунды будет появляться новое препятствие
-        self.speed_increase_interval = 5 #каждые 5 набраных очков скорость будет увеличиваться
+        self.obstacle_interval = self.OBSTACLE_INTERVAL #Каждые 1.5 секунды будет появляться новое препятствие
+        self.speed_increase_interval = self.SPEED_INCREASE_INTERVAL #каждые 5 набраных очков скорость будет увеличиваться
+
+        #шрифты (без окна не нужны - pygame.font может быть не инициализирован)
+        self.font = None if headless else pygame.font.SysFont(None, 48) #обычный шрифт всего текста
+        self.big_font = None if headless else pygame.font.SysFont(None, 96) #шрифт для большого текста
+        self.text_cache = TextCache() #надписи растеризуются один раз, пока не изменится текст
 
-        #шрифты
-        self.font = pygame.font.SysFont(None, 48) #обычный шрифт всего текста
-        self.big_font = pygame.font.SysFont(None, 96) #шрифт для большого текста
+        #собранный кадр паузы / Game Over, чтобы не рисовать неподвижную сцену каждый кадр
+        self.frozen_frame = None
+        self.frozen_frame_key_value = None
+        self.frozen_frame_builds = 0 #сколько раз кадр собирался (для профилирования)
 
-        self.ui_sprites = self.load_ui_sprites() #загрузка UI спрайтов
+        #доля шага симуляции для отрисовки между двумя последними состояниями (1.0 - без интерполяции)
+        self.render_alpha = 1.0
 
+        if headless:
+            self.ui_sprites = dict.fromkeys(self.UI_SPRITES)
+        else:
+            self.ui_sprites = self.load_ui_sprites() #загрузка UI спрайтов
+            self.build_sprite_atlas() #упаковываем все загруженные спрайты в атлас текстур
+
+        #облака создаются и без окна: они берут случайные числа, и последовательность должна совпадать с игрой в окне
         self.create_initial_clouds() #создаем начальные облака
 
-        self.sound_manager.play_music() #запуск фоновой музыки
+        if not headless:
+            self.sound_manager.play_music() #запуск фоновой музыки
+
+        self.startup_time = time.perf_counter() - startup_started #сколько секунд заняла загрузка
+
+    def sprite_requests():
+        """Возвращает список всех спрайтов, которые нужны игре при запуске.
+
+        Используется для параллельной загрузки ресурсов до создания GameManager.
+
+        Returns:
+            list: Список кортежей (путь, ширина, высота).
+        """
+        assets_path = SpriteLoader.get_assets_path()
+        requests = []
+        for folder, table in (('background', GameManager.BACKGROUND_SPRITES), ('ui', GameManager.UI_SPRITES)):
+            for file_name, width, height in table.values():
+                requests.append((os.path.join(assets_path, folder, file_name), width, height))
+
+        requests.extend(Player.sprite_requests())
+
+        manifest = AssetManifest.shared()
+        for entries in manifest.obstacles.values():
+            requests.extend((entry.path, None, None) for entry in entries)
+        return requests
+
+    sprite_requests = staticmethod(sprite_requests)
 
     def load_background_sprites(self): #загрузка фоновых спрайтов
         """Загружает фоновые спрайты из папки assets/background.
@@ -93,18 +223,9 @@ class GameManager:
             'mountain': None #горы
         }
 
-        #ЗАГРУЖАЕМ ФАЙЛЫ В СЛОВАРЬ
-        #земля
-        ground_file = os.path.join(background_path, 'ground.png')
-        sprites['ground'] = SpriteLoader.load_sprite(ground_file)
-
-        #облако
-        cloud_file = os.path.join(background_path, 'cloud.png')
-        sprites['cloud'] = SpriteLoader.load_sprite(cloud_file, 150, 90)
-
-        #горы
-        mountain_file = os.path.join(background_path, 'mountain.png')
-        sprites['mountain'] = SpriteLoader.load_sprite(mountain_file, 300, 225)
+        #ЗАГРУЖАЕМ ФАЙЛЫ В СЛОВАРЬ: земля в исходном размере, облако 150x90, горы 300x225
+        for name, (file_name, width, height) in self.BACKGROUND_SPRITES.items():
+            sprites[name] = SpriteLoader.load_sprite(os.path.join(background_path, file_name), width, height)
 
         return sprites
 
@@ -122,38 +243,56 @@ class GameManager:
             'game_over': None, #сердце
         }
 
-        #сердечко для жизней
-        heart_file = os.path.join(ui_path, 'heart.png')
-        sprites['heart'] = SpriteLoader.load_sprite(heart_file, 45, 45)
-
-        #game Over
-        game_over_file = os.path.join(ui_path, 'game_over.png')
-        sprites['game_over'] = SpriteLoader.load_sprite(game_over_file, 600, 150)
+        #сердечко для жизней и надпись Game Over
+        for name, (file_name, width, height) in self.UI_SPRITES.items():
+            sprites[name] = SpriteLoader.load_sprite(os.path.join(ui_path, file_name), width, height)
 
         return sprites
 
+    def build_sprite_atlas(self):
+        """Упаковывает загруженные спрайты в атлас и обновляет ссылки на них.
+
+        После построения атласа фон, UI, игрок и препятствия рисуются
+        из подповерхностей нескольких больших страниц вместо отдельных картинок.
+        """
+        SpriteLoader.build_atlas()
+
+        #заново берем спрайты из кэша - теперь это области атласа
+        self.background_sprites = self.load_background_sprites()
+        self.background_layer = None #слой фона перерисуется из новых спрайтов
+        self.ui_sprites = self.load_ui_sprites()
+        self.player.load_player_sprites()
+        self.asset_manifest.refresh_sprites()
+
     def create_initial_clouds(self): #создание начальных облаков
         """Создает начальные облака со случайными параметрами."""
         for _ in range(5): #цикл 5 раз без переменной
-            x = random.randint(0, self.screen_width)
+            x = self.rng.randint(0, self.screen_width)
             #случайное расположение облаков от 0 до ширины экрана
             #сли screen_width=1200, x может быть любым
 
             #генерируем сучайную высоту и скорость
-            y = random.randint(50, 300)
-            speed = random.randint(30, 70)
+            y = self.rng.randint(50, 300)
+            speed = self.rng.randint(30, 70)
 
             #добавляем новое облако в список self.clouds
-            self.clouds.append({'x': x, 'y': y, 'speed': speed})
+            self.clouds.append(Cloud(x, y, speed))
 
-    def handle_events(self): #обработка событий
+    def handle_events(self, events=None): #обработка событий
         """Обрабатывает события игры.
 
+        Args:
+            events (list, optional): Уже полученные события (например, после pygame.event.wait).
+                По умолчанию берутся из очереди pygame.event.get().
+
         Returns:
             bool: False если нужно выйти из игры, иначе True.
         """
+        if events is None:
+            events = pygame.event.get()
+
         #йикл for, который проходит по ВСЕМ событиям в очереди событий pygame
-        for event in pygame.event.get():
+        for event in events:
 
             #если это событие закрытия окна QUIT
             if event.type == pygame.QUIT:
@@ -163,15 +302,14 @@ class GameManager:
             #если событие нажатие на клавиатуру KEYDOWN
             elif event.type == pygame.KEYDOWN:
 
-                #Если это ПРОБЕЛ, игра НЕ закончена (not self.game_over), игра НЕ на паузе (not self.is_paused)
-                if event.key == pygame.K_SPACE and not self.game_over and not self.is_paused:
-                    #воспроизводим звук прыжка
-                    self.sound_manager.play_sound('jump')
-                    #вызываем метод jump() для прыжка
-                    self.player.jump()
+                #Если это ПРОБЕЛ - прыжок
+                if event.key == pygame.K_SPACE:
+                    self.record_input('jump')
+                    self.jump()
 
                 #если нажата клавиша R (K_r) И игра закончена
                 elif event.key == pygame.K_r and self.game_over:
+                    self.record_input('restart')
                     #звук кнопки
                     self.sound_manager.play_sound('button')
                     #перезапускаем игру
@@ -185,11 +323,40 @@ class GameManager:
                 #если нажата клавиша P (K_p)
                 elif event.key == pygame.K_p:
                     #переключаем состояние паузы включить/выключить
+                    self.record_input('pause')
                     self.toggle_pause()
 
         #если ни одно из событий не привело к выходу из игры, возвращаем True, чтобы главный цикл продолжил работу
         return True
 
+    def record_input(self, action):
+        """Записывает нажатие в повтор, если запись включена.
+
+        Args:
+            action (str): 'jump', 'pause' или 'restart'.
+        """
+        if self.recorder is not None:
+            self.recorder.record(self.tick, action)
+
+    def jump(self):
+        """Прыжок игрока по команде (пробел или управление из Simulation).
+
+        Прыжок возможен, если игра НЕ закончена и НЕ на паузе.
+        """
+        if not self.game_over and not self.is_paused:
+            #воспроизводим звук прыжка
+            self.sound_manager.play_sound('jump')
+            #вызываем метод jump() для прыжка
+            self.player.jump()
+
+    def is_idle(self):
+        """Проверяет, стоит ли игра на месте (пауза или Game Over).
+
+        Returns:
+            bool: True если сцена неподвижна и ее не нужно обновлять каждый кадр.
+        """
+        return self.game_over or self.is_paused
+
     def toggle_pause(self): #включение/выключение паузы
         """Переключает состояние паузы игры."""
         self.is_paused = not self.is_paused #нажимаем клавишу P, вызывается toggle_pause():
@@ -201,13 +368,19 @@ class GameManager:
             print("Игра работает")
 
     def update(self, dt): #игра
-        """Обновляет состояние игры.
+        """Обновляет состояние игры на один шаг симуляции.
 
         Args:
-            dt (float): Время, прошедшее с прошлого кадра.
+            dt (float): Длина шага (при фиксированном шаге - FixedTimestep.step_dt).
         """
         if self.game_over or self.is_paused: #если на паузе или игрок умер, выходим из мтеода
             return
+        self.tick += 1 #шаги считаются только когда игра идет - по ним записываются нажатия
+
+        #запоминаем положения до шага - между ними интерполируется отрисовка
+        self.player.save_position()
+        for obstacle in self.obstacles:
+            obstacle.save_position()
 
         #вызываем игрока и пишем его время
         self.player.update(dt)
@@ -216,29 +389,77 @@ class GameManager:
         self.obstacle_timer += dt
 
         #если накопленое время превышает 1.5 интервал
-        if self.obstacle_timer >= self.obstacle_interval:
-             #добавляет новый объект в конце списка
-            self.obstacles.append(Obstacle.create_random(self.screen_width, self.ground_y, self.game_speed))
+        if self.obstacle_timer >= self.obstacle_interval and self.spawn_obstacle(): #добавляет новое препятствие
             self.obstacle_timer = 0 #сбрасывает таймер препятствия в 0, чтобы начать отсчет до следующего препятствия
 
         #обновляем препятствия
-        for obstacle in self.obstacles[:]: #копируем список для удаления препятсвий
-            obstacle.update(dt) #перпятсвие движется влево каждый кадр
+        if self.obstacle_array is not None:
+            self.update_obstacle_array(dt)
+        else:
+            self.update_obstacle_list(dt)
+        if self.game_over:
+            return
+
+        #обновляем игрока неуязвимость
+        self.player.update_invulnerability(dt)
+
+    def spawn_obstacle(self):
+        """Создает новое препятствие за правым краем экрана.
+
+        Returns:
+            bool: True если препятствие появилось. Препятствие из расписания
+            может ждать еще свой запас времени - тогда False.
+        """
+        if self.spawn_schedule is not None:
+            return self.spawn_scheduled_obstacle()
+        if self.obstacle_array is not None:
+            self.obstacle_array.spawn_random(self.screen_width, self.ground_y, self.game_speed, self.rng)
+        else:
+            #добавляет в конец списка препятствие из пула (новый объект создается только если пул пуст)
+            self.obstacles.append(self.obstacle_pool.acquire_random(self.screen_width, self.ground_y,
+                                                                    self.game_speed, self.rng))
+        return True
+
+    def spawn_scheduled_obstacle(self):
+        """Создает следующее препятствие из SpawnSchedule, если прошел его запас времени.
+
+        Returns:
+            bool: True если препятствие появилось.
+        """
+        spawn = self.spawn_schedule.peek(self)
+        if self.obstacle_timer < self.obstacle_interval + spawn.delay:
+            return False #проходимость этого препятствия требует паузы подольше
+        self.spawn_schedule.pop(self)
+        if self.obstacle_array is not None:
+            sprite = spawn.variant.get_sprite() if spawn.variant is not None else None
+            self.obstacle_array.add(spawn.x, spawn.y, spawn.width, spawn.height, self.game_speed, spawn.flying, sprite)
+        else:
+            self.obstacles.append(self.obstacle_pool.acquire(spawn.x, spawn.y, spawn.width, spawn.height,
+                                                             (255, 255, 255), self.game_speed,
+                                                             spawn.obstacle_type, self.rng, spawn.variant))
+        return True
+
+    def update_obstacle_list(self, dt):
+        """Двигает препятствия из списка, проверяет столкновения и начисляет очки.
 
-            if self.player.collides_with(obstacle): #если грок столкнулся с препятствием
-                self.sound_manager.play_sound('collision')
-                self.lives -= 1  #уменьшаем жизни
+        Список не копируется и из него ничего не удаляется по ходу обхода:
+        оставшиеся препятствия собираются в новый список за один проход,
+        а ушедшие возвращаются в пул obstacle_pool.
 
-                #удаляем препятствие при столкновении
-                self.obstacles.remove(obstacle)
+        Args:
+            dt (float): Длина шага симуляции.
+        """
+        survivors = [] #препятствия, которые остаются на следующий шаг
+        for index, obstacle in enumerate(self.obstacles):
+            obstacle.update(dt) #перпятсвие движется влево каждый кадр
 
-                if self.lives <= 0: #если 0 жиней
-                    self.game_over = True #заканчиваем игру
+            if swept_collides(self.player, obstacle): #если грок столкнулся с препятствием (в любой момент шага)
+                #препятствие при столкновении удаляется - в survivors не попадает
+                self.obstacle_pool.release(obstacle)
+                if self.hit_obstacle():
+                    self.obstacles = survivors + self.obstacles[index + 1:]
                     return
-                else:
-                    #игрок получает неуязвимость после потери жизни
-                    self.player.invulnerable = True #игрок не может получать урон
-                    self.player.invulnerable_timer = 1.0  #1 секунда неуязвимости
+                continue
 
             #увеличиваем счет, если прошли препятствие
 
@@ -248,71 +469,187 @@ class GameManager:
                 #obstacle.rect.x + obstacle.rect.width -  левая координата препятствия + ширина препятствия = правая координата препятствия
                 # < self.player.rect.x - левая координата игрока
                 obstacle.passed = True
-                self.score += 1
-                self.sound_manager.play_sound('score')
-
-                #увеличиваем скорость каждые n очков
-                if self.score % self.speed_increase_interval == 0:
-                    #Если счет делится без остатка на интервалл, увеличиваем скорость
-                    self.game_speed += 50
-                    self.obstacle_interval = max(1.0, self.obstacle_interval - 0.05)
-                    #eменьшаем интервал между препятствиями на 0.05 секунды
-                    #max(1.0, ...) - гарантирует что интервал не станет меньше 1.0 секунды
-
-            #удаляем препятствия за экраном
+                self.score_point()
+
+            #препятствия за экраном не переносим в новый список, а возвращаем в пул
             if obstacle.is_offscreen():
-                self.obstacles.remove(obstacle)
+                self.obstacle_pool.release(obstacle)
+            else:
+                survivors.append(obstacle)
 
-        #обновляем игрока неуязвимость
-        self.player.update_invulnerability(dt)
+        self.obstacles = survivors
 
+    def update_obstacle_array(self, dt):
+        """Обновляет препятствия из ObstacleArray несколькими векторными операциями.
 
-    def draw_background(self, screen):
-        """Рисует фон игры.
+        Args:
+            dt (float): Длина шага симуляции.
+        """
+        array = self.obstacle_array
+        array.update(dt) #все препятствия сдвигаются одной операцией
+
+        hits = array.collisions(self.player)
+        for count in range(1, len(hits) + 1):
+            if self.hit_obstacle():
+                array.remove(hits[:count])
+                return
+        array.remove(hits) #столкнувшиеся препятствия удаляются
+
+        for _ in range(array.mark_passed(self.player.rect.x)):
+            self.score_point()
+
+        array.cull() #удаляем препятствия за экраном
+
+    def hit_obstacle(self):
+        """Обрабатывает столкновение игрока с препятствием.
+
+        Returns:
+            bool: True если это была последняя жизнь и игра окончена.
+        """
+        self.sound_manager.play_sound('collision')
+        self.lives -= 1  #уменьшаем жизни
+
+        if self.lives <= 0: #если 0 жиней
+            self.game_over = True #заканчиваем игру
+            return True
+
+        #игрок получает неуязвимость после потери жизни
+        self.player.invulnerable = True #игрок не может получать урон
+        self.player.invulnerable_timer = self.INVULNERABLE_TIME  #1 секунда неуязвимости
+        return False
+
+    def score_point(self):
+        """Начисляет очко за пройденное препятствие и ускоряет игру каждые n очков."""
+        self.score += 1
+        self.sound_manager.play_sound('score')
+
+        #увеличиваем скорость каждые n очков
+        if self.score % self.speed_increase_interval == 0:
+            #Если счет делится без остатка на интервалл, увеличиваем скорость
+            self.game_speed += self.SPEED_STEP
+            self.obstacle_interval = max(self.MIN_OBSTACLE_INTERVAL, self.obstacle_interval - self.INTERVAL_STEP)
+            #eменьшаем интервал между препятствиями на 0.05 секунды
+            #max(1.0, ...) - гарантирует что интервал не станет меньше 1.0 секунды
+
+    def build_background_layer(self, size):
+        """Один раз рисует статичную часть фона на отдельной поверхности.
+
+        В слой попадают заливка, горы и земля - все, что не двигается.
 
         Args:
-            screen (pygame.Surface): Поверхность для отрисовки.
+            size (tuple): Размер окна (ширина, высота).
+
+        Returns:
+            pygame.Surface: Готовый слой фона.
         """
-        #screen - игровок окно
-        #фон
-        for y in range(self.screen_height):
-            #pапускает цикл по всем горизонтальным строкам экрана — от y = 0 (самый верх)
-            #до y = self.screen_height - 1 самый низ
-            color = (255, 200, 255)
-            pygame.draw.line(screen, color, (0, y), (self.screen_width, y))
-            #рисует горизонтальную линию
-            #от точки (0, y) (левый край строки) до (self.screen_width, y) (правый край строки)
+        layer = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert() #формат экрана - самый быстрый blit
+        layer.fill((255, 200, 255)) #фон одной заливкой вместо линии на каждую строку
 
         #горы
         if self.background_sprites['mountain']:
             for i in range(4):
                 x = i * 400  #рисуем горы 4 раза
-                screen.blit(self.background_sprites['mountain'], (x, self.ground_y - 225))
+                layer.blit(self.background_sprites['mountain'], (x, self.ground_y - 225))
                 #рисуем по левой границе горизонтали x на высоте475px (1200 - 225) ОТ ВВЕРХА ЭКРАНА
 
-        #облака
+        #земля
+        if self.background_sprites['ground']:
+            ground_width = self.background_sprites['ground'].get_width() #запрос ширины картинки
+            #цикл для рисования земли от левого до правого края окна
+            #ground_width = 200 (ширина картинки земли)
+            #for x in range(0, 1200, 200):
+            for x in range(0, size[0], ground_width):
+                layer.blit(self.background_sprites['ground'], (x, self.ground_y)) #от левого края от вверхнеего края 700
+                # (то есть внизу займет 100 пикслей)
+
+        return layer
+
+    def draw_background(self, screen):
+        """Рисует фон игры.
+
+        Статичная часть (заливка, горы, земля) берется из заранее нарисованного
+        слоя одним blit; слой перестраивается только при смене размера окна.
+
+        Args:
+            screen (pygame.Surface): Поверхность для отрисовки.
+
+        Returns:
+            list: Прямоугольники, занятые облаками.
+        """
+        #screen - игровок окно
+        if self.background_layer is None or self.background_layer.get_size() != screen.get_size():
+            self.background_layer = self.build_background_layer(screen.get_size())
+        screen.blit(self.background_layer, (0, 0))
+
+        return self.draw_clouds(screen)
+
+    def draw_clouds(self, screen):
+        """Рисует облака поверх слоя фона.
+
+        Args:
+            screen (pygame.Surface): Поверхность для отрисовки.
+
+        Returns:
+            list: Прямоугольники, занятые облаками.
+        """
+        rects = []
         cloud_sprite = self.background_sprites['cloud']
+        ground_sprite = self.background_sprites['ground']
+        ground_rect = pygame.Rect(0, self.ground_y, screen.get_width(), ground_sprite.get_height() if ground_sprite else 0)
         for cloud in self.clouds:
             if cloud_sprite:
-                screen.blit(cloud_sprite, (cloud['x'], cloud['y']))
+                cloud_rect = screen.blit(cloud_sprite, (cloud.x, cloud.y))
+                #в маленьком окне облако может зайти на землю - земля должна остаться поверх облака
+                overlap = cloud_rect.clip(ground_rect)
+                if overlap.width and overlap.height:
+                    screen.blit(self.background_layer, overlap, overlap)
+                rects.append(cloud_rect)
         #self.clouds = [
-        #{'x': 500, 'y': 100, 'speed': 40},  Облако 1
-        #{'x': 300, 'y': 200, 'speed': 60},  Облако 2
+        #Cloud(x=500, y=100, speed=40),  Облако 1
+        #Cloud(x=300, y=200, speed=60),  Облако 2
         #береберам список заромандезированных облаков
+        return rects
 
-        #земля
-        if self.background_sprites['ground']:
-            ground_width = self.background_sprites['ground'].get_width() #запрос ширины картинки
-            #цикл для рисования земли от левого до правого края экран
-            #ground_width = 200 (ширина картинки земли)
-            # self.screen_width = 1200 (ширина экрана)
-            #for x in range(0, 1200, 200):
+    def draw_entities(self, screen):
+        """Рисует препятствия и игрока.
 
-            for x in range(0, self.screen_width, ground_width):
-                #self.screen_width - ширина экрана
-                #ширина картинки
-                screen.blit(self.background_sprites['ground'], (x, self.ground_y)) #от левого края от вверхнеего края 700
-                # (то есть внизу займет 100 пикслей)
+        Args:
+            screen (pygame.Surface): Поверхность для отрисовки.
+
+        Returns:
+            list: Прямоугольники, занятые препятствиями и игроком.
+        """
+        #препятствия - одним пакетным вызовом, все спрайты лежат в атласе
+        alpha = self.render_alpha #положение между двумя последними шагами симуляции
+        if self.obstacle_array is not None:
+            rects = self.obstacle_array.draw(screen, alpha)
+        else:
+            frames = [(obstacle.get_frame(), obstacle.render_rect(alpha)) for obstacle in self.obstacles]
+            rects = screen.blits([frame for frame in frames if frame[0] is not None])
+
+        #игрок
+        player_rect = self.player.draw(screen, alpha)
+        if player_rect is not None: #во время мерцания игрок может быть не нарисован
+            rects.append(player_rect)
+        return rects
+
+    def draw_dynamic(self, screen):
+        """Рисует все, что меняется от кадра к кадру: облака, объекты и HUD.
+
+        Фон под ними должен быть уже нарисован.
+
+        Args:
+            screen (pygame.Surface): Поверхность для отрисовки.
+
+        Returns:
+            list: Прямоугольники всех нарисованных элементов.
+        """
+        rects = self.draw_clouds(screen)
+        rects += self.draw_entities(screen)
+        rects += self.draw_hud(screen)
+        return rects
 
     #рисуем все
     def draw(self, screen):
@@ -320,26 +657,80 @@ class GameManager:
 
         Args:
             screen (pygame.Surface): Поверхность для отрисовки.
+
+        Returns:
+            list: Прямоугольники подвижных элементов и HUD (без фона и меню).
         """
-        #фон
-        self.draw_background(screen)
+        #пауза и Game Over: ничего не движется, показываем заранее собранный кадр
+        if self.game_over or self.is_paused:
+            screen.blit(self.get_frozen_frame(screen.get_size()), (0, 0))
+            return []
 
-        #препятствия
-        for obstacle in self.obstacles:
-            obstacle.draw(screen)
+        #игра идет - собранный кадр устарел (при следующей паузе сцена будет другой)
+        self.frozen_frame = None
 
-        #игрок
-        self.player.draw(screen)
+        return self.draw_scene(screen)
+
+    def draw_scene(self, screen):
+        """Рисует фон, облака, препятствия, игрока и HUD.
+
+        Args:
+            screen (pygame.Surface): Поверхность для отрисовки.
+
+        Returns:
+            list: Прямоугольники подвижных элементов и HUD (без фона).
+        """
+        #фон и облака
+        rects = self.draw_background(screen)
+
+        #препятствия и игрок
+        rects += self.draw_entities(screen)
 
         #HUD
-        self.draw_hud(screen)
+        rects += self.draw_hud(screen)
 
-        #Game Over
-        if self.game_over:
-            self.draw_game_over(screen)
-        #пауза
-        elif self.is_paused:
-            self.draw_pause_menu(screen)
+        return rects
+
+    def frozen_frame_key(self, size):
+        """Возвращает все, от чего зависит кадр паузы или Game Over.
+
+        Args:
+            size (tuple): Размер окна (ширина, высота).
+
+        Returns:
+            tuple: Ключ; если он изменился, кадр нужно собрать заново.
+        """
+        sound = self.sound_manager
+        return (self.game_over, self.is_paused, tuple(size),
+                sound.sound_enabled, sound.music_enabled, sound.volume)
+
+    def get_frozen_frame(self, size):
+        """Возвращает собранный кадр паузы или Game Over.
+
+        Кадр (сцена, затемнение и меню) собирается один раз при входе
+        в паузу или Game Over и пересобирается, только если изменилось
+        его содержимое: громкость, включение звука или музыки, размер окна.
+
+        Args:
+            size (tuple): Размер окна (ширина, высота).
+
+        Returns:
+            pygame.Surface: Готовый кадр размером с окно.
+        """
+        key = self.frozen_frame_key(size)
+        if self.frozen_frame is None or key != self.frozen_frame_key_value:
+            frame = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                frame = frame.convert() #формат окна - быстрый blit
+            self.draw_scene(frame)
+            if self.game_over:
+                self.draw_game_over(frame)
+            else:
+                self.draw_pause_menu(frame)
+            self.frozen_frame = frame
+            self.frozen_frame_key_value = key
+            self.frozen_frame_builds += 1
+        return self.frozen_frame
 
 
     def draw_hud(self, screen) :
@@ -347,23 +738,27 @@ class GameManager:
 
         Args:
             screen (pygame.Surface): Поверхность для отрисовки.
+
+        Returns:
+            list: Прямоугольники всех нарисованных элементов HUD.
         """
+        rects = []
         # Создаем текст с текущим счетом розовым цветом
-        score_text = self.font.render(f'SCORE: {self.score}', True, (200, 100, 150))
-        screen.blit(score_text, (30, 30))        # Рисуем текст в левом верхнем углу (координаты 30, 30)
+        score_text = self.text_cache.render(self.font, f'SCORE: {self.score}', True, (200, 100, 150))
+        rects.append(screen.blit(score_text, (30, 30)))        # Рисуем текст в левом верхнем углу (координаты 30, 30)
 
         # Преобразуем скорость в целое число для отображения
-        speed_text = self.font.render(f'SPEED: {int(self.game_speed)}', True, (200, 100, 150))
-        screen.blit(speed_text, (30, 80))         # Рисуем под счетом (с отступом 50 пикселей по вертикали)
+        speed_text = self.text_cache.render(self.font, f'SPEED: {int(self.game_speed)}', True, (200, 100, 150))
+        rects.append(screen.blit(speed_text, (30, 80)))         # Рисуем под счетом (с отступом 50 пикселей по вертикали)
 
         # Отображаем количество оставшихся жизней
-        lives_text = self.font.render(f'LIVES: {self.lives}', True, (200, 100, 150))
-        screen.blit(lives_text, (30, 130))       # Рисуем под скоростью
+        lives_text = self.text_cache.render(self.font, f'LIVES: {self.lives}', True, (200, 100, 150))
+        rects.append(screen.blit(lives_text, (30, 130)))       # Рисуем под скоростью
 
         # Отображение сердечек
         if self.ui_sprites['heart'] :         # Проверяем, есть ли спрайт сердца в словаре UI-спрайтов
             for i in range(self.lives) :
-                screen.blit(self.ui_sprites['heart'], (250 + i * 50, 125))              # Рисуем сердечки по количеству жизней (каждое сердце - 50 пикселей правее предыдущего) справа от текста с жизнями
+                rects.append(screen.blit(self.ui_sprites['heart'], (250 + i * 50, 125)))              # Рисуем сердечки по количеству жизней (каждое сердце - 50 пикселей правее предыдущего) справа от текста с жизнями
 
         # Управление - УБИРАЕМ DOWN - Duck
         # Список подсказок по управлению
@@ -376,17 +771,19 @@ class GameManager:
 
         # Рисуем каждую подсказку в правом верхнем углу
         for i, control in enumerate(controls) :
-            text = self.font.render(control, True, (220, 140, 190))         # Создаем текст для каждой команды управления
-            screen.blit(text, (self.screen_width - text.get_width() - 30, 30 + i * 50))         # Располагаем справа с отступом 30 пикселей от края
+            text = self.text_cache.render(self.font, control, True, (220, 140, 190))         # Создаем текст для каждой команды управления
+            rects.append(screen.blit(text, (self.screen_width - text.get_width() - 30, 30 + i * 50)))         # Располагаем справа с отступом 30 пикселей от края
                                                                                              # Выравниваем по правому краю, вычитая ширину текста
 
         # Индикатор паузы
         # Если игра на паузе - показываем большой текст "PAUSED" по центру
         if self.is_paused :
-            pause_text = self.big_font.render("PAUSED", True, (255, 100, 150))
-            screen.blit(pause_text,                      # Центрируем текст по горизонтали и вертикали
-                        (self.screen_width // 2 - pause_text.get_width() // 2,
-                         self.screen_height // 2 - 50))
+            pause_text = self.text_cache.render(self.big_font, "PAUSED", True, (255, 100, 150))
+            rects.append(screen.blit(pause_text,                      # Центрируем текст по горизонтали и вертикали
+                                     (self.screen_width // 2 - pause_text.get_width() // 2,
+                                      self.screen_height // 2 - 50)))
+
+        return rects
 
     def draw_pause_menu(self, screen) :
         """Рисует меню паузы.
@@ -400,7 +797,7 @@ class GameManager:
         screen.blit(overlay, (0, 0))          # Рисуем затемнение поверх всего экрана
 
         # Заголовок - только текст, без спрайта
-        pause_text = self.big_font.render('PAUSED', True, (255, 100, 150))
+        pause_text = self.text_cache.render(self.big_font, 'PAUSED', True, (255, 100, 150))
         screen.blit(pause_text,                       # Центрируем заголовок в верхней части экрана
                     (self.screen_width // 2 - pause_text.get_width() // 2,
                      self.screen_height // 2 - 200))
@@ -416,7 +813,7 @@ class GameManager:
 
         # Рисуем каждую опцию по центру экрана
         for i, option in enumerate(options) :
-            option_text = self.font.render(option, True, (255, 200, 220))
+            option_text = self.text_cache.render(self.font, option, True, (255, 200, 220))
             screen.blit(option_text,                          # Располагаем опции вертикально с интервалом 60 пикселей
                         (self.screen_width // 2 - option_text.get_width() // 2,
                          self.screen_height // 2 - 50 + i * 60))
@@ -425,7 +822,7 @@ class GameManager:
         # Выбираем иконки в зависимости от включенного звука/музыки
         sound_icon = "🔊" if self.sound_manager.sound_enabled else "🔇"
         music_icon = "🎵" if self.sound_manager.music_enabled else "🔇"
-        status_text = self.font.render(              # Создаем строку со статусом аудио
+        status_text = self.text_cache.render(self.font,     # Создаем строку со статусом аудио
             f'Sound: {sound_icon}  Music: {music_icon}  Volume: {int(self.sound_manager.volume * 100)}%',
             True, (255, 180, 200))
         screen.blit(status_text,          # Выводим статус внизу экрана
@@ -461,7 +858,7 @@ class GameManager:
             y = self.screen_height // 2 - 200           # Фиксированная позиция по вертикали
             screen.blit(self.ui_sprites['game_over'], (x, y))
         else :            # Если спрайта нет - рисуем текст
-            game_over_text = self.big_font.render('GAME OVER', True, (255, 100, 150))
+            game_over_text = self.text_cache.render(self.big_font, 'GAME OVER', True, (255, 100, 150))
             screen.blit(game_over_text,
                         (self.screen_width // 2 - game_over_text.get_width() // 2,
                          self.screen_height // 2 - 150))
@@ -476,13 +873,13 @@ class GameManager:
 
         # Рисуем статистику по центру экрана
         for i, stat in enumerate(stats) :
-            stat_text = self.font.render(stat, True, (255, 200, 220))
+            stat_text = self.text_cache.render(self.font, stat, True, (255, 200, 220))
             screen.blit(stat_text,
                         (self.screen_width // 2 - stat_text.get_width() // 2,
                          self.screen_height // 2 - 20 + i * 60))
 
         # Инструкция, что делать дальше
-        restart_text = self.font.render('Press R to restart or ESC to quit', True, (255, 180, 200))
+        restart_text = self.text_cache.render(self.font, 'Press R to restart or ESC to quit', True, (255, 180, 200))
         screen.blit(restart_text,
                     (self.screen_width // 2 - restart_text.get_width() // 2,
                      self.screen_height // 2 + 180))
@@ -491,7 +888,10 @@ class GameManager:
     def reset_game(self):
         """Сбрасывает игру к начальному состоянию."""
         self.player.reset()
+        self.obstacle_pool.release_all(self.obstacles)
         self.obstacles.clear()
+        if self.obstacle_array is not None:
+            self.obstacle_array.clear()
         self.clouds.clear()
         self.score = 0
         self.lives = 3  # Восстанавливаем жизни
@@ -500,6 +900,9 @@ class GameManager:
         self.obstacle_timer = 0
         self.game_speed = 400
         self.obstacle_interval = 1.8
+        self.frozen_frame = None
+        if self.spawn_schedule is not None:
+            self.spawn_schedule.restart() #очередь считалась для скорости прошлой игры
 
         if hasattr(self, 'game_over_sound_played'): #если уже играла музыка проигрыша, удаляем ее
             del self.game_over_sound_played
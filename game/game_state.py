@@ -0,0 +1,284 @@
+"""Модуль game_state - компактное состояние игры без спрайтов для прогнозов.
+
+Содержит класс GameState: все, что меняется в шаге GameManager.update
+(игрок, препятствия, счет, жизни, скорость, таймеры), в виде чисел в
+слотах. Картинки и pygame.Rect не копируются: неизменные данные
+препятствий (размер, высота, скорость, маска) лежат в общем кортеже,
+который делят все копии, а fork() копирует только числа и короткий
+список координат. Поэтому копия стоит микросекунды, и от одного
+положения можно проверить сотни вариантов будущего.
+
+step() повторяет порядок и арифметику Player.update, Player.jump,
+GameManager.update (столкновения за весь шаг по маскам, жизни,
+неуязвимость, очки, ускорение), так что без новых препятствий прогноз
+совпадает с игрой до бита. Препятствия, которые еще не появились, в
+прогнозе не участвуют - их не знает и игрок.
+"""
+
+import pygame
+from .base_object import BaseObject
+from .collision import masks_collide, sweep_test
+from .game_manager import GameManager
+from .sprite_loader import SpriteLoader
+
+
+class GameState:
+    """Состояние игры, которое можно дешево копировать и продвигать.
+
+    Attributes:
+        body (tuple): Неизменные данные игрока, общие для всех копий: x, ширина,
+            высота, гравитация, сила прыжка, уровень земли, маски кадров по анимациям.
+        tick (int): Номер шага (как GameManager.tick).
+        score (int): Счет.
+        lives (int): Жизни.
+        game_over (bool): Закончена ли игра.
+        player_y (float): Точная координата Y игрока.
+        velocity_y (float): Вертикальная скорость игрока.
+        is_jumping (bool): В прыжке ли игрок.
+        invulnerable (bool): Неуязвим ли игрок (пока неуязвим - прыгать нельзя).
+        shapes (tuple): Неизменные данные препятствий (y, ширина, высота, скорость, маска),
+            общие для копий до первого удаления препятствия.
+        obstacle_x (list): Точные координаты X препятствий.
+        passed (list): Пройдено ли препятствие.
+    """
+
+    __slots__ = ('body', 'tick', 'score', 'lives', 'game_speed', 'obstacle_interval', 'obstacle_timer',
+                 'speed_increase_interval', 'game_over', 'player_y', 'velocity_y', 'is_jumping',
+                 'invulnerable', 'invulnerable_timer', 'animation', 'animation_frame', 'animation_timer',
+                 'shapes', 'obstacle_x', 'passed')
+
+    def capture(game):
+        """Снимает состояние с идущей игры.
+
+        Args:
+            game (GameManager): Игра (хранилище препятствий 'list' или 'array').
+
+        Returns:
+            GameState: Состояние в текущий момент.
+        """
+        state = GameState()
+        player = game.player
+        masks = {}
+        for name, frames in player.sprites.items():
+            #как BaseObject.get_mask: кадр другого размера - проверка по прямоугольнику
+            masks[name] = [SpriteLoader.cache.mask_for(frame) if frame.get_size() == player.rect.size else None
+                           for frame in frames]
+        sprite_mask = None
+        if player.sprite is not None and player.sprite.get_size() == player.rect.size:
+            sprite_mask = SpriteLoader.cache.mask_for(player.sprite)
+        state.body = (player.rect.x, player.rect.width, player.rect.height, player.gravity, player.jump_force,
+                      player.ground_y, masks, sprite_mask)
+
+        state.tick = game.tick
+        state.score = game.score
+        state.lives = game.lives
+        state.game_speed = game.game_speed
+        state.obstacle_interval = game.obstacle_interval
+        state.obstacle_timer = game.obstacle_timer
+        state.speed_increase_interval = game.speed_increase_interval
+        state.game_over = game.game_over
+
+        state.player_y = player.pos_y
+        state.velocity_y = player.velocity_y
+        state.is_jumping = player.is_jumping
+        state.invulnerable = player.invulnerable
+        state.invulnerable_timer = player.invulnerable_timer
+        state.animation = player.current_animation
+        state.animation_frame = player.animation_frame
+        state.animation_timer = player.animation_timer
+
+        shapes, xs, passed = [], [], []
+        if game.obstacle_array is not None:
+            array = game.obstacle_array
+            for i in range(len(array)):
+                sprite = array.sprites[i]
+                size = (int(array.w[i]), int(array.h[i]))
+                mask = SpriteLoader.cache.mask_for(sprite) if sprite is not None and sprite.get_size() == size else None
+                shapes.append((round(float(array.y[i])),) + size + (float(array.speed[i]), mask))
+                xs.append(float(array.x[i]))
+                passed.append(bool(array.passed[i]))
+        else:
+            for obstacle in game.obstacles:
+                shapes.append((obstacle.rect.y, obstacle.rect.width, obstacle.rect.height, obstacle.speed,
+                               obstacle.get_mask()))
+                xs.append(obstacle.pos_x)
+                passed.append(obstacle.passed)
+        state.shapes = tuple(shapes)
+        state.obstacle_x = xs
+        state.passed = passed
+        return state
+
+    capture = staticmethod(capture)
+
+    def fork(self):
+        """Возвращает независимую копию состояния.
+
+        Общие неизменные данные (body, shapes) не копируются.
+
+        Returns:
+            GameState: Копия.
+        """
+        state = GameState()
+        state.body = self.body
+        state.tick = self.tick
+        state.score = self.score
+        state.lives = self.lives
+        state.game_speed = self.game_speed
+        state.obstacle_interval = self.obstacle_interval
+        state.obstacle_timer = self.obstacle_timer
+        state.speed_increase_interval = self.speed_increase_interval
+        state.game_over = self.game_over
+        state.player_y = self.player_y
+        state.velocity_y = self.velocity_y
+        state.is_jumping = self.is_jumping
+        state.invulnerable = self.invulnerable
+        state.invulnerable_timer = self.invulnerable_timer
+        state.animation = self.animation
+        state.animation_frame = self.animation_frame
+        state.animation_timer = self.animation_timer
+        state.shapes = self.shapes
+        state.obstacle_x = self.obstacle_x[:]
+        state.passed = self.passed[:]
+        return state
+
+    def can_jump(self):
+        """Проверяет, сработает ли прыжок сейчас (как условия Player.jump).
+
+        Returns:
+            bool: True если игра идет, игрок на земле и не неуязвим.
+        """
+        return not self.game_over and not self.is_jumping and not self.invulnerable
+
+    def is_clear(self):
+        """Проверяет, что все известные препятствия уже позади игрока.
+
+        Пройденное препятствие движется только влево, поэтому дальше
+        (до появления новых) столкновений быть не может.
+
+        Returns:
+            bool: True если впереди препятствий нет.
+        """
+        return all(self.passed)
+
+    def jump(self):
+        """Прыжок - как GameManager.jump и Player.jump."""
+        if self.can_jump():
+            self.velocity_y = self.body[4]
+            self.is_jumping = True
+            self._set_animation('jump')
+
+    def _set_animation(self, name):
+        """Смена анимации - как BaseObject.set_animation (кадр и таймер сбрасываются)."""
+        if self.body[6].get(name):
+            self.animation = name
+            self.animation_frame = 0
+            self.animation_timer = 0
+
+    def _player_mask(self):
+        """Маска текущего кадра игрока - как BaseObject.get_mask."""
+        frames = self.body[6].get(self.animation) if self.animation else None
+        return frames[self.animation_frame] if frames else self.body[7]
+
+    def step(self, dt, jump=False):
+        """Продвигает состояние на один шаг, как GameManager.update.
+
+        Таймер появления препятствий идет и сбрасывается, но новое
+        препятствие не создается (его параметры неизвестны до появления).
+
+        Args:
+            dt (float): Длина шага.
+            jump (bool, optional): Нажать прыжок перед шагом.
+        """
+        if self.game_over:
+            return
+        if jump:
+            self.jump()
+        self.tick += 1
+        player_x, player_w, player_h, gravity, _, ground_y, masks, _ = self.body
+
+        #Player.update
+        prev_y = self.player_y
+        self.velocity_y += gravity * dt
+        self.player_y += self.velocity_y * dt
+        if self.player_y >= ground_y:
+            self.player_y = ground_y
+            self.velocity_y = 0
+            self.is_jumping = False
+            if self.animation != 'run':
+                self._set_animation('run')
+        if self.animation in masks:     #BaseObject.update_animation
+            self.animation_timer += dt
+            if self.animation_timer >= BaseObject.ANIMATION_FRAME_TIME:
+                self.animation_timer = 0
+                self.animation_frame = (self.animation_frame + 1) % len(masks[self.animation])
+
+        self.obstacle_timer += dt
+        if self.obstacle_timer >= self.obstacle_interval:
+            self.obstacle_timer = 0
+
+        if self.shapes and self._update_obstacles(dt, prev_y):
+            return
+
+        #Player.update_invulnerability
+        if self.invulnerable:
+            self.invulnerable_timer -= dt
+            if self.invulnerable_timer <= 0:
+                self.invulnerable = False
+
+    def _update_obstacles(self, dt, prev_y):
+        """Движение препятствий, столкновения и очки - как GameManager.update_obstacle_list.
+
+        Returns:
+            bool: True если игра закончилась на этом шаге.
+        """
+        player_x, player_w, player_h = self.body[0], self.body[1], self.body[2]
+        player_right = player_x + player_w
+        player_top = min(round(prev_y), round(self.player_y))
+        player_bottom = max(round(prev_y), round(self.player_y)) + player_h
+        xs, passed, shapes = self.obstacle_x, self.passed, self.shapes
+        removed = []
+        for i, (y, width, height, speed, mask) in enumerate(shapes):
+            start = xs[i]
+            end = xs[i] = start - speed * dt
+
+            #грубая проверка без округления (запас в пиксель), точная - только для близких препятствий
+            if (min(start, end) < player_right + 1 and max(start, end) + width > player_x - 1
+                    and y < player_bottom and y + height > player_top):
+                start_x, x = round(start), round(end)
+                if (min(start_x, x) < player_right and max(start_x, x) + width > player_x
+                        and self._collides(prev_y, start_x, x, y, width, height, mask)):
+                    removed.append(i)
+                    self.lives -= 1
+                    if self.lives <= 0:
+                        self.game_over = True
+                        return True
+                    self.invulnerable = True
+                    self.invulnerable_timer = GameManager.INVULNERABLE_TIME
+                    continue
+
+            if not passed[i] and end < player_x - width + 1 and round(end) + width < player_x:
+                passed[i] = True
+                self.score += 1
+                if self.score % self.speed_increase_interval == 0:
+                    self.game_speed += GameManager.SPEED_STEP
+                    self.obstacle_interval = max(GameManager.MIN_OBSTACLE_INTERVAL,
+                                                 self.obstacle_interval - GameManager.INTERVAL_STEP)
+
+            if end < 1 - width and round(end) < -width:
+                removed.append(i)
+
+        if removed:
+            keep = [i for i in range(len(shapes)) if i not in removed]
+            self.shapes = tuple(shapes[i] for i in keep)
+            self.obstacle_x = [xs[i] for i in keep]
+            self.passed = [passed[i] for i in keep]
+        return False
+
+    def _collides(self, prev_y, start_x, x, y, width, height, mask):
+        """Столкновение игрока с препятствием за шаг - как swept_collides и collides_at."""
+        player_x, player_w, player_h = self.body[0], self.body[1], self.body[2]
+        player_mask = self._player_mask()
+        test = lambda a, b: a.colliderect(b) and masks_collide(a, player_mask, b, mask)
+        return sweep_test(test, pygame.Rect(player_x, round(prev_y), player_w, player_h),
+                          pygame.Rect(player_x, round(self.player_y), player_w, player_h),
+                          pygame.Rect(start_x, y, width, height), pygame.Rect(x, y, width, height))
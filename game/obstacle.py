@@ -7,9 +7,8 @@
 
 import pygame
 import random
-import os
 from .base_object import BaseObject
-from .sprite_loader import SpriteLoader
+from .asset_manifest import AssetManifest
 
 class Obstacle(BaseObject):
     """Класс препятствий для игры Moti Runner.
@@ -27,7 +26,20 @@ class Obstacle(BaseObject):
         is_flying (bool): True если это птица, False если наземное препятствие.
     """
 
-    def __init__(self, x, y, width=60, height=80, color=(200, 50, 50), speed=300, obstacle_type=None):
+    __slots__ = ('speed', 'passed', 'obstacle_type', 'is_flying') #без __dict__ - препятствий много, они должны быть легкими
+
+    #правила появления (через random_spawn их же используют BatchEnv и ObstacleArray) и хитбоксы get_hitbox
+    BIRD_CHANCE = 0.40 #доля птиц среди новых препятствий
+    BIRD_SIZE = (60, 40) #ширина и высота птицы
+    BIRD_ALTITUDE = (200, 250) #на сколько пикселей выше земли появляется птица
+    GROUND_SIZE = (170, 200) #пределы ширины и высоты кости
+    GROUND_LIFT = 10 #кость стоит на 10 пикселей выше уровня земли
+    BIRD_HITBOX = (-25, -25) #уменьшение хитбокса птицы без картинки (inflate)
+    GROUND_HITBOX = (-30, -20) #уменьшение хитбокса кости без картинки
+    GROUND_HITBOX_DROP = 15 #и его сдвиг вниз
+
+    def __init__(self, x, y, width=60, height=80, color=(200, 50, 50), speed=300, obstacle_type=None, rng=random,
+                 variant=None):
         """Инициализация препятствия.
 
         Args:
@@ -41,6 +53,10 @@ class Obstacle(BaseObject):
                 По умолчанию 300.
             obstacle_type (str, optional): Тип препятствия. Может быть 'bird' или None.
                 По умолчанию None.
+            rng (random.Random, optional): Генератор случайных чисел для выбора спрайта.
+                По умолчанию общий модуль random.
+            variant (AssetEntry, optional): Готовый вариант из манифеста вместо случайного
+                (препятствия SpawnSchedule). По умолчанию None.
         """
 
         super().__init__(x, y, width, height, color) #унаследовал атрибуты и методы с родительского класса BaseObject
@@ -50,50 +66,62 @@ class Obstacle(BaseObject):
         self.is_flying = False #True если это птица, False если наземное препятствие
 
         #загружает картинку препятствия из файла и сохраняет в self.sprite
-        self.load_obstacle_sprite()
-
-    def load_obstacle_sprite(self):
-        """Загружает спрайт препятствия из файла.
-
-        Ищет файлы в папке assets/obstacles и загружает соответствующий спрайт.
-        Для птиц использует файл bird.png, для других препятствий выбирает случайный файл.
-        """
-        assets_path = SpriteLoader.get_assets_path() #получаем путь к папке assets
-        obstacles_path = os.path.join(assets_path, 'obstacles') #объединяем путь к папке с перепятсвиями "C:\projects\moti_runner\assets\obstacles"
-
-        if os.path.exists(obstacles_path): #есть ли путь к файлу
-            if self.obstacle_type == 'bird':
-                sprite_file = os.path.join(obstacles_path, "bird.png")
+        self.load_obstacle_sprite(rng, variant)
 
-                if os.path.exists(sprite_file):
-                    sprite = SpriteLoader.load_sprite(sprite_file)
+    def reset(self, x, y, width=60, height=80, color=(200, 50, 50), speed=300, obstacle_type=None, rng=random,
+              variant=None):
+        """Готовит уже созданное препятствие к повторному использованию.
 
-                    if sprite:
-                        self.sprite = sprite #загрузили картинку
-                        self.is_flying = True #летающая птица
+        Делает то же, что и __init__, но без создания нового Rect и словаря
+        спрайтов. Используется пулом ObstaclePool.
 
-                        self.rect.width = self.sprite.get_width() #возвращает ширину спрайта в пикселях
-                        self.rect.height = self.sprite.get_height() #высоту
-                        return
-
-            #!!! другие объекты!!!
-            all_files = os.listdir(obstacles_path) #загружаем спрайты
-            sprite_files = [] #создаем список не для спрайтов птицы
+        Args:
+            x (int): Координата X левого верхнего угла.
+            y (int): Координата Y левого верхнего угла.
+            width (int, optional): Ширина препятствия. По умолчанию 60.
+            height (int, optional): Высота препятствия. По умолчанию 80.
+            color (tuple, optional): Цвет препятствия в формате RGB.
+            speed (int, optional): Скорость движения препятствий влево. По умолчанию 300.
+            obstacle_type (str, optional): Тип препятствия. Может быть 'bird' или None.
+            rng (random.Random, optional): Генератор случайных чисел для выбора спрайта.
+            variant (AssetEntry, optional): Готовый вариант из манифеста вместо случайного.
+        """
+        self.rect.size = (width, height) #старый rect переиспользуется
+        self.set_position(x, y) #без интерполяции от прошлого места
+        self.color = color
+        self.width = width
+        self.height = height
+        self.sprite = None
+        self.speed = speed
+        self.passed = False
+        self.obstacle_type = obstacle_type
+        self.is_flying = False
+
+        self.load_obstacle_sprite(rng, variant) #спрайт берется из манифеста, файл заново не читается
+
+    def load_obstacle_sprite(self, rng=random, variant=None):
+        """Загружает спрайт препятствия из манифеста ресурсов.
+
+        Варианты препятствий берутся из AssetManifest, который просматривает
+        папку assets/obstacles один раз при запуске. Для птиц используется
+        летающий вариант (bird.png), для других препятствий - случайный наземный.
 
-            for file_name in all_files: #если спрайт не птрицы, добавляем его в список
-                if file_name.lower() != 'bird.png':
-                    sprite_files.append(file_name)
+        Args:
+            rng (random.Random, optional): Генератор случайных чисел. По умолчанию модуль random.
+            variant (AssetEntry, optional): Готовый вариант - тогда случайный не выбирается.
+        """
+        if variant is None:
+            variant = AssetManifest.shared().random_obstacle(self.obstacle_type == 'bird', rng) #случайный вариант из таблицы в памяти
+        if variant is None: #в папке нет картинок препятствий
+            return
 
-            if sprite_files:
-                sprite_file = os.path.join(obstacles_path, random.choice(sprite_files)) #рандомизируем появление объекта
-                sprite = SpriteLoader.load_sprite(sprite_file)
-                if sprite:
-                    self.sprite = sprite
+        self.sprite = variant.get_sprite() #спрайт уже загружен при старте
+        self.is_flying = variant.kind == 'flying' #летающая птица или кость на земле
 
-                    self.rect.width = self.sprite.get_width()
-                    self.rect.height = self.sprite.get_height()
+        self.rect.width = variant.width #ширина спрайта в пикселях из манифеста
+        self.rect.height = variant.height #высота
 
-    def create_random(screen_width, ground_y, speed):
+    def create_random(screen_width, ground_y, speed, rng=random):
         #screen_width - заданная ширина экрана пользователем
         #ground_y расположение земли
         """Создает случайное препятствие.
@@ -102,6 +130,8 @@ class Obstacle(BaseObject):
             screen_width (int): Заданная ширина экрана пользователем.
             ground_y (int): Расположение земли (координата Y уровня земли).
             speed (int): Скорость движения препятствия.
+            rng (random.Random, optional): Генератор случайных чисел игры.
+                По умолчанию общий модуль random.
 
         Returns:
             Obstacle: Новый объект препятствия со случайными параметрами.
@@ -112,30 +142,49 @@ class Obstacle(BaseObject):
             - Наземные препятствия (кости) появляются на уровне земли
             - Препятствие создается за правым краем экрана
         """
+        x, y, width, height, color, obstacle_type = Obstacle.random_spawn(screen_width, ground_y, rng)
+        return Obstacle(x, y, width, height, color, speed, obstacle_type, rng)
+
+    create_random = staticmethod(create_random)
+
+    def random_spawn(screen_width, ground_y, rng=random):
+        """Выбирает случайные параметры нового препятствия (без создания объекта).
+
+        Используется create_random и хранилищем ObstacleArray.
+
+        Args:
+            screen_width (int): Ширина экрана.
+            ground_y (int): Координата Y уровня земли.
+            rng (random.Random, optional): Генератор случайных чисел игры.
+
+        Returns:
+            tuple: (x, y, ширина, высота, цвет, тип препятствия).
+        """
 
         #определяем тип препятствия (40% шанс на птицу)
-        is_bird = random.random() < 0.40
+        is_bird = rng.random() < Obstacle.BIRD_CHANCE
 
         if is_bird:
             #если птица
-            width = 60
-            height = 40
+            width, height = Obstacle.BIRD_SIZE
             color = (255, 255, 255)
-            y = ground_y - random.randint(200, 250) #задаем на оси y, на какой высоте она будет появлятся
+            y = ground_y - rng.randint(*Obstacle.BIRD_ALTITUDE) #задаем на оси y, на какой высоте она будет появлятся
             obstacle_type = 'bird'
         else:
             #кость на земле
-            width = random.randint(170, 200)
-            height = random.randint(170, 200)
+            width = rng.randint(*Obstacle.GROUND_SIZE)
+            height = rng.randint(*Obstacle.GROUND_SIZE)
             color = (255, 255, 255)
-            y = ground_y - 10
+            y = ground_y - Obstacle.GROUND_LIFT
             obstacle_type = None
 
         x = screen_width + width
         #screen_width=1200, width=50 -> x=1250
         #gрепятствие появится на 1250px 50px за правым краем экрана 1200px
 
-        return Obstacle(x, y, width, height, color, speed, obstacle_type)
+        return x, y, width, height, color, obstacle_type
+
+    random_spawn = staticmethod(random_spawn)
 
     def update(self, dt): #движение препятсвий влево
         """Обновляет позицию препятствия.
@@ -146,10 +195,17 @@ class Obstacle(BaseObject):
             dt (float): Время, прошедшее с прошлого кадра.
 
         Example:
-            self.rect.x = 1250 за гарницей, speed=300px/сек, dt=0.016сек - 300 * 0.016 = 4.8px
+            self.pos_x = 1250 за гарницей, speed=300px/сек, dt=0.016сек - 300 * 0.016 = 4.8px
             За один кадр препятствие сдвинется на 4.8 пикселя влево
+
+        Note:
+            Сдвиг копится в дробном pos_x, а rect только округляет его. При 240 FPS
+            сдвиг за кадр меньше пикселя, и округление rect.x на каждом кадре
+            останавливало бы препятствие.
         """
-        self.rect.x = self.rect.x - self.speed * dt
+        self.sync_position() #положение могли задать напрямую через rect
+        self.pos_x -= self.speed * dt
+        self.update_rect() #rect пересчитывается один раз за шаг
     #self.rect.x = 1250 за гарницей, speed=300px/сек, dt=0.016сек - 300 * 0.016 = 4.8px
     #за один кадр препятствие сдвинется на 4.8 пикселя влево
 
@@ -166,38 +222,56 @@ class Obstacle(BaseObject):
         return self.rect.x < -self.rect.width
         #если объект позиця меньше чем позиция за границой (-), то значит объект вышел за границу 50px - справа, -50px слева
 
-    def draw(self, screen): #рисуем препятствие
+    def draw(self, screen, alpha=1.0): #рисуем препятствие
         """Рисует препятствие на экране.
 
         Args:
             screen (pygame.Surface): Игровое окно, на котором рисуем.
+            alpha (float, optional): Доля шага симуляции для интерполяции положения.
+
+        Returns:
+            pygame.Rect: Область экрана с препятствием (None, если нет спрайта).
         """
         #screen - игровое окно, на котомром рисуем
         if self.sprite: #если есть в спрайтах
-            screen.blit(self.sprite, self.rect)
-
-    def collides_with(self, other): #проверка столкновения с другим объектом.
-        """Проверка столкновения с другим объектом.
+            return screen.blit(self.sprite, self.render_rect(alpha))
+        return None
 
-        Создает разные хитбоксы для разных типов препятствий.
+    def get_hitbox(self, rect=None):
+        """Возвращает упрощенный хитбокс препятствия.
 
         Args:
-            other (BaseObject): Другой объект для проверки столкновения.
+            rect (pygame.Rect, optional): Положение препятствия. По умолчанию текущий rect.
 
         Returns:
-            bool: True если объекты пересекаются с учетом хитбокса.
+            pygame.Rect: Уменьшенный прямоугольник препятствия.
 
-        Notes:
-            - Для птиц: уменьшенный хитбокс (-25, -25)
-            - Для наземных препятствий: уменьшенный и смещенный вниз хитбокс
+        Note:
+            Столкновения хитбокс не использует: как и любой BaseObject, препятствие
+            без картинки сталкивается всем прямоугольником (BaseObject.collides_at),
+            с какой стороны ни проверять.
+        """
+        if rect is None:
+            rect = self.rect
+        return Obstacle.hitbox_for(rect, self.is_flying)
+
+    def hitbox_for(rect, flying):
+        """Упрощенный хитбокс препятствия без картинки в заданном положении.
+
+        Args:
+            rect (pygame.Rect): Положение препятствия.
+            flying (bool): Летающее ли препятствие.
+
+        Returns:
+            pygame.Rect: Уменьшенный прямоугольник.
         """
         # !!!создаем хитбоксы
-        if self.is_flying:
+        if flying:
             #птица
-            bird_hitbox = self.rect.inflate(-25, -25) #уменьшаем размер по сравнению с оригиналом
-            return bird_hitbox.colliderect(other.rect) #возвращаем столкновение
-        else:
-            #кости
-            ground_hitbox = self.rect.inflate(-30, -20)
-            ground_hitbox.y += 15
-            return ground_hitbox.colliderect(other.rect)
+            return rect.inflate(*Obstacle.BIRD_HITBOX) #уменьшаем размер по сравнению с оригиналом
+        #кости
+        ground_hitbox = rect.inflate(*Obstacle.GROUND_HITBOX)
+        ground_hitbox.y += Obstacle.GROUND_HITBOX_DROP
+        return ground_hitbox
+
+    hitbox_for = staticmethod(hitbox_for)
@@ -0,0 +1,298 @@
+"""Модуль obstacle_array - хранилище препятствий в массивах NumPy.
+
+Содержит класс ObstacleArray - альтернативу списку объектов Obstacle.
+Все живые препятствия хранятся "структурой массивов": отдельный массив
+на каждое поле (x, y, ширина, высота, скорость, пройдено, летает).
+Движение, удаление ушедших за экран, подсчет очков и грубая проверка
+столкновений выполняются несколькими векторными операциями за шаг,
+независимо от количества препятствий. Точная (попиксельная) проверка
+делается только для тех немногих препятствий, которые за шаг пересекли
+прямоугольник игрока.
+
+NumPy - необязательная зависимость: без него игра использует обычный список.
+"""
+
+import pygame
+import random
+from .asset_manifest import AssetManifest
+from .collision import masks_collide, sweep_test
+from .obstacle import Obstacle
+from .sprite_loader import SpriteLoader
+
+try:
+    import numpy as np
+except ImportError:     # без NumPy доступен только список объектов Obstacle
+    np = None
+
+
+def slab_intervals(move, box_min, box_max, player_min, player_max):
+    """Интервал времени, когда проекции пересекаются по одной оси (для всех строк сразу).
+
+    Прямоугольник [box_min, box_max] движется на move за шаг, отрезок игрока
+    [player_min, player_max] неподвижен. Используется ObstacleArray и BatchEnv.
+
+    Args:
+        move (numpy.ndarray): Смещение прямоугольника за шаг.
+        box_min (numpy.ndarray): Начало прямоугольника по оси в начале шага.
+        box_max (numpy.ndarray): Конец прямоугольника по оси в начале шага.
+        player_min: Начало отрезка игрока (число или массив).
+        player_max: Конец отрезка игрока (число или массив).
+
+    Returns:
+        tuple: (enter, exit) - массивы долей шага; пересечение есть, если enter < exit
+        и интервал задевает [0, 1].
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t1 = (player_min - box_max) / move
+        t2 = (player_max - box_min) / move
+    enter = np.minimum(t1, t2)
+    exit_ = np.maximum(t1, t2)
+    still = move == 0       # по оси нет движения: пересечение либо всегда, либо никогда
+    overlap = (box_max > player_min) & (box_min < player_max)
+    enter = np.where(still, np.where(overlap, -np.inf, np.inf), enter)
+    exit_ = np.where(still, np.where(overlap, np.inf, -np.inf), exit_)
+    return enter, exit_
+
+
+class ObstacleArray:
+    """Препятствия в виде структуры массивов NumPy.
+
+    Attributes:
+        count (int): Количество живых препятствий (заполнены первые count строк массивов).
+        x (numpy.ndarray): Точная координата X.
+        prev_x (numpy.ndarray): Координата X на прошлом шаге (для интерполяции и swept-проверки).
+        y (numpy.ndarray): Координата Y.
+        w (numpy.ndarray): Ширина.
+        h (numpy.ndarray): Высота.
+        speed (numpy.ndarray): Скорость движения влево.
+        passed (numpy.ndarray): Пройдено ли препятствие (очко уже начислено).
+        flying (numpy.ndarray): Летающее ли препятствие.
+        sprites (list): Спрайт каждой строки (None, если картинки нет).
+    """
+
+    FIELDS = (('x', 'float64'), ('prev_x', 'float64'), ('y', 'float64'),
+              ('w', 'int64'), ('h', 'int64'), ('speed', 'float64'),
+              ('passed', 'bool'), ('flying', 'bool'))
+
+    def __init__(self, capacity=64):
+        """Инициализация пустого хранилища.
+
+        Args:
+            capacity (int, optional): Начальный размер массивов. По умолчанию 64.
+                При заполнении массивы увеличиваются вдвое.
+
+        Raises:
+            ImportError: Если NumPy не установлен.
+        """
+        if np is None:
+            raise ImportError("Для ObstacleArray нужен NumPy (pip install numpy)")
+        self.count = 0
+        self.sprites = []
+        self._allocate(max(1, capacity))
+
+    def available():
+        """Проверяет, можно ли использовать хранилище (установлен ли NumPy).
+
+        Returns:
+            bool: True если NumPy доступен.
+        """
+        return np is not None
+
+    available = staticmethod(available)
+
+    def _allocate(self, capacity):
+        """Создает массивы нужной емкости, сохраняя живые строки."""
+        for name, dtype in self.FIELDS:
+            array = np.zeros(capacity, dtype=dtype)
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def add(self, x, y, width, height, speed, flying=False, sprite=None):
+        """Добавляет препятствие.
+
+        Args:
+            x (float): Координата X левого верхнего угла.
+            y (float): Координата Y левого верхнего угла.
+            width (int): Ширина.
+            height (int): Высота.
+            speed (float): Скорость движения влево.
+            flying (bool, optional): Летающее ли препятствие.
+            sprite (pygame.Surface, optional): Картинка препятствия.
+        """
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = y
+        self.w[i] = width
+        self.h[i] = height
+        self.speed[i] = speed
+        self.passed[i] = False
+        self.flying[i] = flying
+        self.sprites.append(sprite)
+        self.count += 1
+
+    def spawn_random(self, screen_width, ground_y, speed, rng=random):
+        """Добавляет случайное препятствие с теми же правилами, что и Obstacle.create_random.
+
+        Args:
+            screen_width (int): Ширина экрана.
+            ground_y (int): Координата Y уровня земли.
+            speed (float): Скорость движения.
+            rng (random.Random, optional): Генератор случайных чисел игры.
+        """
+        x, y, width, height, _, obstacle_type = Obstacle.random_spawn(screen_width, ground_y, rng)
+        variant = AssetManifest.shared().random_obstacle(obstacle_type == 'bird', rng)
+        if variant is None:     # картинок нет - препятствие без спрайта
+            self.add(x, y, width, height, speed, obstacle_type == 'bird')
+            return
+        self.add(x, y, variant.width, variant.height, speed, variant.kind == 'flying', variant.get_sprite())
+
+    def update(self, dt):
+        """Сдвигает все препятствия влево одной операцией.
+
+        Args:
+            dt (float): Длина шага симуляции.
+        """
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.x[:n] -= self.speed[:n] * dt
+
+    def rect(self, i, x=None):
+        """Возвращает прямоугольник строки i.
+
+        Args:
+            i (int): Номер строки.
+            x (float, optional): Координата X вместо текущей.
+
+        Returns:
+            pygame.Rect: Прямоугольник препятствия.
+        """
+        x = float(self.x[i] if x is None else x)
+        return pygame.Rect(round(x), round(float(self.y[i])), int(self.w[i]), int(self.h[i]))
+
+    def collisions(self, player):
+        """Находит препятствия, которых игрок касался за последний шаг.
+
+        Сначала для всех строк сразу считается swept AABB прямоугольников
+        (относительное движение за шаг), затем для немногих кандидатов -
+        точная проверка по маскам, как в swept_collides. Препятствие без
+        картинки (или с картинкой другого размера) - сплошной прямоугольник,
+        как в BaseObject.collides_at.
+
+        Args:
+            player (Player): Игрок (prev_x/prev_y сохранены перед шагом).
+
+        Returns:
+            list: Номера строк столкнувшихся препятствий по возрастанию.
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        start_p, end_p = player.render_rect(0.0), player.rect
+        # движение препятствия относительно игрока (игрок неподвижен в начальном положении)
+        move_x = (self.x[:n] - self.prev_x[:n]) - (end_p.x - start_p.x)
+        move_y = -(end_p.y - start_p.y)
+
+        left = self.prev_x[:n] - 1          # запас в пиксель на округление координат
+        right = self.prev_x[:n] + self.w[:n] + 1
+        top = self.y[:n] - 1
+        bottom = self.y[:n] + self.h[:n] + 1
+
+        enter_x, exit_x = slab_intervals(move_x, left, right, start_p.left, start_p.right)
+        enter_y, exit_y = slab_intervals(np.full(n, move_y, dtype='float64'), top, bottom, start_p.top, start_p.bottom)
+        enter = np.maximum(np.maximum(enter_x, enter_y), 0.0)
+        exit_ = np.minimum(np.minimum(exit_x, exit_y), 1.0)
+        candidates = np.nonzero(enter < exit_)[0]
+
+        player_mask = player.get_mask()
+        if player_mask is None:
+            player_mask = SpriteLoader.cache.rect_mask(player.rect.size)
+
+        hits = []
+        for i in candidates.tolist():
+            sprite = self.sprites[i]
+            if sprite is not None and sprite.get_size() == (self.w[i], self.h[i]):
+                mask = SpriteLoader.cache.mask_for(sprite)
+                test = lambda a, b, mask=mask: (a.colliderect(b)
+                                                and player_mask.overlap(mask, (b.x - a.x, b.y - a.y)) is not None)
+            else:
+                test = lambda a, b: a.colliderect(b) and masks_collide(a, player_mask, b, None)
+            if sweep_test(test, start_p, end_p, self.rect(i, self.prev_x[i]), self.rect(i)):
+                hits.append(i)
+        return hits
+
+    def mark_passed(self, player_x):
+        """Отмечает препятствия, которые игрок прошел.
+
+        Args:
+            player_x (int): Левая координата игрока.
+
+        Returns:
+            int: Сколько препятствий пройдено за этот шаг.
+        """
+        n = self.count
+        newly = ~self.passed[:n] & (np.rint(self.x[:n]) + self.w[:n] < player_x)
+        self.passed[:n] |= newly
+        return int(np.count_nonzero(newly))
+
+    def remove(self, rows):
+        """Удаляет строки (например, столкнувшиеся препятствия).
+
+        Args:
+            rows (list): Номера строк.
+        """
+        if len(rows):
+            keep = np.ones(self.count, dtype=bool)
+            keep[rows] = False
+            self._compact(keep)
+
+    def cull(self):
+        """Удаляет препятствия, ушедшие за левый край экрана.
+
+        Returns:
+            int: Сколько препятствий удалено.
+        """
+        n = self.count
+        keep = np.rint(self.x[:n]) >= -self.w[:n]
+        removed = n - int(np.count_nonzero(keep))
+        if removed:
+            self._compact(keep)
+        return removed
+
+    def _compact(self, keep):
+        """Сдвигает оставшиеся строки в начало массивов (одна операция на поле)."""
+        n = self.count
+        for name, _ in self.FIELDS:
+            array = getattr(self, name)
+            kept = array[:n][keep]
+            array[:len(kept)] = kept
+        self.sprites = [sprite for sprite, alive in zip(self.sprites, keep.tolist()) if alive]
+        self.count = len(self.sprites)
+
+    def clear(self):
+        """Удаляет все препятствия."""
+        self.count = 0
+        self.sprites = []
+
+    def draw(self, screen, alpha=1.0):
+        """Рисует все препятствия одним пакетным вызовом.
+
+        Args:
+            screen (pygame.Surface): Поверхность для отрисовки.
+            alpha (float, optional): Доля шага для интерполяции положения.
+
+        Returns:
+            list: Прямоугольники нарисованных препятствий.
+        """
+        n = self.count
+        xs = np.rint(self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha).astype(int).tolist()
+        ys = np.rint(self.y[:n]).astype(int).tolist()
+        return screen.blits([(sprite, (x, y)) for sprite, x, y in zip(self.sprites, xs, ys) if sprite is not None])
+
+    def __len__(self):
+        return self.count
+
@@ -0,0 +1,115 @@
+"""Модуль obstacle_pool - пул переиспользуемых препятствий.
+
+Содержит класс ObstaclePool. Вместо создания нового объекта Obstacle
+на каждое появление препятствия (новый Rect, словарь спрайтов, выбор
+спрайта) и выбрасывания старых сборщику мусора, ушедшие препятствия
+возвращаются в пул и при следующем появлении настраиваются заново
+методом Obstacle.reset. После разогрева игра не создает объектов
+препятствий совсем.
+"""
+
+import random
+from .obstacle import Obstacle
+
+
+class ObstaclePool:
+    """Пул объектов Obstacle фиксированной емкости.
+
+    Attributes:
+        capacity (int): Сколько свободных препятствий пул хранит для повторного использования.
+        free (list): Свободные препятствия.
+        in_use (int): Сколько выданных препятствий еще не возвращено.
+        high_water (int): Наибольшее in_use за все время.
+        created (int): Сколько объектов Obstacle создано пулом.
+        reused (int): Сколько раз препятствие выдано повторно.
+        overflow (int): Сколько раз пул был пуст и выданных было уже capacity или больше
+            (такие препятствия создаются сверх емкости).
+    """
+
+    def __init__(self, capacity=16):
+        """Инициализация пустого пула.
+
+        Args:
+            capacity (int, optional): Емкость пула. По умолчанию 16 - на экране
+                одновременно бывает всего несколько препятствий.
+        """
+        self.capacity = capacity
+        self.free = []
+        self.in_use = 0
+        self.high_water = 0
+        self.created = 0
+        self.reused = 0
+        self.overflow = 0
+
+    def acquire(self, x, y, width=60, height=80, color=(200, 50, 50), speed=300, obstacle_type=None, rng=random,
+                variant=None):
+        """Выдает препятствие с заданными параметрами.
+
+        Аргументы те же, что у конструктора Obstacle.
+
+        Returns:
+            Obstacle: Свободное препятствие из пула или новое, если свободных нет.
+        """
+        if self.free:
+            obstacle = self.free.pop()
+            obstacle.reset(x, y, width, height, color, speed, obstacle_type, rng, variant)
+            self.reused += 1
+        else:
+            if self.in_use >= self.capacity:
+                self.overflow += 1  #пул мал для такой игры - объект создается сверх емкости
+            obstacle = Obstacle(x, y, width, height, color, speed, obstacle_type, rng, variant)
+            self.created += 1
+
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return obstacle
+
+    def acquire_random(self, screen_width, ground_y, speed, rng=random):
+        """Выдает случайное препятствие (как Obstacle.create_random).
+
+        Args:
+            screen_width (int): Ширина экрана.
+            ground_y (int): Координата Y уровня земли.
+            speed (int): Скорость движения препятствия.
+            rng (random.Random, optional): Генератор случайных чисел игры.
+
+        Returns:
+            Obstacle: Препятствие за правым краем экрана.
+        """
+        x, y, width, height, color, obstacle_type = Obstacle.random_spawn(screen_width, ground_y, rng)
+        return self.acquire(x, y, width, height, color, speed, obstacle_type, rng)
+
+    def release(self, obstacle):
+        """Возвращает препятствие в пул.
+
+        Args:
+            obstacle (Obstacle): Препятствие, которое больше не используется.
+        """
+        self.in_use = max(0, self.in_use - 1)
+        if len(self.free) < self.capacity: #лишние объекты сверх емкости отдаются сборщику мусора
+            self.free.append(obstacle)
+
+    def release_all(self, obstacles):
+        """Возвращает в пул все препятствия из списка.
+
+        Args:
+            obstacles (list): Препятствия, которые больше не используются.
+        """
+        for obstacle in obstacles:
+            self.release(obstacle)
+
+    def stats(self):
+        """Возвращает статистику заполнения пула.
+
+        Returns:
+            dict: in_use, free, high_water, capacity, created, reused, overflow.
+        """
+        return {
+            'in_use': self.in_use,
+            'free': len(self.free),
+            'high_water': self.high_water,
+            'capacity': self.capacity,
+            'created': self.created,
+            'reused': self.reused,
+            'overflow': self.overflow
+        }
@@ -12,6 +12,14 @@ from .sprite_loader import SpriteLoader
 
 class Player(BaseObject):   # Класс игрока, управдяемого пользователем
     """Класс игрока, управляемого пользователем."""
+
+    RUN_FILES = ("run1.png", "run2.png")    # Кадры анимации бега
+    JUMP_FILE = "jump.png"                  # Кадр прыжка
+
+    # Слоты для атрибутов игрока (атрибуты BaseObject объявлены в нем самом)
+    __slots__ = ('gravity', 'jump_force', 'velocity_y', 'is_jumping', 'ground_y', 'invulnerable',
+                 'invulnerable_timer', 'blink_timer', 'visible', 'animation_frame_time')
+
     def __init__(self, x, y, width=90, height=120):    # Инициализация игрока
         # Вызываем конструктор родительского класса BaseObject
         # с начальной позицией, размером и цветом по умолчанию
@@ -58,8 +66,8 @@ class Player(BaseObject):   # Класс игрока, управдяемого
 
         # Анимация бега
         run_sprites = []  # Список для хранения кадров анимации бега
-        for i in range(1, 3) :  # Ожидаем файлы run1.png и run2.png
-            sprite_file = os.path.join(player_path, f"run{i}.png")
+        for file_name in self.RUN_FILES :  # Ожидаем файлы run1.png и run2.png
+            sprite_file = os.path.join(player_path, file_name)
             # Пытаемся загрузить и масштабировать спрайт
             sprite = SpriteLoader.load_sprite(sprite_file, self.width, self.height)
             if sprite :  # Если спрайт успешно загружен
@@ -69,7 +77,7 @@ class Player(BaseObject):   # Класс игрока, управдяемого
             self.sprites["run"] = run_sprites
 
         # Спрайт прыжка
-        jump_sprite = os.path.join(player_path, "jump.png")
+        jump_sprite = os.path.join(player_path, self.JUMP_FILE)
         sprite = SpriteLoader.load_sprite(jump_sprite, self.width, self.height)
         if sprite:
             self.sprites["jump"] = [sprite]     # Спрайт прыжка - один кадр
@@ -78,6 +86,22 @@ class Player(BaseObject):   # Класс игрока, управдяемого
         if not any(self.sprites.values()):
             self._create_fallback_sprites()     # Создаем простую графику (запасной вариант)
 
+    def sprite_requests(width=90, height=120):
+        """Возвращает спрайты игрока, которые нужно загрузить заранее.
+
+        Args:
+            width (int): Ширина игрока. По умолчанию 90.
+            height (int): Высота игрока. По умолчанию 120.
+
+        Returns:
+            list: Список кортежей (путь, ширина, высота).
+        """
+        player_path = os.path.join(SpriteLoader.get_assets_path(), 'player')
+        return [(os.path.join(player_path, file_name), width, height)
+                for file_name in Player.RUN_FILES + (Player.JUMP_FILE,)]
+
+    sprite_requests = staticmethod(sprite_requests)
+
     def _create_fallback_sprites(self):
         """Создание простой графики если нет спрайтов"""
         # Анимация бега - первый кадр
@@ -129,21 +153,27 @@ class Player(BaseObject):   # Класс игрока, управдяемого
         Args:
             dt (float): Время, прошедшее с прошлого кадра.
         """
+        # Положение могли задать напрямую через rect - подхватываем его
+        self.sync_position()
+
         # Применяем гравитацию - увеличиваем вертикальную скорость
         self.velocity_y += self.gravity * dt
 
-        # Обновляем позицию - двигаем игрока по вертикали
-        self.rect.y += self.velocity_y * dt
+        # Обновляем позицию - двигаем игрока по вертикали (дробное положение: малые смещения не теряются)
+        self.pos_y += self.velocity_y * dt
 
         # Проверяем, стоит ли игрок на земле
-        if self.rect.y >= self.ground_y:    # Если игрок ниже уровня земли - ставим его на землю
-            self.rect.y = self.ground_y
+        if self.pos_y >= self.ground_y:    # Если игрок ниже уровня земли - ставим его на землю
+            self.pos_y = self.ground_y
             self.velocity_y = 0  # Сбрасываем скорость
             self.is_jumping = False  # Сбрасываем флаг прыжка
 
             if self.current_animation != "run":     # Если не проигрывается анимация бега - переключаемся на нее
                 self.set_animation("run")
 
+        # rect пересчитывается из точного положения один раз за шаг
+        self.update_rect()
+
         # Обновляем анимацию    (вызываем метод родительского класса)
         super().update_animation(dt)
 
@@ -169,22 +199,27 @@ class Player(BaseObject):   # Класс игрока, управдяемого
                 self.invulnerable = False  # Выключаем неуязвимость
                 self.visible = True  # Гарантируем видимость
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """Отрисовывает игрока с учетом неуязвимости.
 
         Args:
             screen (pygame.Surface): Поверхность для отрисовки.
+            alpha (float, optional): Доля шага симуляции для интерполяции положения.
+
+        Returns:
+            pygame.Rect: Область экрана с игроком (None, если игрок сейчас не виден).
         """
         # Рисуем игрока только если:
         # 1. Он не неуязвим, ИЛИ
         # 2. Он неуязвим, но сейчас должен быть виден (мерцание)
         if not self.invulnerable or (self.invulnerable and self.visible) :
-            super().draw(screen)      # Вызываем метод отрисовки родительского класса
+            return super().draw(screen, alpha)      # Вызываем метод отрисовки родительского класса
+        return None
 
 
     def reset(self):
             """Сброс состояния игрока"""
-            self.rect.y = self.ground_y  # Возвращаем на уровень земли
+            self.set_position(self.rect.x, self.ground_y)  # Возвращаем на уровень земли без интерполяции
             self.velocity_y = 0  # Сбрасываем скорость
             self.is_jumping = False  # Сбрасываем флаг прыжка
             self.invulnerable = False  # Выключаем неуязвимость
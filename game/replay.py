@@ -0,0 +1,398 @@
+"""Модуль replay - запись и повтор игры по нажатиям.
+
+Игра детерминирована: одно зерно генератора случайных чисел и одни и те же
+нажатия на тех же шагах симуляции дают ту же самую игру. Поэтому повтор
+хранит не кадры, а только зерно, параметры игры и список нажатий с номерами
+шагов - обычно несколько сотен байт на игру.
+
+Формат файла (little-endian):
+    заголовок   - "MRPL", версия, хранилище препятствий, зерно, шагов в секунду,
+                  ширина, высота, начальная скорость, флаги (с версии 2:
+                  бит 0 - препятствия из SpawnSchedule);
+    нажатия     - количество и сами нажатия: каждое - одно число varint
+                  (шагов от прошлого нажатия << 2 | код действия);
+    итог        - последний шаг, счет, скорость, жизни и контрольная сумма
+                  состояния, по которой проверяется точность повтора.
+"""
+
+import struct
+import zlib
+from .game_manager import GameManager
+
+
+ACTIONS = ('jump', 'pause', 'restart')      # код действия в файле - индекс в кортеже
+
+
+def _write_varint(out, value):
+    """Дописывает неотрицательное число в формате varint (7 бит на байт)."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    """Читает число varint.
+
+    Returns:
+        tuple: (число, позиция после него).
+    """
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Файл повтора обрезан")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def state_digest(game):
+    """Считает контрольную сумму состояния игры.
+
+    В сумму входят шаг, счет, жизни, скорость, таймеры, положение игрока,
+    положения препятствий и состояние генератора случайных чисел. Числа
+    берутся побитово, поэтому совпадение суммы означает точный повтор.
+
+    Args:
+        game (GameManager): Менеджер игры.
+
+    Returns:
+        int: CRC32 состояния.
+    """
+    player = game.player
+    values = [game.tick, game.score, game.lives, game.game_speed, game.obstacle_interval, game.obstacle_timer,
+              player.pos_y, player.velocity_y, player.invulnerable_timer]
+    if game.obstacle_array is not None:
+        count = len(game.obstacle_array)
+        values += game.obstacle_array.x[:count].tolist() + game.obstacle_array.y[:count].tolist()
+    else:
+        for obstacle in game.obstacles:
+            values += [obstacle.pos_x, obstacle.pos_y]
+    data = struct.pack(f'<{len(values)}d', *map(float, values))
+    return zlib.crc32(repr(game.rng.getstate()).encode(), zlib.crc32(data))
+
+
+class Replay:
+    """Повтор игры: параметры, нажатия и итог.
+
+    Attributes:
+        seed (int): Зерно генератора случайных чисел игры.
+        tick_rate (int): Шагов симуляции в секунду.
+        width (int): Ширина игрового поля.
+        height (int): Высота игрового поля.
+        speed (int): Начальная скорость.
+        obstacle_backend (str): Хранилище препятствий ('list' или 'array').
+        spawn_schedule (bool): Препятствия брались из SpawnSchedule.
+        inputs (list): Нажатия - кортежи (шаг, действие).
+        end_tick (int): Шаг, на котором запись закончилась.
+        result (dict): Результат игры get_game_result() в конце записи.
+        digest (int): Контрольная сумма состояния в конце записи (state_digest).
+    """
+
+    MAGIC = b'MRPL'
+    VERSION = 2
+    BACKENDS = ('list', 'array')
+    HEADER = struct.Struct('<4sBBIHHHHB')    # метка, версия, хранилище, зерно, шаги/с, ширина, высота, скорость, флаги
+    HEADER_V1 = struct.Struct('<4sBBIHHHH')  # версия 1 - без флагов (такие файлы тоже читаются)
+    FOOTER = struct.Struct('<IiHhI')         # последний шаг, счет, скорость, жизни, контрольная сумма
+    FIELD_RANGE = 2 ** 16                    # шаги/с, ширина, высота и скорость в заголовке - uint16
+
+    def __init__(self, seed, tick_rate=120, width=1200, height=800, speed=400, obstacle_backend='list',
+                 spawn_schedule=False):
+        """Инициализация пустого повтора.
+
+        Args:
+            seed (int): Зерно генератора случайных чисел игры.
+            tick_rate (int, optional): Шагов симуляции в секунду. По умолчанию 120.
+            width (int, optional): Ширина игрового поля. По умолчанию 1200.
+            height (int, optional): Высота игрового поля. По умолчанию 800.
+            speed (int, optional): Начальная скорость. По умолчанию 400.
+            obstacle_backend (str, optional): 'list' или 'array'. По умолчанию 'list'.
+            spawn_schedule (bool, optional): Препятствия из SpawnSchedule. По умолчанию False.
+
+        Raises:
+            ValueError: Если параметр не помещается в заголовок (проверяется сразу,
+                а не при сохранении - иначе запись всей игры пропала бы).
+        """
+        for name, value in (('tick_rate', tick_rate), ('width', width), ('height', height), ('speed', speed)):
+            if not 0 <= value < self.FIELD_RANGE:
+                raise ValueError(f"{name} must be in 0..{self.FIELD_RANGE - 1} to be recorded, got {value}")
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.width = width
+        self.height = height
+        self.speed = speed
+        self.obstacle_backend = obstacle_backend
+        self.spawn_schedule = spawn_schedule
+        self.inputs = []
+        self.end_tick = 0
+        self.result = None
+        self.digest = 0
+
+    def add(self, tick, action):
+        """Добавляет нажатие.
+
+        Args:
+            tick (int): Номер шага, перед которым нажатие сработало.
+            action (str): 'jump', 'pause' или 'restart'.
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"Неизвестное действие: {action}")
+        self.inputs.append((tick, action))
+
+    def finish(self, game):
+        """Запоминает итог игры в конце записи.
+
+        Args:
+            game (GameManager): Записанная игра.
+        """
+        self.end_tick = game.tick
+        self.result = game.get_game_result()
+        self.digest = state_digest(game)
+
+    def matches(self, game):
+        """Проверяет, что повтор закончился тем же состоянием, что и запись.
+
+        Args:
+            game (GameManager): Игра после воспроизведения.
+
+        Returns:
+            bool: True если шаг, результат и контрольная сумма совпали.
+        """
+        return (game.tick == self.end_tick and game.get_game_result() == self.result
+                and state_digest(game) == self.digest)
+
+    def to_bytes(self):
+        """Упаковывает повтор в компактный двоичный вид.
+
+        Returns:
+            bytes: Содержимое файла повтора.
+        """
+        out = bytearray(self.HEADER.pack(self.MAGIC, self.VERSION, self.BACKENDS.index(self.obstacle_backend),
+                                         self.seed, self.tick_rate, self.width, self.height, self.speed,
+                                         int(self.spawn_schedule)))
+        _write_varint(out, len(self.inputs))
+        last_tick = 0
+        for tick, action in self.inputs:
+            _write_varint(out, (tick - last_tick) << 2 | ACTIONS.index(action))
+            last_tick = tick
+
+        result = self.result or {'score': 0, 'speed': self.speed, 'lives': 0}
+        out += self.FOOTER.pack(self.end_tick, result['score'], result['speed'], result['lives'], self.digest)
+        return bytes(out)
+
+    def from_bytes(data):
+        """Читает повтор из двоичного вида.
+
+        Args:
+            data (bytes): Содержимое файла повтора.
+
+        Returns:
+            Replay: Прочитанный повтор.
+
+        Raises:
+            ValueError: Если это не файл повтора, версия не поддерживается или файл обрезан.
+        """
+        if len(data) < Replay.HEADER.size + Replay.FOOTER.size:
+            raise ValueError("Файл повтора обрезан")
+        magic, version, backend, seed, tick_rate, width, height, speed = Replay.HEADER_V1.unpack_from(data)
+        if magic != Replay.MAGIC:
+            raise ValueError("Это не файл повтора Moti Runner")
+        if version not in (1, Replay.VERSION):
+            raise ValueError(f"Неподдерживаемая версия повтора: {version}")
+        header = Replay.HEADER if version == Replay.VERSION else Replay.HEADER_V1
+        flags = data[Replay.HEADER_V1.size] if version == Replay.VERSION else 0
+
+        replay = Replay(seed, tick_rate, width, height, speed, Replay.BACKENDS[backend], bool(flags & 1))
+        count, pos = _read_varint(data, header.size)
+        tick = 0
+        for _ in range(count):
+            value, pos = _read_varint(data, pos)
+            tick += value >> 2
+            replay.inputs.append((tick, ACTIONS[value & 3]))
+
+        if len(data) - pos != Replay.FOOTER.size:
+            raise ValueError("Файл повтора поврежден")
+        replay.end_tick, score, result_speed, lives, replay.digest = Replay.FOOTER.unpack_from(data, pos)
+        replay.result = {'score': score, 'speed': result_speed, 'lives': lives}
+        return replay
+
+    from_bytes = staticmethod(from_bytes)
+
+    def save(self, path):
+        """Сохраняет повтор в файл.
+
+        Args:
+            path (str): Путь к файлу.
+
+        Returns:
+            int: Размер файла в байтах.
+        """
+        data = self.to_bytes()
+        with open(path, 'wb') as file:
+            file.write(data)
+        return len(data)
+
+    def load(path):
+        """Загружает повтор из файла.
+
+        Args:
+            path (str): Путь к файлу.
+
+        Returns:
+            Replay: Прочитанный повтор.
+        """
+        with open(path, 'rb') as file:
+            return Replay.from_bytes(file.read())
+
+    load = staticmethod(load)
+
+
+class ReplayRecorder:
+    """Записывает нажатия игры в Replay.
+
+    Подключается к GameManager через атрибут recorder: handle_events
+    сообщает о каждом нажатии вместе с номером шага (GameManager.record_input).
+
+    Attributes:
+        game (GameManager): Записываемая игра.
+        replay (Replay): Повтор, который заполняется.
+    """
+
+    def __init__(self, game, tick_rate=120):
+        """Создает запись и подключает ее к игре.
+
+        Подключать нужно до первого шага: параметры игры берутся в момент создания.
+
+        Args:
+            game (GameManager): Записываемая игра.
+            tick_rate (int, optional): Шагов симуляции в секунду. По умолчанию 120.
+
+        Raises:
+            ValueError: Если параметры игры не помещаются в заголовок Replay.
+        """
+        backend = 'list' if game.obstacle_array is None else 'array'
+        self.game = game
+        self.replay = Replay(game.seed, tick_rate, game.screen_width, game.screen_height,
+                             int(game.game_speed), backend, game.spawn_schedule is not None)
+        game.recorder = self
+
+    def record(self, tick, action):
+        """Добавляет нажатие (вызывается из GameManager.record_input).
+
+        Args:
+            tick (int): Номер шага.
+            action (str): 'jump', 'pause' или 'restart'.
+        """
+        self.replay.add(tick, action)
+
+    def save(self, path):
+        """Завершает запись и сохраняет ее в файл.
+
+        Args:
+            path (str): Путь к файлу.
+
+        Returns:
+            int: Размер файла в байтах.
+        """
+        self.replay.finish(self.game)
+        return self.replay.save(path)
+
+
+class ReplayPlayer:
+    """Воспроизводит нажатия из Replay в игре.
+
+    Перед каждым шагом симуляции нужно вызвать apply_due(): он выполняет
+    нажатия, записанные на текущем шаге, в том же порядке, что и при записи.
+
+    Attributes:
+        replay (Replay): Воспроизводимый повтор.
+        game (GameManager): Игра, созданная с теми же параметрами и зерном.
+        index (int): Номер следующего нажатия.
+    """
+
+    def __init__(self, replay, game):
+        """Инициализация проигрывателя.
+
+        Args:
+            replay (Replay): Повтор.
+            game (GameManager): Игра с зерном и параметрами повтора (см. create_game).
+        """
+        self.replay = replay
+        self.game = game
+        self.index = 0
+
+    def create_game(replay, headless=False):
+        """Создает игру с параметрами и зерном повтора.
+
+        Args:
+            replay (Replay): Повтор.
+            headless (bool, optional): Игра без окна и звука. По умолчанию False.
+
+        Returns:
+            GameManager: Новая игра.
+        """
+        return GameManager(replay.width, replay.height, replay.speed, replay.obstacle_backend,
+                           headless=headless, seed=replay.seed, spawn_schedule=replay.spawn_schedule)
+
+    create_game = staticmethod(create_game)
+
+    def apply_due(self):
+        """Выполняет нажатия, записанные на текущем шаге игры.
+
+        Returns:
+            int: Сколько нажатий выполнено.
+        """
+        inputs = self.replay.inputs
+        applied = 0
+        while self.index < len(inputs) and inputs[self.index][0] <= self.game.tick:
+            action = inputs[self.index][1]
+            if action == 'jump':
+                self.game.jump()
+            elif action == 'pause':
+                self.game.toggle_pause()
+            elif self.game.game_over: #рестарт, как и клавиша R, работает только после Game Over
+                self.game.reset_game()
+            self.index += 1
+            applied += 1
+        return applied
+
+    def done(self):
+        """Проверяет, закончился ли повтор (вызывать после apply_due).
+
+        Returns:
+            bool: True если все нажатия выполнены и достигнут последний шаг записи,
+            или игра стоит (пауза, Game Over) и нажатий, которые ее продолжат, больше нет.
+        """
+        finished = self.index == len(self.replay.inputs) and self.game.tick >= self.replay.end_tick
+        return finished or self.game.is_idle()
+
+    def run(self):
+        """Проигрывает повтор до конца с максимальной скоростью.
+
+        Returns:
+            dict: Результат игры get_game_result().
+        """
+        step_dt = 1.0 / self.replay.tick_rate
+        while True:
+            self.apply_due()
+            if self.done():
+                return self.game.get_game_result()
+            self.game.update(step_dt)
+
+
+def play_headless(replay):
+    """Проигрывает повтор без окна и звука так быстро, как возможно.
+
+    Args:
+        replay (Replay): Повтор.
+
+    Returns:
+        GameManager: Игра после воспроизведения (сравнить - replay.matches(game)).
+    """
+    player = ReplayPlayer(replay, ReplayPlayer.create_game(replay, headless=True))
+    player.run()
+    return player.game
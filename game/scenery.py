@@ -0,0 +1,34 @@
+"""Модуль scenery - легкие записи для декораций фона.
+
+Содержит класс Cloud - запись об облаке. Раньше облака хранились
+словарями {'x', 'y', 'speed'}, и при отрисовке каждое поле искалось
+по строковому ключу. Запись со слотами занимает меньше памяти, а поля
+читаются как обычные атрибуты.
+"""
+
+
+class Cloud:
+    """Облако на фоне.
+
+    Attributes:
+        x (int): Координата X левого верхнего угла.
+        y (int): Координата Y левого верхнего угла.
+        speed (int): Скорость облака.
+    """
+
+    __slots__ = ('x', 'y', 'speed')
+
+    def __init__(self, x, y, speed):
+        """Инициализация облака.
+
+        Args:
+            x (int): Координата X левого верхнего угла.
+            y (int): Координата Y левого верхнего угла.
+            speed (int): Скорость облака.
+        """
+        self.x = x
+        self.y = y
+        self.speed = speed
+
+    def __repr__(self):
+        return f"Cloud(x={self.x}, y={self.y}, speed={self.speed})"
@@ -0,0 +1,96 @@
+"""Модуль simulation - игра без окна быстрее реального времени.
+
+Содержит класс Simulation. Он создает GameManager в режиме headless
+(без окна, шрифтов и звука) и продвигает тот же метод update
+фиксированными шагами так быстро, как позволяет процессор. Прыжки
+задаются списком номеров шагов или функцией-контроллером. Результат -
+тот же словарь, что и GameManager.get_game_result.
+"""
+
+from .game_manager import GameManager
+
+
+class Simulation:
+    """Быстрая симуляция игры без окна и звука.
+
+    Attributes:
+        game (GameManager): Менеджер игры в режиме headless.
+        tick_rate (int): Шагов симуляции в секунду игрового времени.
+        step_dt (float): Длина одного шага в секундах.
+        ticks (int): Сколько шагов уже выполнено.
+        jumps (int): Сколько раз была нажата команда прыжка.
+    """
+
+    def __init__(self, width=1200, height=800, speed=400, tick_rate=120, seed=None, obstacle_backend='list',
+                 spawn_schedule=False):
+        """Инициализация симуляции.
+
+        Args:
+            width (int, optional): Ширина игрового поля. По умолчанию 1200.
+            height (int, optional): Высота игрового поля. По умолчанию 800.
+            speed (int, optional): Начальная скорость. По умолчанию 400.
+            tick_rate (int, optional): Шагов в секунду игрового времени. По умолчанию 120,
+                как у FixedTimestep в главном цикле.
+            seed (int, optional): Зерно генератора случайных чисел игры. None - случайное.
+            obstacle_backend (str, optional): 'list' или 'array', как у GameManager.
+            spawn_schedule (bool, optional): Препятствия из SpawnSchedule, как у GameManager.
+        """
+        #одно и то же зерно - одна и та же игра
+        self.game = GameManager(width, height, speed, obstacle_backend, headless=True, seed=seed,
+                                spawn_schedule=spawn_schedule)
+        self.game.is_paused = False #игра в окне стартует на паузе, симуляция - сразу
+        self.tick_rate = tick_rate
+        self.step_dt = 1.0 / tick_rate
+        self.ticks = 0
+        self.jumps = 0
+
+    def step(self, jump=False):
+        """Выполняет один шаг симуляции.
+
+        Args:
+            jump (bool, optional): Нажать прыжок перед шагом (как пробел в окне).
+
+        Returns:
+            bool: True если игра окончена.
+        """
+        if jump:
+            self.game.jump()
+            self.jumps += 1
+        self.game.update(self.step_dt)
+        self.ticks += 1
+        return self.game.game_over
+
+    def run(self, jumps=(), controller=None, max_ticks=None):
+        """Играет до конца игры или до ограничения по шагам.
+
+        Args:
+            jumps (iterable, optional): Номера шагов, перед которыми нажимается прыжок.
+            controller (callable, optional): Функция controller(game, tick) -> bool,
+                которая перед каждым шагом решает, прыгать ли.
+            max_ticks (int, optional): Наибольшее число шагов (всего, вместе с уже
+                выполненными). None - без ограничения.
+
+        Returns:
+            dict: Результат игры - то же, что GameManager.get_game_result().
+        """
+        jumps = set(jumps)
+        while not self.game.game_over and (max_ticks is None or self.ticks < max_ticks):
+            jump = self.ticks in jumps or (controller is not None and controller(self.game, self.ticks))
+            self.step(jump)
+        return self.result()
+
+    def result(self):
+        """Возвращает текущий результат игры.
+
+        Returns:
+            dict: Словарь GameManager.get_game_result() (счет, скорость, жизни).
+        """
+        return self.game.get_game_result()
+
+    def game_time(self):
+        """Возвращает просимулированное игровое время.
+
+        Returns:
+            float: Секунды игрового времени.
+        """
+        return self.ticks * self.step_dt
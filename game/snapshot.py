@@ -0,0 +1,418 @@
+"""Модуль snapshot - двоичный снимок состояния игры и восстановление из него.
+
+Снимок хранит все, что нужно, чтобы продолжить игру с того же места:
+счет, жизни, скорость, таймеры, флаги, игрока, препятствия, облака и
+состояние генератора случайных чисел. Картинки не сохраняются: у
+препятствия записывается номер варианта из AssetManifest, а спрайт при
+восстановлении берется из уже загруженных. Игра, восстановленная из
+снимка, дальше идет бит в бит так же, как шла бы исходная.
+
+Формат (little-endian, все записи фиксированного размера):
+    заголовок   - "MSNP", версия, хранилище препятствий, ширина, высота,
+                  зерно, шаг, число препятствий и облаков;
+    игра        - счет, жизни, скорость, интервалы, таймеры, флаги;
+    игрок       - точные и прошлые координаты, скорость, таймеры, анимация, флаги;
+    препятствия - по записи на препятствие;
+    облака      - по записи на облако;
+    генератор   - состояние random.Random (625 чисел) и запасное значение gauss;
+    расписание  - с версии 2, только у игры с SpawnSchedule: номер следующего
+                  куска, очередь, заказанный кусок и состояния проверки
+                  проходимости в конце последнего забранного и заказанного
+                  кусков (скорость, слова множества положений, отрезки
+                  препятствий). В версии 2 вместо состояний - препятствия
+                  хвоста, и проверка после загрузки начинается "с земли".
+"""
+
+import os
+import struct
+from collections import deque
+from concurrent.futures import Future
+from .scenery import Cloud
+from .asset_manifest import AssetManifest
+from .spawn_schedule import ScheduledSpawn
+
+
+ANIMATIONS = (None, 'run', 'jump')      # код анимации игрока - индекс в кортеже
+NO_VARIANT = 0xFFFF                     # у препятствия нет спрайта
+
+
+def _variants():
+    """Все варианты препятствий манифеста в постоянном порядке (наземные, затем летающие).
+
+    Returns:
+        list: Записи AssetEntry.
+    """
+    obstacles = AssetManifest.shared().obstacles
+    return obstacles['ground'] + obstacles['flying']
+
+
+class GameSnapshot:
+    """Запись и восстановление снимков состояния GameManager.
+
+    Все методы статические: снимок - это просто bytes.
+    """
+
+    MAGIC = b'MSNP'
+    VERSION = 3
+    BACKENDS = ('list', 'array')
+    HEADER = struct.Struct('<4sBBHHIIHH')       # метка, версия, хранилище, ширина, высота, зерно, шаг, препятствий, облаков
+    GAME = struct.Struct('<iiddddHB')          # счет, жизни, скорость, интервал, таймеры препятствий и облаков,
+                                                # шаг ускорения, флаги (Game Over, пауза, счет сохранен,
+                                                # звук Game Over, расписание препятствий)
+    PLAYER = struct.Struct('<dddddddddBBB')     # pos_x, pos_y, prev_x, prev_y, скорость, таймеры неуязвимости,
+                                                # мерцания и анимации, время кадра, анимация, кадр, флаги
+    OBSTACLE = struct.Struct('<dddHHdHB')       # pos_x, prev_x, pos_y, ширина, высота, скорость, вариант, флаги
+    CLOUD = struct.Struct('<iii')               # x, y, скорость
+    RNG = struct.Struct('<625IBd')              # состояние Mersenne Twister, есть ли gauss, gauss
+    SCHEDULE = struct.Struct('<IHHHH')          # следующий кусок, в очереди, в заказанном куске,
+                                                # состояний хвоста и заказанного куска
+    SCHEDULE_V2 = struct.Struct('<IHHH')        # версия 2: следующий кусок, в очереди, в хвосте, в заказанном куске
+    SPAWN = struct.Struct('<diiHHHB')           # запас времени, x, y, ширина, высота, вариант, флаги
+    STATE = struct.Struct('<dHH')               # скорость, слов множества положений, отрезков
+    REACH = struct.Struct('<Q')                 # 64 бита множества положений (младшие - первыми)
+    SPAN = struct.Struct('<iiiH')               # первый и последний шаг, верх и высота препятствия
+
+    def capture(game):
+        """Снимает состояние игры.
+
+        Args:
+            game (GameManager): Игра.
+
+        Returns:
+            bytes: Снимок.
+        """
+        variant_of = {entry.get_sprite(): index for index, entry in enumerate(_variants())}
+        obstacles = []
+        if game.obstacle_array is not None:
+            array = game.obstacle_array
+            for i in range(len(array)):
+                flags = bool(array.passed[i]) | bool(array.flying[i]) << 1
+                obstacles.append(GameSnapshot.OBSTACLE.pack(
+                    array.x[i], array.prev_x[i], array.y[i], int(array.w[i]), int(array.h[i]), array.speed[i],
+                    variant_of.get(array.sprites[i], NO_VARIANT), flags))
+        else:
+            for obstacle in game.obstacles:
+                flags = obstacle.passed | obstacle.is_flying << 1 | (obstacle.obstacle_type == 'bird') << 2
+                obstacles.append(GameSnapshot.OBSTACLE.pack(
+                    obstacle.pos_x, obstacle.prev_x, obstacle.pos_y, obstacle.rect.width, obstacle.rect.height,
+                    obstacle.speed, variant_of.get(obstacle.sprite, NO_VARIANT), flags))
+
+        backend = 0 if game.obstacle_array is None else 1
+        flags = (game.game_over | game.is_paused << 1 | hasattr(game, 'score_saved') << 2
+                 | hasattr(game, 'game_over_sound_played') << 3 | (game.spawn_schedule is not None) << 4)
+        player = game.player
+        player_flags = player.is_jumping | player.invulnerable << 1 | player.visible << 2
+        _, internal, gauss = game.rng.getstate()
+
+        parts = [
+            GameSnapshot.HEADER.pack(GameSnapshot.MAGIC, GameSnapshot.VERSION, backend, game.screen_width,
+                                     game.screen_height, game.seed, game.tick, len(obstacles), len(game.clouds)),
+            GameSnapshot.GAME.pack(game.score, game.lives, game.game_speed, game.obstacle_interval,
+                                   game.obstacle_timer, game.cloud_timer, game.speed_increase_interval, flags),
+            GameSnapshot.PLAYER.pack(player.pos_x, player.pos_y, player.prev_x, player.prev_y, player.velocity_y,
+                                     player.invulnerable_timer, player.blink_timer, player.animation_timer,
+                                     player.animation_frame_time, ANIMATIONS.index(player.current_animation),
+                                     player.animation_frame, player_flags),
+        ]
+        parts += obstacles
+        parts += [GameSnapshot.CLOUD.pack(cloud.x, cloud.y, cloud.speed) for cloud in game.clouds]
+        parts.append(GameSnapshot.RNG.pack(*internal, gauss is not None, gauss or 0.0))
+        if game.spawn_schedule is not None:
+            parts.append(GameSnapshot._capture_schedule(game.spawn_schedule, variant_of))
+        return b''.join(parts)
+
+    capture = staticmethod(capture)
+
+    def _capture_schedule(schedule, variant_of):
+        """Упаковывает SpawnSchedule.
+
+        Заказанный кусок дожидается фонового потока и сохраняется целиком: его
+        содержимое не зависит от того, когда поток его досчитал.
+
+        Returns:
+            bytes: Раздел расписания.
+        """
+        pending, pending_tail = schedule.pending.result() if schedule.pending is not None else ([], {})
+        parts = [GameSnapshot.SCHEDULE.pack(schedule.next_chunk, len(schedule.queue), len(pending),
+                                            len(schedule.tail), len(pending_tail))]
+        for spawn in list(schedule.queue) + pending:
+            flags = (spawn.obstacle_type == 'bird') | spawn.flying << 1
+            parts.append(GameSnapshot.SPAWN.pack(spawn.delay, spawn.x, spawn.y, spawn.width, spawn.height,
+                                                 variant_of.get(spawn.variant and spawn.variant.get_sprite(),
+                                                                NO_VARIANT), flags))
+        for states in (schedule.tail, pending_tail):
+            for speed, (reach, spans) in states.items():
+                words = (reach.bit_length() + 63) // 64
+                parts.append(GameSnapshot.STATE.pack(speed, words, len(spans)))
+                parts += [GameSnapshot.REACH.pack(reach >> 64 * i & 0xFFFFFFFFFFFFFFFF) for i in range(words)]
+                parts += [GameSnapshot.SPAN.pack(*span) for span in spans]
+        return b''.join(parts)
+
+    _capture_schedule = staticmethod(_capture_schedule)
+
+    def read_header(data):
+        """Читает и проверяет заголовок снимка.
+
+        Args:
+            data (bytes): Снимок.
+
+        Returns:
+            tuple: (хранилище, ширина, высота, зерно, шаг, препятствий, облаков).
+
+        Raises:
+            ValueError: Если это не снимок, версия не поддерживается или снимок обрезан.
+        """
+        if len(data) < GameSnapshot.HEADER.size:
+            raise ValueError("Снимок обрезан")
+        magic, version, backend, width, height, seed, tick, obstacles, clouds = GameSnapshot.HEADER.unpack_from(data)
+        if magic != GameSnapshot.MAGIC:
+            raise ValueError("Это не снимок Moti Runner")
+        if version not in (1, 2, GameSnapshot.VERSION):
+            raise ValueError(f"Неподдерживаемая версия снимка: {version}")
+        size = (GameSnapshot.HEADER.size + GameSnapshot.GAME.size + GameSnapshot.PLAYER.size
+                + obstacles * GameSnapshot.OBSTACLE.size + clouds * GameSnapshot.CLOUD.size + GameSnapshot.RNG.size)
+        if version == 2 and len(data) >= size + GameSnapshot.SCHEDULE_V2.size:      # есть раздел расписания
+            _, queued, tail, pending = GameSnapshot.SCHEDULE_V2.unpack_from(data, size)
+            size += GameSnapshot.SCHEDULE_V2.size + (queued + tail + pending) * GameSnapshot.SPAWN.size
+        elif version > 2 and len(data) >= size + GameSnapshot.SCHEDULE.size:
+            _, queued, pending, tail, pending_tail = GameSnapshot.SCHEDULE.unpack_from(data, size)
+            size += GameSnapshot.SCHEDULE.size + (queued + pending) * GameSnapshot.SPAWN.size
+            for _ in range(tail + pending_tail):
+                if len(data) < size + GameSnapshot.STATE.size:
+                    break       #обрезан - ниже размер не совпадет
+                _, words, spans = GameSnapshot.STATE.unpack_from(data, size)
+                size += GameSnapshot.STATE.size + words * GameSnapshot.REACH.size + spans * GameSnapshot.SPAN.size
+        if len(data) != size:
+            raise ValueError("Снимок поврежден")
+        return GameSnapshot.BACKENDS[backend], width, height, seed, tick, obstacles, clouds
+
+    read_header = staticmethod(read_header)
+
+    def restore(game, data):
+        """Восстанавливает игру из снимка.
+
+        Игра должна быть создана с тем же размером поля. Хранилище препятствий
+        может отличаться - препятствия переносятся в текущее, но точный повтор
+        гарантирован только с тем же хранилищем (как и у повторов Replay).
+
+        Args:
+            game (GameManager): Игра, в которую загружается состояние.
+            data (bytes): Снимок GameSnapshot.capture.
+
+        Raises:
+            ValueError: Если снимок поврежден или сделан для другого размера поля.
+        """
+        _, width, height, seed, tick, obstacle_count, cloud_count = GameSnapshot.read_header(data)
+        if (width, height) != (game.screen_width, game.screen_height):
+            raise ValueError(f"Снимок сделан для поля {width}x{height}")
+        pos = GameSnapshot.HEADER.size
+        if bool(GameSnapshot.GAME.unpack_from(data, pos)[-1] & 16) != (game.spawn_schedule is not None):
+            raise ValueError("Снимок и игра различаются расписанием препятствий (spawn_schedule)")
+
+        (game.score, game.lives, game.game_speed, game.obstacle_interval, game.obstacle_timer, game.cloud_timer,
+         game.speed_increase_interval, flags) = GameSnapshot.GAME.unpack_from(data, pos)
+        pos += GameSnapshot.GAME.size
+        game.seed = seed
+        game.tick = tick
+        game.game_over = bool(flags & 1)
+        game.is_paused = bool(flags & 2)
+        GameSnapshot._set_flag(game, 'score_saved', flags & 4)
+        GameSnapshot._set_flag(game, 'game_over_sound_played', flags & 8)
+        game.frozen_frame = None #сцена изменилась - кадр паузы собирается заново
+
+        pos = GameSnapshot._restore_player(game.player, data, pos)
+
+        variants = _variants()
+        game.obstacle_pool.release_all(game.obstacles)
+        game.obstacles = []
+        if game.obstacle_array is not None:
+            game.obstacle_array.clear()
+        for _ in range(obstacle_count):
+            x, prev_x, y, width, height, speed, variant, flags = GameSnapshot.OBSTACLE.unpack_from(data, pos)
+            pos += GameSnapshot.OBSTACLE.size
+            sprite = variants[variant].get_sprite() if variant < len(variants) else None
+            if game.obstacle_array is not None:
+                array = game.obstacle_array
+                array.add(x, y, width, height, speed, bool(flags & 2), sprite)
+                array.prev_x[len(array) - 1] = prev_x
+                array.passed[len(array) - 1] = bool(flags & 1)
+            else:
+                obstacle = game.obstacle_pool.acquire(x, y, width, height, (255, 255, 255), speed,
+                                                      'bird' if flags & 4 else None, game.rng)
+                obstacle.sprite = sprite #вариант из снимка вместо случайного
+                obstacle.rect.size = (width, height)
+                obstacle.is_flying = bool(flags & 2)
+                obstacle.passed = bool(flags & 1)
+                obstacle.prev_x = prev_x
+                game.obstacles.append(obstacle)
+
+        game.clouds = []
+        for _ in range(cloud_count):
+            game.clouds.append(Cloud(*GameSnapshot.CLOUD.unpack_from(data, pos)))
+            pos += GameSnapshot.CLOUD.size
+
+        #генератор - последним: выдача препятствий из пула выше берет из него случайные числа
+        values = GameSnapshot.RNG.unpack_from(data, pos)
+        game.rng.setstate((3, values[:625], values[626] if values[625] else None))
+        if game.spawn_schedule is not None:
+            game.spawn_schedule.seed = seed #следующие куски считаются от зерна игры из снимка
+            GameSnapshot._restore_schedule(game.spawn_schedule, data, pos + GameSnapshot.RNG.size, variants,
+                                           GameSnapshot.HEADER.unpack_from(data)[1])
+
+    restore = staticmethod(restore)
+
+    def _restore_schedule(schedule, data, pos, variants, version):
+        """Восстанавливает SpawnSchedule: очередь, хвост и уже досчитанный заказанный кусок."""
+        if version == 2:        #хвост - препятствиями, состояний проверки нет
+            schedule.next_chunk, queued, tail, pending = GameSnapshot.SCHEDULE_V2.unpack_from(data, pos)
+            pos += GameSnapshot.SCHEDULE_V2.size
+            tail_states = pending_states = 0
+        else:
+            schedule.next_chunk, queued, pending, tail_states, pending_states = \
+                GameSnapshot.SCHEDULE.unpack_from(data, pos)
+            pos += GameSnapshot.SCHEDULE.size
+            tail = 0
+        spawns = []
+        for _ in range(queued + tail + pending):
+            delay, x, y, width, height, variant, flags = GameSnapshot.SPAWN.unpack_from(data, pos)
+            pos += GameSnapshot.SPAWN.size
+            spawns.append(ScheduledSpawn(delay, x, y, width, height, 'bird' if flags & 1 else None,
+                                         bool(flags & 2), variants[variant] if variant < len(variants) else None))
+        schedule.queue = deque(spawns[:queued])
+        schedule.tail, pos = GameSnapshot._restore_states(data, pos, tail_states)
+        pending_tail, pos = GameSnapshot._restore_states(data, pos, pending_states)
+        schedule.pending = None
+        if pending:
+            schedule.pending = Future()
+            schedule.pending.set_result((spawns[queued + tail:], pending_tail))
+
+    _restore_schedule = staticmethod(_restore_schedule)
+
+    def _restore_states(data, pos, count):
+        """Читает состояния проверки проходимости (хвост куска SpawnSchedule).
+
+        Returns:
+            tuple: (словарь скорость -> состояние, позиция после записей).
+        """
+        states = {}
+        for _ in range(count):
+            speed, words, span_count = GameSnapshot.STATE.unpack_from(data, pos)
+            pos += GameSnapshot.STATE.size
+            reach = 0
+            for i in range(words):
+                reach |= GameSnapshot.REACH.unpack_from(data, pos)[0] << 64 * i
+                pos += GameSnapshot.REACH.size
+            spans = []
+            for _ in range(span_count):
+                spans.append(GameSnapshot.SPAN.unpack_from(data, pos))
+                pos += GameSnapshot.SPAN.size
+            states[speed] = (reach, tuple(spans))
+        return states, pos
+
+    _restore_states = staticmethod(_restore_states)
+
+    def _restore_player(player, data, pos):
+        """Восстанавливает игрока.
+
+        Returns:
+            int: Позиция после записи игрока.
+        """
+        (player.pos_x, player.pos_y, player.prev_x, player.prev_y, player.velocity_y, player.invulnerable_timer,
+         player.blink_timer, player.animation_timer, player.animation_frame_time, animation, player.animation_frame,
+         flags) = GameSnapshot.PLAYER.unpack_from(data, pos)
+        player.current_animation = ANIMATIONS[animation]
+        player.is_jumping = bool(flags & 1)
+        player.invulnerable = bool(flags & 2)
+        player.visible = bool(flags & 4)
+        player.update_rect()
+        return pos + GameSnapshot.PLAYER.size
+
+    _restore_player = staticmethod(_restore_player)
+
+    def _set_flag(game, name, value):
+        """Ставит или убирает разовый флаг GameManager (проверяется через hasattr)."""
+        if value:
+            setattr(game, name, True)
+        elif hasattr(game, name):
+            delattr(game, name)
+
+    _set_flag = staticmethod(_set_flag)
+
+    def save(game, path):
+        """Сохраняет снимок в файл атомарно (сначала во временный, затем переименование).
+
+        Если процесс упадет во время записи, старый снимок останется целым.
+
+        Args:
+            game (GameManager): Игра.
+            path (str): Путь к файлу.
+
+        Returns:
+            int: Размер снимка в байтах.
+        """
+        data = GameSnapshot.capture(game)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
+        return len(data)
+
+    save = staticmethod(save)
+
+    def load(game, path):
+        """Восстанавливает игру из файла снимка.
+
+        Args:
+            game (GameManager): Игра.
+            path (str): Путь к файлу.
+        """
+        with open(path, 'rb') as file:
+            GameSnapshot.restore(game, file.read())
+
+    load = staticmethod(load)
+
+
+class SnapshotHistory:
+    """Последние снимки игры для перемотки назад после столкновения.
+
+    Attributes:
+        interval (int): Через сколько шагов делается снимок.
+        snapshots (collections.deque): Снимки (шаг, bytes), старые вытесняются.
+    """
+
+    def __init__(self, interval=120, keep=10):
+        """Инициализация истории.
+
+        Args:
+            interval (int, optional): Шагов между снимками. По умолчанию 120 (секунда).
+            keep (int, optional): Сколько снимков хранить. По умолчанию 10.
+        """
+        self.interval = interval
+        self.snapshots = deque(maxlen=keep)
+
+    def record(self, game):
+        """Делает снимок, если с прошлого прошло interval шагов (вызывать после шага игры).
+
+        Args:
+            game (GameManager): Игра.
+        """
+        if not game.game_over and (not self.snapshots or game.tick - self.snapshots[-1][0] >= self.interval):
+            self.snapshots.append((game.tick, GameSnapshot.capture(game)))
+
+    def rewind(self, game, ticks):
+        """Возвращает игру на ticks шагов назад (к ближайшему более раннему снимку).
+
+        Args:
+            game (GameManager): Игра.
+            ticks (int): На сколько шагов назад.
+
+        Returns:
+            bool: True если снимок нашелся и игра восстановлена.
+        """
+        target = game.tick - ticks
+        while self.snapshots and self.snapshots[-1][0] > target and len(self.snapshots) > 1:
+            self.snapshots.pop()        #более поздние снимки после перемотки не нужны
+        if not self.snapshots:
+            return False
+        GameSnapshot.restore(game, self.snapshots[-1][1])
+        return True
@@ -2,10 +2,20 @@
 
 Содержит класс SoundManager для управления звуковыми эффектами,
 фоновой музыкой и настройками громкости в игре.
+
+Звуки декодируются один раз: готовый PCM хранится в памяти процесса
+(sound_cache) и на диске (DiskAssetCache), поэтому повторный запуск не
+декодирует MP3. Фоновая музыка - такой же заранее декодированный звук,
+который играет на отдельном зарезервированном канале микшера:
+включение и выключение музыки - это пауза канала, без открытия и
+декодирования файла.
 """
 
 import pygame
 import os
+import time
+from .asset_cache import DiskAssetCache
+from .sprite_loader import SpriteLoader
 
 
 class SoundManager:
@@ -17,8 +27,18 @@ class SoundManager:
         sound_enabled (bool): Флаг: включены ли звуковые эффекты.
         music_enabled (bool): Флаг: включена ли фоновая музыка.
         volume (float): Общая громкость от 0.0 (тихо) до 1.0 (максимум).
+        music (pygame.mixer.Sound): Декодированная фоновая музыка (None - музыка идет потоком из файла).
+        music_channel (pygame.mixer.Channel): Зарезервированный канал музыки.
+        load_time (float): Сколько секунд заняла загрузка звуков в preload.
+        toggle_time (float): Сколько секунд занял последний toggle_music.
+        sound_cache (dict): Общие для процесса уже загруженные звуки: полный путь -> Sound.
     """
 
+    SOUNDS_PATH = os.path.join(SpriteLoader.get_assets_path(), 'sounds')    # Папка со звуками (не зависит от текущей папки)
+    MUSIC_NAME = 'background'    # Звук фоновой музыки
+    MUSIC_CHANNEL = 0            # Канал музыки - зарезервирован, эффекты его не занимают
+    sound_cache = {}    # Звуки, загруженные заранее (например, параллельным загрузчиком)
+
     def __init__(self):     # Инициализация менеджера звуков с настройками по умолчанию
         """Инициализация менеджера звуков с настройками по умолчанию."""
         self.sounds = {}    # Словарь для хранения загруженных звуковых эффектов
@@ -26,6 +46,10 @@ class SoundManager:
         self.sound_enabled = True      # Флаг: включены ли звуковые эффекты
         self.music_enabled = True      # Флаг: включена ли фоновая музыка
         self.volume = 0.5              # Общая громкость от 0.0 (тихо) до 1.0 (максимум)
+        self.music = None              # Декодированная фоновая музыка
+        self.music_channel = None      # Канал, на котором она играет
+        self.load_time = 0.0           # Время загрузки звуков
+        self.toggle_time = 0.0         # Время последнего переключения музыки
 
     def load_sounds(self):
         """Загружает звуки из папки assets/sounds.
@@ -33,24 +57,55 @@ class SoundManager:
         Returns:
             bool: True если хотя бы один звук был загружен, иначе False.
         """
-        sounds_path = "assets/sounds"     # Путь к папке со звуками
+        for path in self.sound_files():       # Проходим по всем звуковым файлам в папке
+            name = os.path.basename(path).split('.')[0]      # Извлекаем имя звука без расширения (например, "jump" из "jump.wav")
+            try:
+                self.sounds[name] = self.load_sound(path)     # Загружаем звук и сохраняем в словарь
+            except:
+                pass     # Если не удалось загрузить файл - пропускаем его
+
+        return len(self.sounds) > 0      # Возвращаем True если хотя бы один звук был загружен
+
+    def sound_files(self):
+        """Возвращает пути ко всем звуковым файлам из папки assets/sounds.
+
+        Returns:
+            list: Список путей к файлам wav и mp3 (пустой, если папки нет).
+        """
+        sounds_path = self.SOUNDS_PATH
 
         if not os.path.exists(sounds_path):     # Проверяем, существует ли папка со звуками
-            return False      # Если папки нет - возвращаем ошибку
+            return []
 
-        for file in os.listdir(sounds_path):       # Проходим по всем файлам в папке
-            if file.endswith('.wav') or file.endswith('.mp3'):       # Фильтруем только звуковые файлы (wav или mp3)
-                name = file.split('.')[0]      # Извлекаем имя звука без расширения (например, "jump" из "jump.wav")
-                try:
-                    path = os.path.join(sounds_path, file)      # Собираем полный путь к файлу
-                    self.sounds[name] = pygame.mixer.Sound(path)     # Загружаем звук и сохраняем в словарь
-                except:
-                    pass     # Если не удалось загрузить файл - пропускаем его
+        return [os.path.join(sounds_path, file) for file in os.listdir(sounds_path)    # Собираем полный путь к файлу
+                if file.endswith('.wav') or file.endswith('.mp3')]      # Фильтруем только звуковые файлы (wav или mp3)
 
-        return len(self.sounds) > 0      # Возвращаем True если хотя бы один звук был загружен
+    def load_sound(self, path):
+        """Загружает один звук, используя дисковый кэш декодированного PCM.
+
+        Args:
+            path (str): Путь к звуковому файлу.
+
+        Returns:
+            pygame.mixer.Sound: Загруженный звук.
+        """
+        sound = SoundManager.sound_cache.get(os.path.abspath(path))
+        if sound is not None:       # Звук уже загружен заранее
+            return sound
+
+        disk_cache = DiskAssetCache.active
+        if disk_cache is not None:
+            sound = disk_cache.read_sound(path)     # Готовый PCM без декодирования MP3
+
+        if sound is None:
+            sound = pygame.mixer.Sound(path)     # Декодируем файл
+            if disk_cache is not None:
+                disk_cache.write_sound(path, sound)     # Сохраняем PCM для следующего запуска
+        SoundManager.sound_cache[os.path.abspath(path)] = sound     # Следующий SoundManager возьмет его из памяти
+        return sound
 
     def preload(self):
-        """Инициализирует звуковую систему и загружает звуки.
+        """Инициализирует звуковую систему, загружает звуки и резервирует канал музыки.
 
         Returns:
             bool: True если инициализация успешна, иначе False.
@@ -63,7 +118,14 @@ class SoundManager:
                 self.music_enabled = False
                 return False      # Возвращаем ошибку
 
-        return self.load_sounds()      # Загружаем звуковые эффекты
+        started = time.perf_counter()
+        loaded = self.load_sounds()      # Загружаем звуковые эффекты и музыку
+        self.music = self.sounds.pop(self.MUSIC_NAME, None)     # Музыка - не эффект: своя громкость и свой канал
+        if self.music is not None:
+            pygame.mixer.set_reserved(self.MUSIC_CHANNEL + 1)       # Эффекты не вытеснят музыку с ее канала
+            self.music_channel = pygame.mixer.Channel(self.MUSIC_CHANNEL)
+        self.load_time = time.perf_counter() - started
+        return loaded
 
     def play_sound(self, name):
         """Воспроизводит звуковой эффект.
@@ -83,9 +145,13 @@ class SoundManager:
         Args:
             loop (int): Количество повторений (-1 для бесконечного).
         """
-        if self.music_enabled:    # Проверяем, включена ли музыка
+        if self.music_enabled and self.music_channel is not None:     # Музыка уже декодирована - просто запускаем канал
+            self.music_channel.play(self.music, loops=loop)
+            self.music_channel.set_volume(self.volume * 0.3)    # Музыка тише звуков (после play - play сбрасывает громкость канала)
+            self.music_playing = True
+        elif self.music_enabled:    # Проверяем, включена ли музыка
             try:
-                music_path = "assets/sounds/background.mp3"    # Путь к файлу фоновой музыки
+                music_path = os.path.join(self.SOUNDS_PATH, self.MUSIC_NAME + '.mp3')    # Путь к файлу фоновой музыки
                 if os.path.exists(music_path):    # Проверяем существование файла
                     pygame.mixer.music.load(music_path)       # Загружаем музыку
                     pygame.mixer.music.set_volume(self.volume * 0.3)    # Устанавливаем громкость (музыка тише звуков)
@@ -103,7 +169,10 @@ class SoundManager:
             volume (float): Громкость от 0.0 до 1.0.
         """
         self.volume = max(0.0, min(1.0, volume))     # Ограничиваем громкость в диапазоне от 0.0 до 1.0
-        pygame.mixer.music.set_volume(self.volume * 0.3)    # Устанавливаем громкость музыки (делаем её тише звуков)
+        if self.music_channel is not None:
+            self.music_channel.set_volume(self.volume * 0.3)
+        else:
+            pygame.mixer.music.set_volume(self.volume * 0.3)    # Устанавливаем громкость музыки (делаем её тише звуков)
 
         for sound in self.sounds.values():    # Устанавливаем громкость для всех звуковых эффектов
             sound.set_volume(self.volume)
@@ -123,18 +192,29 @@ class SoundManager:
         Returns:
             bool: Новое состояние музыки.
         """
+        started = time.perf_counter()
         self.music_enabled = not self.music_enabled    # Меняем состояние музыки на противоположное
 
-        if self.music_enabled and not self.music_playing:     # Если музыку включили и она не играет - запускаем
+        if self.music_channel is not None and self.music_channel.get_sound() is self.music:
+            # Музыка уже на своем канале - пауза и продолжение с того же места
+            if self.music_enabled:
+                self.music_channel.unpause()
+            else:
+                self.music_channel.pause()
+            self.music_playing = self.music_enabled
+        elif self.music_enabled and not self.music_playing:     # Если музыку включили и она не играет - запускаем
             self.play_music()
         elif not self.music_enabled and self.music_playing:   # Если музыку выключили и она играет - останавливаем
-            pygame.mixer.music.stop()
-            self.music_playing = False
+            self.stop_music()
 
+        self.toggle_time = time.perf_counter() - started
         return self.music_enabled    # Возвращаем новое состояние
 
     def stop_music(self):
         """Остановка музыки"""
-        pygame.mixer.music.stop()    # Останавливаем воспроизведение музыки
+        if self.music_channel is not None:
+            self.music_channel.stop()
+        else:
+            pygame.mixer.music.stop()    # Останавливаем воспроизведение музыки
         self.music_playing = False    # Сбрасываем флаг воспроизведения
     
\ No newline at end of file
@@ -0,0 +1,556 @@
+"""Модуль spawn_schedule - расписание препятствий с проверкой проходимости.
+
+Obstacle.random_spawn выбирает каждое препятствие независимо от соседних,
+и на большой скорости подряд выпадают препятствия, которые нельзя пройти
+ни при каком моменте прыжка: например, птица сразу перед костью - над
+костью нужно подняться высоко, а рядом с птицей нельзя. SpawnSchedule
+заранее готовит очередь следующих препятствий кусками по chunk_size.
+Каждое новое препятствие проверяется JumpReachability по дуге прыжка из
+Player.gravity и Player.jump_force от множества положений, в которых
+игрок может оказаться после всех предыдущих препятствий (оно переходит
+и из куска в кусок), на всех скоростях, до которых игра может дойти,
+пока кусок не кончится. Если пройти нельзя, перед препятствием
+добавляется запас времени, а если не помогает и он - препятствие
+выбирается заново; в крайнем случае запас растет, пока препятствие не
+станет проходимым.
+
+Куски считаются в фоновом потоке, а GameManager.update только берет
+следующее препятствие из очереди за O(1). Содержимое куска зависит
+только от зерна игры, номера куска и параметров игры в момент запроса,
+а запрос делается на определенном шаге игры и результат забирается
+тоже на определенном шаге (когда очередь опустела). Поэтому игра с
+расписанием так же детерминирована, как и со случайными препятствиями:
+повторы и снимки работают.
+"""
+
+import math
+import random
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from .asset_manifest import AssetManifest
+from .obstacle import Obstacle
+
+
+class ScheduledSpawn:
+    """Одно препятствие расписания.
+
+    Attributes:
+        delay (float): Запас времени сверх obstacle_interval перед появлением (секунды).
+        x (int): Координата X появления (за правым краем экрана).
+        y (int): Координата Y.
+        width (int): Ширина (размер картинки варианта).
+        height (int): Высота.
+        obstacle_type (str): 'bird' или None, как у Obstacle.
+        flying (bool): Летающий ли вариант.
+        variant (AssetEntry): Вариант из AssetManifest или None, если картинок нет.
+    """
+
+    __slots__ = ('delay', 'x', 'y', 'width', 'height', 'obstacle_type', 'flying', 'variant')
+
+    def __init__(self, delay, x, y, width, height, obstacle_type, flying, variant):
+        """Инициализация препятствия расписания (аргументы - одноименные атрибуты)."""
+        self.delay = delay
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.obstacle_type = obstacle_type
+        self.flying = flying
+        self.variant = variant
+
+    def random(screen_width, ground_y, rng, manifest=None):
+        """Случайное препятствие по тем же правилам, что Obstacle.random_spawn.
+
+        Args:
+            screen_width (int): Ширина экрана.
+            ground_y (int): Координата Y уровня земли.
+            rng (random.Random): Генератор случайных чисел куска.
+            manifest (AssetManifest, optional): Манифест. По умолчанию общий.
+
+        Returns:
+            ScheduledSpawn: Препятствие без запаса времени.
+        """
+        x, y, width, height, _, obstacle_type = Obstacle.random_spawn(screen_width, ground_y, rng)
+        variant = (manifest or AssetManifest.shared()).random_obstacle(obstacle_type == 'bird', rng)
+        if variant is None:     # картинок нет - размер из random_spawn
+            return ScheduledSpawn(0.0, x, y, width, height, obstacle_type, obstacle_type == 'bird', None)
+        return ScheduledSpawn(0.0, x, y, variant.width, variant.height, obstacle_type,
+                              variant.kind == 'flying', variant)
+
+    random = staticmethod(random)
+
+    def with_delay(self, delay):
+        """Копия препятствия с другим запасом времени.
+
+        Returns:
+            ScheduledSpawn: Новое препятствие.
+        """
+        return ScheduledSpawn(delay, self.x, self.y, self.width, self.height, self.obstacle_type,
+                              self.flying, self.variant)
+
+
+class JumpReachability:
+    """Проверка, можно ли пройти подряд идущие препятствия.
+
+    Время идет шагами check_dt. Положение игрока - бит в целом числе: бит 0 -
+    на земле, бит k - k-й шаг прыжка. За шаг с земли можно остаться на земле
+    или прыгнуть, в прыжке - только лететь дальше, с последнего шага прыжка -
+    приземлиться. Множество достижимых положений сдвигается за шаг одной
+    операцией, а положения, в которых игрок задевает препятствие, вычеркиваются
+    маской. Если множество опустело - пройти нельзя.
+
+    Препятствия добавляются по одному (advance): состояние проверки - множество
+    достижимых положений в момент появления последнего препятствия и отрезки
+    шагов, на которых еще летящие препятствия перекрывают игрока. Поэтому
+    каждое препятствие проверяется с тем, что на самом деле может успеть
+    игрок после всех предыдущих, а не "с земли".
+
+    Столкновение считается по прямоугольникам, расширенным на путь за шаг,
+    поэтому проверка строже игры (там - маски): что проходимо здесь,
+    проходимо и в игре.
+
+    Attributes:
+        player_x (int): Левый край игрока.
+        player_width (int): Ширина игрока.
+        player_height (int): Высота игрока.
+        ground_y (int): Верх игрока на земле.
+        check_dt (float): Шаг проверки в секундах.
+        offsets (list): Смещение верха игрока от земли на шагах прыжка 1..N (вверх - меньше нуля).
+        margin (int): Запас в пикселях со всех сторон препятствия.
+    """
+
+    START = (1, ())     # начало игры: игрок на земле, препятствий нет
+
+    def __init__(self, player, check_dt=1 / 120, margin=2):
+        """Инициализация проверки по игроку.
+
+        Args:
+            player (Player): Игрок - из него берутся положение, размер, гравитация и сила прыжка.
+            check_dt (float, optional): Шаг проверки. По умолчанию 1/120 - как шаг игры.
+            margin (int, optional): Запас в пикселях. По умолчанию 2.
+        """
+        self.player_x = player.rect.x
+        self.player_width = player.rect.width
+        self.player_height = player.rect.height
+        self.ground_y = player.ground_y
+        self.check_dt = check_dt
+        self.margin = margin
+        self.offsets = JumpReachability.jump_offsets(player.gravity, player.jump_force, check_dt)
+        self.air = ((1 << len(self.offsets) + 1) - 1) ^ 1     # биты шагов прыжка 1..N
+        self.land = 1 | 1 << len(self.offsets)      # с этих положений следующий шаг - на земле
+        self.bits_cache = {}        # (верх, высота) -> маска height_bits: разных препятствий немного
+        self.steps_cache = {}       # ожидание -> шагов spawn_steps
+
+    def jump_offsets(gravity, jump_force, dt):
+        """Дуга прыжка: смещения верха игрока от земли по шагам.
+
+        Считается как в Player.update: сначала скорость, потом положение.
+
+        Args:
+            gravity (float): Гравитация (пикселей/с²).
+            jump_force (float): Скорость в начале прыжка (отрицательная - вверх).
+            dt (float): Длина шага.
+
+        Returns:
+            list: Смещения на шагах 1..N; на шаге N+1 игрок уже на земле.
+        """
+        offsets = []
+        velocity, y = jump_force, 0.0
+        while True:
+            velocity += gravity * dt
+            y += velocity * dt
+            if y >= 0:
+                return offsets
+            offsets.append(y)
+
+    jump_offsets = staticmethod(jump_offsets)
+
+    def height_bits(self, y, height):
+        """Положения игрока, в которых он по высоте пересекается с препятствием.
+
+        Игрок за шаг проходит путь от прошлого положения до нового, поэтому
+        по высоте берется весь этот отрезок.
+
+        Args:
+            y (int): Верх препятствия.
+            height (int): Высота препятствия.
+
+        Returns:
+            int: Маска положений (бит 0 - на земле, бит k - k-й шаг прыжка).
+        """
+        bits = self.bits_cache.get((y, height))
+        if bits is not None:
+            return bits
+        top, bottom = y - self.margin, y + height + self.margin
+        heights = [0.0] + self.offsets
+        bits = 0
+        for k, offset in enumerate(heights):
+            previous = heights[k - 1] if k else 0.0
+            player_top = self.ground_y + min(offset, previous)
+            player_bottom = self.ground_y + max(offset, previous) + self.player_height
+            if player_top < bottom and player_bottom > top:
+                bits |= 1 << k
+        self.bits_cache[(y, height)] = bits
+        return bits
+
+    def span(self, spawn, speed):
+        """Шаги от появления препятствия, на которых оно по горизонтали перекрывает игрока.
+
+        Args:
+            spawn (ScheduledSpawn): Препятствие.
+            speed (float): Скорость препятствия.
+
+        Returns:
+            tuple: (первый шаг, последний шаг, верх, высота).
+        """
+        dt = self.check_dt
+        reach_x = speed * dt + self.margin      # путь препятствия за шаг и запас
+        enter = (spawn.x - self.player_x - self.player_width - reach_x) / speed
+        leave = (spawn.x + spawn.width - self.player_x + reach_x) / speed
+        return max(1, math.floor(enter / dt)), math.ceil(leave / dt), spawn.y, spawn.height
+
+    def spawn_steps(self, interval, delay):
+        """Шагов игры между появлениями препятствий (как таймер в GameManager.update).
+
+        Args:
+            interval (float): obstacle_interval игры.
+            delay (float): Запас времени препятствия.
+
+        Returns:
+            int: Шагов от прошлого препятствия до этого.
+        """
+        wait = interval + delay
+        steps = self.steps_cache.get(wait)
+        if steps is None:
+            timer, steps = 0.0, 0
+            while timer < wait:     #таймер копится так же, как obstacle_timer, - с теми же округлениями
+                timer += self.check_dt
+                steps += 1
+            self.steps_cache[wait] = steps
+        return steps
+
+    def run(self, reach, spans, stop):
+        """Продвигает множество положений с шага 0 до шага stop.
+
+        Args:
+            reach (int): Положения на шаге 0.
+            spans (tuple): Отрезки span() относительно шага 0.
+            stop (int): Последний шаг.
+
+        Returns:
+            int: Положения на шаге stop (0 - пройти нельзя).
+        """
+        air, land = self.air, self.land
+        blocks = [(enter, leave, ~self.height_bits(y, height)) for enter, leave, y, height in spans]
+        for step in range(1, stop + 1):
+            reach = (reach << 1) & air | (1 if reach & land else 0)
+            for enter, leave, free in blocks:
+                if enter <= step <= leave:
+                    reach &= free
+            if not reach:
+                return 0
+        return reach
+
+    def advance(self, state, spawn, speed, interval):
+        """Добавляет к состоянию проверки следующее препятствие.
+
+        Args:
+            state (tuple): (положения, отрезки) в момент появления прошлого
+                препятствия; START - начало игры.
+            spawn (ScheduledSpawn): Следующее препятствие.
+            speed (float): Скорость препятствий (считается одинаковой для всех).
+            interval (float): obstacle_interval игры.
+
+        Returns:
+            tuple: Состояние в момент появления spawn или None, если после
+            него не остается ни одного положения, в котором игрок ничего не задевает.
+        """
+        reach, spans = state
+        gap = self.spawn_steps(interval, spawn.delay)
+        reach = self.run(reach, spans, gap)     #до появления нового препятствия мешают только летящие
+        spans = tuple((enter - gap, leave - gap, y, height)
+                      for enter, leave, y, height in spans if leave > gap) + (self.span(spawn, speed),)
+        if not reach or not self.run(reach, spans, max(span[1] for span in spans)):
+            return None
+        return reach, spans
+
+    def settle_steps(self, state):
+        """Через сколько шагов состояние перестает зависеть от прошлых препятствий.
+
+        После этого все летящие препятствия пройдены, а игрок из любого
+        положения успел приземлиться, и запас времени больше не помогает.
+
+        Args:
+            state (tuple): Состояние проверки.
+
+        Returns:
+            int: Шагов от появления последнего препятствия.
+        """
+        return max((span[1] for span in state[1]), default=0) + len(self.offsets) + 1
+
+    def passable(self, spawns, speed, interval, state=START):
+        """Проверяет, можно ли пройти препятствия, не потеряв жизнь.
+
+        Args:
+            spawns (list): ScheduledSpawn подряд.
+            speed (float): Скорость препятствий (считается одинаковой для всех).
+            interval (float): obstacle_interval игры.
+            state (tuple, optional): Состояние до первого препятствия. По умолчанию START.
+
+        Returns:
+            bool: True если есть моменты прыжков, при которых игрок ничего не задевает.
+        """
+        for spawn in spawns:
+            state = self.advance(state, spawn, speed, interval)
+            if state is None:
+                return False
+        return True
+
+
+class SpawnSchedule:
+    """Очередь следующих препятствий, которую заранее готовит фоновый поток.
+
+    Attributes:
+        seed (int): Зерно игры - у каждого куска свой генератор от зерна и номера куска.
+        screen_width (int): Ширина экрана.
+        ground_y (int): Уровень земли игры.
+        reachability (JumpReachability): Проверка проходимости.
+        chunk_size (int): Препятствий в куске.
+        refill_at (int): При скольких препятствиях в очереди заказывается следующий кусок.
+        threaded (bool): Считать куски в фоновом потоке.
+        queue (collections.deque): Готовые препятствия.
+        next_chunk (int): Номер следующего куска.
+        tail (dict): Скорость -> состояние JumpReachability в конце последнего забранного
+            куска - начало проверки следующего.
+        chunks (int): Сколько кусков посчитано.
+        delayed (int): Сколько препятствий получили запас времени.
+        resampled (int): Сколько раз препятствие выбиралось заново.
+        forced (int): Сколько препятствий получили запас больше DELAYS.
+        plan_time (float): Секунды, потраченные на расчет кусков.
+        wait_time (float): Секунды, которые игра ждала кусок.
+    """
+
+    DELAYS = (0.0, 0.1, 0.2, 0.35, 0.5, 0.75, 1.0)     # запасы времени, которые пробуются по порядку
+    ATTEMPTS = 4        # сколько раз препятствие выбирается заново
+    DELAY_STEP = 0.25   # на сколько растет запас после DELAYS, если ничего не помогло
+    executor = None     # один фоновый поток на все расписания процесса
+
+    def __init__(self, seed, screen_width, ground_y, player, chunk_size=8, refill_at=4, threaded=True):
+        """Инициализация пустого расписания.
+
+        Args:
+            seed (int): Зерно игры.
+            screen_width (int): Ширина экрана.
+            ground_y (int): Уровень земли.
+            player (Player): Игрок - для дуги прыжка.
+            chunk_size (int, optional): Препятствий в куске. По умолчанию 8.
+            refill_at (int, optional): Порог очереди для заказа куска. По умолчанию 4.
+            threaded (bool, optional): Фоновый поток. False - кусок считается
+                сразу при заказе (результат тот же). По умолчанию True.
+        """
+        self.seed = seed
+        self.screen_width = screen_width
+        self.ground_y = ground_y
+        self.reachability = JumpReachability(player)
+        self.chunk_size = chunk_size
+        self.refill_at = refill_at
+        self.threaded = threaded
+        self.queue = deque()
+        self.pending = None     # Future заказанного куска
+        self.next_chunk = 0
+        self.tail = {}
+        self.chunks = 0
+        self.delayed = 0
+        self.resampled = 0
+        self.forced = 0
+        self.plan_time = 0.0
+        self.wait_time = 0.0
+
+    def shared_executor():
+        """Фоновый поток расписаний (создается при первом заказе).
+
+        Returns:
+            concurrent.futures.ThreadPoolExecutor: Пул из одного потока.
+        """
+        if SpawnSchedule.executor is None:
+            SpawnSchedule.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='spawn-schedule')
+        return SpawnSchedule.executor
+
+    shared_executor = staticmethod(shared_executor)
+
+    def speed_tiers(self, game):
+        """Скорости и интервалы, при которых может появиться препятствие заказанного куска.
+
+        Пока из очереди выйдут refill_at препятствий и весь кусок, игрок
+        наберет не больше refill_at + chunk_size очков; каждые
+        speed_increase_interval очков скорость и интервал меняются, как в
+        GameManager.score_point (шаги берутся из констант игры).
+
+        Args:
+            game (GameManager): Игра.
+
+        Returns:
+            list: Пары (скорость, интервал).
+        """
+        tiers = [(game.game_speed, game.obstacle_interval)]
+        for _ in range(math.ceil((self.refill_at + self.chunk_size) / max(1, game.speed_increase_interval))):
+            speed, interval = tiers[-1]
+            tiers.append((speed + game.SPEED_STEP, max(game.MIN_OBSTACLE_INTERVAL, interval - game.INTERVAL_STEP)))
+        return tiers
+
+    def plan(self, index, tiers, tail):
+        """Считает кусок расписания (выполняется в фоновом потоке).
+
+        Args:
+            index (int): Номер куска.
+            tiers (list): Пары (скорость, интервал) из speed_tiers.
+            tail (dict): Состояния проверки в конце прошлого куска (tail).
+
+        Returns:
+            tuple: (ScheduledSpawn куска, состояния в его конце - следующий tail).
+        """
+        started = time.perf_counter()
+        rng = random.Random(f'{self.seed}:{index}')      # кусок зависит только от зерна и номера
+        states = [SpawnSchedule.carried_state(tail, speed) for speed, _ in tiers]
+        chunk = []
+        for _ in range(self.chunk_size):
+            spawn, states = self.choose(rng, states, tiers)
+            chunk.append(spawn)
+        self.chunks += 1
+        self.plan_time += time.perf_counter() - started
+        return chunk, {speed: state for (speed, _), state in zip(tiers, states)}
+
+    def carried_state(tail, speed):
+        """Состояние проверки из прошлого куска для скорости speed.
+
+        Скорость игры растет ступенями, поэтому такая же ступень обычно уже
+        была в прошлом куске. Иначе берется ближайшая более медленная (или
+        самая медленная): прошлые препятствия и летят со своей скоростью появления.
+
+        Args:
+            tail (dict): Скорость -> состояние в конце прошлого куска.
+            speed (float): Скорость.
+
+        Returns:
+            tuple: Состояние JumpReachability (START, если прошлого куска нет).
+        """
+        if not tail:
+            return JumpReachability.START
+        if speed in tail:
+            return tail[speed]
+        slower = [known for known in tail if known < speed]
+        return tail[max(slower) if slower else min(tail)]
+
+    carried_state = staticmethod(carried_state)
+
+    def choose(self, rng, states, tiers):
+        """Выбирает проходимое следующее препятствие.
+
+        Сначала пробуются запасы DELAYS для ATTEMPTS случайных препятствий.
+        Если ни одно не прошло, после DELAYS запас растет на DELAY_STEP, пока
+        препятствие не станет проходимым или пока прошлые препятствия не
+        перестанут на него влиять (settle_steps) - тогда оно непроходимо само
+        по себе, и выбирается следующее. Птицу всегда можно переждать на
+        земле, поэтому поиск кончается.
+
+        Args:
+            rng (random.Random): Генератор куска.
+            states (list): Состояния проверки для каждой пары tiers.
+            tiers (list): Пары (скорость, интервал).
+
+        Returns:
+            tuple: (препятствие с наименьшим найденным запасом времени, состояния после него).
+        """
+        reachability = self.reachability
+        settle = max(reachability.settle_steps(state) * reachability.check_dt - interval
+                     for state, (_, interval) in zip(states, tiers))       #больший запас ничего не меняет
+        attempt = 0
+        while True:
+            spawn = ScheduledSpawn.random(self.screen_width, self.ground_y, rng)
+            delays = self.DELAYS
+            if attempt >= self.ATTEMPTS:
+                delays += tuple(self.DELAYS[-1] + self.DELAY_STEP * (k + 1)
+                                for k in range(max(0, math.ceil((settle - self.DELAYS[-1]) / self.DELAY_STEP)) + 1))
+            for delay in delays:
+                candidate = spawn.with_delay(delay) if delay else spawn
+                advanced = []
+                for state, (speed, interval) in zip(states, tiers):
+                    state = reachability.advance(state, candidate, speed, interval)
+                    if state is None:
+                        break
+                    advanced.append(state)
+                else:
+                    self.delayed += delay > 0
+                    self.resampled += attempt
+                    self.forced += delay > self.DELAYS[-1]
+                    return candidate, advanced
+            attempt += 1
+
+    def request(self, game):
+        """Заказывает следующий кусок по текущим скорости и интервалу игры.
+
+        Args:
+            game (GameManager): Игра.
+        """
+        tiers = self.speed_tiers(game)
+        index = self.next_chunk
+        self.next_chunk += 1
+        if self.threaded:
+            self.pending = SpawnSchedule.shared_executor().submit(self.plan, index, tiers, self.tail)
+        else:
+            self.pending = Future()
+            self.pending.set_result(self.plan(index, tiers, self.tail))
+
+    def peek(self, game):
+        """Следующее препятствие очереди (не вынимая его).
+
+        Кусок забирается, только когда очередь опустела, - так момент заказа
+        следующего куска не зависит от скорости фонового потока.
+
+        Args:
+            game (GameManager): Игра.
+
+        Returns:
+            ScheduledSpawn: Следующее препятствие.
+        """
+        if not self.queue:
+            if self.pending is None:
+                self.request(game)      #первый кусок или после restart
+            started = time.perf_counter()
+            chunk, self.tail = self.pending.result()
+            self.wait_time += time.perf_counter() - started
+            self.pending = None
+            self.queue.extend(chunk)
+        return self.queue[0]
+
+    def pop(self, game):
+        """Вынимает следующее препятствие и при необходимости заказывает новый кусок.
+
+        Args:
+            game (GameManager): Игра.
+
+        Returns:
+            ScheduledSpawn: Препятствие.
+        """
+        spawn = self.peek(game)
+        self.queue.popleft()
+        if self.pending is None and len(self.queue) <= self.refill_at:
+            self.request(game)
+        return spawn
+
+    def restart(self):
+        """Забывает очередь и заказанный кусок (новая игра начинается с другой скоростью)."""
+        self.queue.clear()
+        self.pending = None     #результат потока, если он еще считается, просто не будет забран
+        self.tail = {}
+
+    def stats(self):
+        """Статистика расписания для профилирования.
+
+        Returns:
+            dict: Куски, препятствия с запасом, выбранные заново, непроходимые,
+            время расчета и время ожидания игрой (мс).
+        """
+        return {'chunks': self.chunks, 'delayed': self.delayed, 'resampled': self.resampled,
+                'forced': self.forced, 'plan_ms': self.plan_time * 1000, 'wait_ms': self.wait_time * 1000}
@@ -0,0 +1,189 @@
+"""Модуль sprite_cache - общий кэш подготовленных спрайтов.
+
+Содержит класс SpriteCache, который хранит уже сконвертированные и
+отмасштабированные поверхности, чтобы не читать и не декодировать
+PNG с диска при каждом создании игрового объекта. Рядом со спрайтами
+хранятся маски столкновений (pygame.mask.Mask), построенные один раз.
+"""
+
+import os
+import weakref
+from collections import OrderedDict
+import pygame
+
+
+class SpriteCache:
+    """Кэш готовых к отрисовке спрайтов с ограничением по размеру.
+
+    Ключ кэша - кортеж (путь, ширина, высота, отражение по X, отражение по Y).
+    При переполнении удаляется спрайт, который дольше всех не запрашивали (LRU).
+    Маска столкновений строится при добавлении спрайта и живет, пока жива
+    сама поверхность.
+
+    Attributes:
+        max_size (int): Максимальное количество спрайтов в кэше.
+        hits (int): Количество запросов, найденных в кэше.
+        misses (int): Количество запросов, которых не было в кэше.
+    """
+
+    def __init__(self, max_size=128):
+        """Инициализация кэша.
+
+        Args:
+            max_size (int, optional): Максимальное количество спрайтов в кэше.
+                По умолчанию 128.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # ключ -> pygame.Surface, порядок = давность использования
+        self._masks = weakref.WeakKeyDictionary()  # pygame.Surface -> pygame.mask.Mask
+        self._rect_masks = {}  # (ширина, высота) -> полностью заполненная маска
+
+    def make_key(path, width=None, height=None, flip_x=False, flip_y=False):
+        """Строит ключ кэша для спрайта.
+
+        Args:
+            path (str): Путь к файлу изображения.
+            width (int, optional): Ширина после масштабирования.
+            height (int, optional): Высота после масштабирования.
+            flip_x (bool): Отражение по горизонтали.
+            flip_y (bool): Отражение по вертикали.
+
+        Returns:
+            tuple: Ключ (путь, ширина, высота, flip_x, flip_y).
+        """
+        if not (width and height):  # масштабирование применяется только если заданы оба размера
+            width = height = None
+        return (os.path.abspath(path), width, height, bool(flip_x), bool(flip_y))
+
+    make_key = staticmethod(make_key)
+
+    def get(self, key):
+        """Возвращает спрайт из кэша и обновляет счетчики.
+
+        Args:
+            key (tuple): Ключ, построенный make_key.
+
+        Returns:
+            pygame.Surface: Спрайт или None, если его нет в кэше.
+        """
+        sprite = self._entries.get(key)
+        if sprite is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)  # спрайт только что использовали - он самый "свежий"
+        return sprite
+
+    def put(self, key, sprite):
+        """Кладет спрайт в кэш, вытесняя самые старые записи при переполнении.
+
+        Args:
+            key (tuple): Ключ, построенный make_key.
+            sprite (pygame.Surface): Готовый спрайт.
+        """
+        self._entries[key] = sprite
+        self._entries.move_to_end(key)
+        self.mask_for(sprite)  # маску строим сразу, а не во время игрового кадра
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)  # удаляем самый давно использованный
+
+    def invalidate(self, path=None):
+        """Удаляет спрайты из кэша.
+
+        Args:
+            path (str, optional): Путь к файлу. Если не указан - кэш очищается полностью.
+
+        Returns:
+            int: Количество удаленных записей.
+        """
+        if path is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+        path = os.path.abspath(path)
+        keys = [key for key in self._entries if key[0] == path]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def items(self):
+        """Возвращает копию всех записей кэша.
+
+        Returns:
+            list: Список пар (ключ, pygame.Surface).
+        """
+        return list(self._entries.items())
+
+    def replace(self, key, sprite):
+        """Заменяет поверхность существующей записи, не меняя порядок вытеснения.
+
+        Args:
+            key (tuple): Ключ существующей записи.
+            sprite (pygame.Surface): Новая поверхность с тем же изображением.
+        """
+        if key in self._entries:
+            old_mask = self._masks.get(self._entries[key])
+            if old_mask is not None:
+                self._masks[sprite] = old_mask  # изображение то же - маску строить заново не нужно
+            self._entries[key] = sprite
+
+    def mask_for(self, sprite):
+        """Возвращает маску столкновений для спрайта, строя ее один раз.
+
+        Args:
+            sprite (pygame.Surface): Спрайт (кадр анимации).
+
+        Returns:
+            pygame.mask.Mask: Маска непрозрачных пикселей спрайта.
+        """
+        mask = self._masks.get(sprite)
+        if mask is None:
+            mask = pygame.mask.from_surface(sprite)
+            self._masks[sprite] = mask
+        return mask
+
+    def rect_mask(self, size):
+        """Возвращает полностью заполненную маску для объекта без спрайта.
+
+        Args:
+            size (tuple): Размер (ширина, высота).
+
+        Returns:
+            pygame.mask.Mask: Маска, в которой установлены все пиксели.
+        """
+        size = (max(1, size[0]), max(1, size[1]))
+        mask = self._rect_masks.get(size)
+        if mask is None:
+            mask = pygame.mask.Mask(size, fill=True)
+            self._rect_masks[size] = mask
+        return mask
+
+    def reset_stats(self):
+        """Обнуляет счетчики попаданий и промахов."""
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Возвращает статистику кэша.
+
+        Returns:
+            dict: Размер, лимит, попадания, промахи и доля попаданий.
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
@@ -6,13 +6,61 @@
 
 import pygame
 import os
+from .sprite_cache import SpriteCache
+from .texture_atlas import TextureAtlas
+from .asset_cache import DiskAssetCache
 
 
 class SpriteLoader:
-    """Загрузчик и обработчик спрайтов для игры."""
-    def load_sprite(path, width=None, height=None):
+    """Загрузчик и обработчик спрайтов для игры.
+
+    Attributes:
+        cache (SpriteCache): Общий для всего процесса кэш готовых спрайтов.
+        atlas (TextureAtlas): Атлас, в который упакованы спрайты кэша (None, пока не построен).
+    """
+
+    cache = SpriteCache()  # один кэш на все объекты игры
+    atlas = None  # атлас текстур, строится после загрузки всех спрайтов
+
+    def load_sprite(path, width=None, height=None, flip_x=False, flip_y=False, use_cache=True):
         """Загружает и подготавливает спрайт из файла.
 
+        Повторные запросы с тем же путем, размером и отражением
+        возвращают уже готовую поверхность из SpriteLoader.cache.
+
+        Args:
+            path (str): Путь к файлу изображения.
+            width (int, optional): Новая ширина спрайта.
+            height (int, optional): Новая высота спрайта.
+            flip_x (bool, optional): Отразить по горизонтали. По умолчанию False.
+            flip_y (bool, optional): Отразить по вертикали. По умолчанию False.
+            use_cache (bool, optional): Использовать общий кэш. По умолчанию True.
+
+        Returns:
+            pygame.Surface: Загруженный и обработанный спрайт.
+        """
+        key = SpriteCache.make_key(path, width, height, flip_x, flip_y)
+        if use_cache:
+            sprite = SpriteLoader.cache.get(key)
+            if sprite is not None:  # спрайт уже готов - диск и декодирование не нужны
+                return sprite
+
+        sprite = SpriteLoader.decode_sprite(path, width, height)
+        if flip_x or flip_y:
+            sprite = pygame.transform.flip(sprite, flip_x, flip_y)
+
+        if use_cache:
+            SpriteLoader.cache.put(key, sprite)
+        return sprite
+
+    load_sprite = staticmethod(load_sprite)
+
+    def decode_sprite(path, width=None, height=None):
+        """Читает файл с диска, конвертирует и масштабирует спрайт без кэша в памяти.
+
+        Если включен дисковый кэш (DiskAssetCache.active), готовые пиксели
+        берутся из него, и PNG не декодируется.
+
         Args:
             path (str): Путь к файлу изображения.
             width (int, optional): Новая ширина спрайта.
@@ -21,21 +69,123 @@ class SpriteLoader:
         Returns:
             pygame.Surface: Загруженный и обработанный спрайт.
         """
+        raw, prepared = SpriteLoader.read_sprite(path, width, height)
+        return SpriteLoader.finish_sprite(raw, path, width, height, prepared)
+
+    decode_sprite = staticmethod(decode_sprite)
+
+    def read_sprite(path, width=None, height=None):
+        """Первый этап загрузки: чтение и декодирование файла.
+
+        Не обращается к окну, поэтому может выполняться в рабочем потоке.
+
+        Args:
+            path (str): Путь к файлу изображения.
+            width (int, optional): Ширина, к которой спрайт будет отмасштабирован.
+            height (int, optional): Высота, к которой спрайт будет отмасштабирован.
+
+        Returns:
+            tuple: (несконвертированная поверхность, True если пиксели уже
+            отмасштабированы и взяты из дискового кэша).
+        """
+        if not (width and height):
+            width = height = None
+
+        disk_cache = DiskAssetCache.active
+        if disk_cache is not None:
+            sprite = disk_cache.read_image(path, width, height) #уже отмасштабированные пиксели с диска
+            if sprite is not None:
+                return sprite, True
+
         #path - путь к файлу изображения
-        sprite = pygame.image.load(path) #атрибут для хранения изображения
+        return pygame.image.load(path), False #атрибут для хранения изображения
 
-        if sprite.get_alpha() is None: #если файл прозрачный возвращает 255, если нет 0. Если непрозрачный
-            sprite = sprite.convert() #конвертируем без прозрачности
+    read_sprite = staticmethod(read_sprite)
 
-        else: #если файл имеет прозрачность
-            sprite = sprite.convert_alpha() # конвентируем как прозрачный
+    def finish_sprite(sprite, path, width=None, height=None, prepared=False):
+        """Второй этап загрузки: конвертация в формат экрана и масштабирование.
 
-        if width and height:
+        Требует созданного окна, поэтому выполняется в главном потоке.
+
+        Args:
+            sprite (pygame.Surface): Результат read_sprite.
+            path (str): Путь к исходному файлу (для записи в дисковый кэш).
+            width (int, optional): Новая ширина спрайта.
+            height (int, optional): Новая высота спрайта.
+            prepared (bool, optional): Пиксели уже отмасштабированы (взяты из дискового кэша).
+
+        Returns:
+            pygame.Surface: Готовый к отрисовке спрайт.
+        """
+        sprite = SpriteLoader.convert_sprite(sprite)
+        if prepared:
+            return sprite
+
+        if not (width and height):
+            width = height = None
+        else:
             sprite = pygame.transform.scale(sprite, (width, height))
         # для всех файлов, если не указан размер, то он останется изначальным. Если указан, то он будет менять размер на указанный
+
+        disk_cache = DiskAssetCache.active
+        if disk_cache is not None:
+            disk_cache.write_image(path, width, height, sprite)
         return sprite
 
-    load_sprite = staticmethod(load_sprite)
+    finish_sprite = staticmethod(finish_sprite)
+
+    def convert_sprite(sprite):
+        """Конвертирует поверхность в формат экрана.
+
+        Args:
+            sprite (pygame.Surface): Загруженная поверхность.
+
+        Returns:
+            pygame.Surface: Поверхность, которая быстро рисуется на экране.
+            Если окно не создано (симуляция без экрана), поверхность возвращается
+            как есть - для масок столкновений формат экрана не нужен.
+        """
+        if pygame.display.get_surface() is None: #без окна конвертировать не во что
+            return sprite
+        if sprite.get_alpha() is None: #если файл прозрачный возвращает 255, если нет 0. Если непрозрачный
+            return sprite.convert() #конвертируем без прозрачности
+        return sprite.convert_alpha() # конвентируем как прозрачный
+
+    convert_sprite = staticmethod(convert_sprite)
+
+    def invalidate_cache(path=None):
+        """Сбрасывает закэшированные спрайты.
+
+        Args:
+            path (str, optional): Путь к файлу. Если не указан - очищается весь кэш.
+
+        Returns:
+            int: Количество удаленных из кэша спрайтов.
+        """
+        return SpriteLoader.cache.invalidate(path)
+
+    invalidate_cache = staticmethod(invalidate_cache)
+
+    def build_atlas(page_size=(1024, 1024)):
+        """Упаковывает все спрайты кэша в атлас текстур.
+
+        После вызова load_sprite для уже загруженных спрайтов возвращает
+        подповерхности страниц атласа. Ссылки, полученные раньше, остаются
+        рабочими, но указывают на отдельные поверхности.
+
+        Args:
+            page_size (tuple, optional): Размер страницы атласа. По умолчанию 1024x1024.
+
+        Returns:
+            TextureAtlas: Построенный атлас.
+        """
+        atlas = TextureAtlas(page_size)
+        for key, region in atlas.pack(dict(SpriteLoader.cache.items())).items():
+            SpriteLoader.cache.replace(key, region)  # в кэше теперь область атласа вместо отдельной поверхности
+        SpriteLoader.atlas = atlas
+        return atlas
+
+    build_atlas = staticmethod(build_atlas)
 
     #функция для отражения каждого спрайта !!!инструмент!!!
     def flip_sprites(sprites, flip_x=False, flip_y=False):
@@ -0,0 +1,307 @@
+"""Модуль sweep - массовый прогон игр без окна по зернам и настройкам.
+
+Для настройки сложности (начальная скорость, интервал появления
+препятствий, шаг ускорения) и сравнения ботов нужно сыграть тысячи игр.
+Игры идут в Simulation без окна и звука в пуле процессов
+ProcessPoolExecutor: зерна режутся на куски, каждый кусок - одна задача
+для процесса, результаты приходят по мере готовности кусков и сразу
+дописываются в файл JSON Lines и в итоговую статистику.
+
+Файл результатов - по строке на игру. При повторном запуске с тем же
+файлом уже сыгранные игры пропускаются, поэтому прерванный прогон
+продолжается с того места, где остановился.
+
+Бот задается строкой "имя:параметр" (см. POLICIES), например
+"random:0.02" - прыжок с вероятностью 2% на каждом шаге или
+"periodic:97" - прыжок каждые 97 шагов, "autopilot:1.5" - Autopilot
+с прогнозом на 1.5 секунды.
+"""
+
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .autopilot import Autopilot
+from .simulation import Simulation
+
+
+def random_policy(seed, jump_prob=0.02):
+    """Бот, который прыгает случайно.
+
+    Args:
+        seed (int): Зерно игры - бот берет свой генератор с тем же зерном.
+        jump_prob (float, optional): Вероятность прыжка на каждом шаге.
+
+    Returns:
+        callable: Контроллер controller(game, tick) -> bool для Simulation.run.
+    """
+    rng = random.Random(seed)
+    return lambda game, tick: rng.random() < jump_prob
+
+
+def periodic_policy(seed, jump_every=97):
+    """Бот, который прыгает через равные промежутки.
+
+    Args:
+        seed (int): Зерно игры (не используется).
+        jump_every (int, optional): Прыжок каждые jump_every шагов.
+
+    Returns:
+        callable: Контроллер controller(game, tick) -> bool для Simulation.run.
+    """
+    jump_every = int(jump_every)
+    return lambda game, tick: tick % jump_every == 0
+
+
+def autopilot_policy(seed, horizon=1.5):
+    """Встроенный бот Autopilot с поиском по прогнозу игры.
+
+    Args:
+        seed (int): Зерно игры (не используется - бот детерминирован).
+        horizon (float, optional): Глубина прогноза в секундах.
+
+    Returns:
+        callable: Контроллер controller(game, tick) -> bool для Simulation.run.
+    """
+    return Autopilot(horizon=horizon).controller
+
+
+# имя бота -> фабрика factory(seed, параметр) -> контроллер
+POLICIES = {
+    'random': random_policy,
+    'periodic': periodic_policy,
+    'autopilot': autopilot_policy,
+}
+
+# настройки сложности: ключ в строке результата -> атрибут GameManager
+SETTINGS = ('speed', 'obstacle_interval', 'speed_increase_interval')
+
+
+def make_policy(spec, seed):
+    """Создает контроллер бота по строке "имя:параметр".
+
+    Args:
+        spec (str): Бот, например "random:0.05" или "periodic". Без параметра -
+            значение по умолчанию фабрики.
+        seed (int): Зерно игры.
+
+    Returns:
+        callable: Контроллер для Simulation.run.
+
+    Raises:
+        ValueError: Если такого бота нет в POLICIES.
+    """
+    name, _, param = spec.partition(':')
+    if name not in POLICIES:
+        raise ValueError(f"Неизвестный бот: {name} (есть: {', '.join(POLICIES)})")
+    return POLICIES[name](seed, float(param)) if param else POLICIES[name](seed)
+
+
+def play_game(settings, policy, seed, max_seconds=600, tick_rate=120):
+    """Играет одну игру без окна.
+
+    Args:
+        settings (dict): Настройки сложности - ключи из SETTINGS.
+        policy (str): Бот "имя:параметр".
+        seed (int): Зерно игры.
+        max_seconds (float, optional): Ограничение игрового времени. По умолчанию 600.
+        tick_rate (int, optional): Шагов в секунду. По умолчанию 120.
+
+    Returns:
+        dict: Строка результата - настройки, бот, зерно, счет, жизни,
+        время выживания (секунды игры), наибольшая скорость и оборвана ли игра по времени.
+    """
+    sim = Simulation(speed=settings['speed'], tick_rate=tick_rate, seed=seed)
+    sim.game.obstacle_interval = settings['obstacle_interval']
+    sim.game.speed_increase_interval = settings['speed_increase_interval']
+    result = sim.run(controller=make_policy(policy, seed), max_ticks=int(max_seconds * tick_rate))
+
+    row = dict(settings, policy=policy, seed=seed)
+    row.update(score=result['score'], lives=result['lives'], ticks=sim.ticks,
+               survival=round(sim.game_time(), 4),
+               max_speed=result['speed'],       # скорость в игре только растет - итоговая и есть наибольшая
+               timeout=not sim.game.game_over)
+    return row
+
+
+def run_chunk(task):
+    """Играет кусок зерен (задача одного процесса пула).
+
+    Args:
+        task (tuple): (settings, policy, seeds, max_seconds, tick_rate).
+
+    Returns:
+        list: Строки результатов play_game.
+    """
+    settings, policy, seeds, max_seconds, tick_rate = task
+    return [play_game(settings, policy, seed, max_seconds, tick_rate) for seed in seeds]
+
+
+def group_key(row):
+    """Ключ группы результата: бот и настройки сложности.
+
+    Returns:
+        tuple: (бот, скорость, интервал, шаг ускорения).
+    """
+    return (row['policy'],) + tuple(row[name] for name in SETTINGS)
+
+
+class SweepStats:
+    """Итоговая статистика прогона, которая считается по мере прихода результатов.
+
+    Хранит только суммы и экстремумы по группам, а не сами строки,
+    поэтому память не зависит от числа игр.
+
+    Attributes:
+        groups (dict): Ключ group_key -> словарь сумм группы.
+        games (int): Сколько игр учтено всего.
+    """
+
+    def __init__(self):
+        """Инициализация пустой статистики."""
+        self.groups = {}
+        self.games = 0
+
+    def add(self, row):
+        """Учитывает результат одной игры.
+
+        Args:
+            row (dict): Строка результата play_game.
+        """
+        group = self.groups.get(group_key(row))
+        if group is None:
+            group = self.groups[group_key(row)] = {'games': 0, 'score': 0, 'survival': 0.0, 'max_speed': 0,
+                                                   'best_score': row['score'], 'worst_score': row['score'],
+                                                   'top_speed': row['max_speed'], 'timeouts': 0}
+        group['games'] += 1
+        group['score'] += row['score']
+        group['survival'] += row['survival']
+        group['max_speed'] += row['max_speed']
+        group['best_score'] = max(group['best_score'], row['score'])
+        group['worst_score'] = min(group['worst_score'], row['score'])
+        group['top_speed'] = max(group['top_speed'], row['max_speed'])
+        group['timeouts'] += row['timeout']
+        self.games += 1
+
+    def rows(self):
+        """Итог по группам, лучшие по среднему счету - первыми.
+
+        Returns:
+            list: Словари: бот, настройки, число игр, средние счет, время выживания
+            и наибольшая скорость, лучший и худший счет, наибольшая скорость за все игры,
+            число игр, оборванных по времени.
+        """
+        summary = []
+        for key, group in self.groups.items():
+            games = group['games']
+            row = dict(zip(('policy',) + SETTINGS, key))
+            row.update(games=games, mean_score=group['score'] / games,
+                       mean_survival=group['survival'] / games, mean_max_speed=group['max_speed'] / games,
+                       best_score=group['best_score'], worst_score=group['worst_score'],
+                       top_speed=group['top_speed'], timeouts=group['timeouts'])
+            summary.append(row)
+        summary.sort(key=lambda row: row['mean_score'], reverse=True)
+        return summary
+
+
+def load_results(path):
+    """Читает уже записанные результаты для продолжения прогона.
+
+    Строка, недописанная при прерывании (без перевода строки в конце файла),
+    отрезается, чтобы новые строки не склеились с ней.
+
+    Args:
+        path (str): Файл JSON Lines.
+
+    Returns:
+        list: Прочитанные строки результатов (пустой, если файла нет).
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, 'rb+') as file:
+        data = file.read()
+        complete = data.rfind(b'\n') + 1
+        if complete < len(data):
+            file.truncate(complete)
+    return [json.loads(line) for line in data[:complete].splitlines() if line.strip()]
+
+
+def make_tasks(settings_grid, policies, seeds, chunk_size, done=(), max_seconds=600, tick_rate=120):
+    """Режет прогон на задачи для пула процессов.
+
+    Args:
+        settings_grid (list): Словари настроек сложности.
+        policies (list): Строки ботов.
+        seeds (iterable): Зерна.
+        chunk_size (int): Зерен в одной задаче.
+        done (set, optional): Уже сыгранные игры - ключи group_key(row) + (зерно,).
+        max_seconds (float, optional): Ограничение игрового времени одной игры.
+        tick_rate (int, optional): Шагов в секунду.
+
+    Returns:
+        list: Задачи для run_chunk.
+    """
+    seeds = list(seeds)
+    tasks = []
+    for policy in policies:
+        for settings in settings_grid:
+            key = (policy,) + tuple(settings[name] for name in SETTINGS)
+            todo = [seed for seed in seeds if key + (seed,) not in done]
+            for start in range(0, len(todo), chunk_size):
+                tasks.append((settings, policy, todo[start:start + chunk_size], max_seconds, tick_rate))
+    return tasks
+
+
+def run_sweep(settings_grid, policies, seeds, output, workers=None, chunk_size=50, max_seconds=600,
+              tick_rate=120, progress=None):
+    """Проигрывает все сочетания ботов, настроек и зерен в пуле процессов.
+
+    Результаты дописываются в output по мере готовности кусков. Игры, которые
+    уже есть в output, не переигрываются.
+
+    Args:
+        settings_grid (list): Словари настроек сложности (ключи SETTINGS).
+        policies (list): Строки ботов "имя:параметр".
+        seeds (iterable): Зерна игр.
+        output (str): Файл результатов JSON Lines.
+        workers (int, optional): Процессов в пуле. None - по числу ядер.
+            1 - без пула, в текущем процессе.
+        chunk_size (int, optional): Зерен в одной задаче. По умолчанию 50.
+        max_seconds (float, optional): Ограничение игрового времени одной игры.
+        tick_rate (int, optional): Шагов в секунду.
+        progress (callable, optional): progress(сыграно, всего) после каждого куска.
+
+    Returns:
+        SweepStats: Статистика по всем играм в output (и старым, и новым).
+    """
+    for policy in policies:
+        make_policy(policy, 0)      # неизвестный бот - ошибка сразу, а не в процессе пула
+
+    stats = SweepStats()
+    done = set()
+    for row in load_results(output):
+        stats.add(row)
+        done.add(group_key(row) + (row['seed'],))
+
+    tasks = make_tasks(settings_grid, policies, seeds, chunk_size, done, max_seconds, tick_rate)
+    total = sum(len(task[2]) for task in tasks)
+    played = 0
+    with open(output, 'a', encoding='utf-8') as file:
+        def collect(rows):
+            nonlocal played
+            file.write(''.join(json.dumps(row) + '\n' for row in rows))
+            file.flush()        # кусок на диске - при прерывании он не потеряется
+            for row in rows:
+                stats.add(row)
+            played += len(rows)
+            if progress is not None:
+                progress(played, total)
+
+        if workers == 1:
+            for task in tasks:
+                collect(run_chunk(task))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for future in as_completed([pool.submit(run_chunk, task) for task in tasks]):
+                    collect(future.result())
+    return stats
@@ -0,0 +1,90 @@
+"""Модуль text_cache - кэш отрисованного текста.
+
+Содержит класс TextCache, который хранит уже растеризованные шрифтом
+надписи. HUD, меню паузы и экран Game Over каждый кадр выводят одни и те же
+строки, а счет, скорость и жизни меняются лишь несколько раз в секунду,
+поэтому в обычном кадре font.render() не вызывается вовсе.
+"""
+
+from collections import OrderedDict
+
+
+class TextCache:
+    """Кэш поверхностей с текстом с ограничением по размеру.
+
+    Ключ кэша - кортеж (текст, шрифт, сглаживание, цвет).
+    При переполнении удаляется надпись, которую дольше всех не запрашивали (LRU).
+
+    Attributes:
+        max_size (int): Максимальное количество надписей в кэше.
+        hits (int): Количество запросов, найденных в кэше.
+        misses (int): Количество запросов, для которых текст пришлось растеризовать.
+    """
+
+    def __init__(self, max_size=256):
+        """Инициализация кэша.
+
+        Args:
+            max_size (int, optional): Максимальное количество надписей в кэше.
+                По умолчанию 256.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # ключ -> pygame.Surface, порядок = давность использования
+
+    def render(self, font, text, antialias, color):
+        """Возвращает надпись из кэша или растеризует ее один раз.
+
+        Аргументы такие же, как у pygame.font.Font.render(). Возвращенную
+        поверхность нельзя изменять - она общая для всех вызовов.
+
+        Args:
+            font (pygame.font.Font): Шрифт.
+            text (str): Текст надписи.
+            antialias (bool): Сглаживание.
+            color (tuple): Цвет текста (R, G, B).
+
+        Returns:
+            pygame.Surface: Поверхность с текстом.
+        """
+        key = (text, font, bool(antialias), tuple(color))
+        surface = self._entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)  # надпись только что использовали - она самая "свежая"
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)  # удаляем самую давно использованную
+        return surface
+
+    def clear(self):
+        """Удаляет все надписи (например, после смены шрифтов)."""
+        self._entries.clear()
+
+    def reset_stats(self):
+        """Обнуляет счетчики попаданий и промахов."""
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Возвращает статистику кэша.
+
+        Returns:
+            dict: Размер, лимит, попадания, промахи и доля попаданий.
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,144 @@
+"""Модуль texture_atlas - упаковка спрайтов в атлас текстур.
+
+Содержит класс TextureAtlas, который раскладывает много маленьких спрайтов
+на несколько больших поверхностей (страниц) и выдает вместо них
+подповерхности (subsurface) этих страниц. Отрисовка при этом идет из
+одного источника, что позволяет рисовать пачкой через Surface.blits.
+"""
+
+import pygame
+
+
+class TextureAtlas:
+    """Атлас текстур из одной или нескольких страниц.
+
+    Спрайты раскладываются по "полкам": сортируются по высоте и ставятся
+    в ряд слева направо, пока ряд не заполнится, затем начинается новый ряд
+    (shelf packing). Спрайты с прозрачностью и без нее попадают на разные
+    страницы, чтобы непрозрачные картинки рисовались быстрым путем.
+
+    Attributes:
+        page_size (tuple): Размер одной страницы (ширина, высота).
+        padding (int): Отступ между спрайтами в пикселях.
+        pages (list): Список страниц (pygame.Surface).
+        regions (dict): Ключ спрайта -> (номер страницы, pygame.Rect).
+    """
+
+    def __init__(self, page_size=(1024, 1024), padding=1):
+        """Инициализация пустого атласа.
+
+        Args:
+            page_size (tuple, optional): Размер страницы. По умолчанию 1024x1024.
+            padding (int, optional): Отступ между спрайтами. По умолчанию 1.
+        """
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []
+        self.regions = {}
+
+    def pack(self, sprites):
+        """Упаковывает спрайты в страницы атласа.
+
+        Спрайты, которые больше страницы, в атлас не попадают и
+        в результате не возвращаются.
+
+        Args:
+            sprites (dict): Ключ -> pygame.Surface.
+
+        Returns:
+            dict: Ключ -> подповерхность страницы атласа с тем же изображением.
+        """
+        groups = {True: [], False: []}  # с прозрачностью / без прозрачности
+        for key, sprite in sprites.items():
+            width, height = sprite.get_size()
+            if width + self.padding > self.page_size[0] or height + self.padding > self.page_size[1]:
+                continue  # слишком большой спрайт оставляем отдельной поверхностью
+            has_alpha = bool(sprite.get_flags() & pygame.SRCALPHA)
+            groups[has_alpha].append((key, sprite))
+
+        packed = {}
+        for has_alpha, items in groups.items():
+            # высокие спрайты первыми - так полки заполняются плотнее
+            items.sort(key=lambda item: item[1].get_height(), reverse=True)
+            for key, page_index, rect in self._place(items, has_alpha):
+                self.regions[key] = (page_index, rect)
+                packed[key] = self.pages[page_index].subsurface(rect)
+        return packed
+
+    def _place(self, items, has_alpha):
+        """Раскладывает спрайты одной группы по полкам и копирует их на страницы.
+
+        Args:
+            items (list): Список пар (ключ, pygame.Surface), отсортированный по высоте.
+            has_alpha (bool): Нужны ли страницы с попиксельной прозрачностью.
+
+        Returns:
+            list: Список кортежей (ключ, номер страницы, pygame.Rect).
+        """
+        placed = []
+        page_index = None
+        x = y = shelf_height = 0
+
+        for key, sprite in items:
+            width, height = sprite.get_size()
+
+            if page_index is not None and x + width > self.page_size[0]:  # ряд заполнен - новая полка
+                x = 0
+                y += shelf_height + self.padding
+                shelf_height = 0
+
+            if page_index is None or y + height > self.page_size[1]:  # страница заполнена - новая страница
+                page_index = self._new_page(has_alpha)
+                x = y = shelf_height = 0
+
+            rect = pygame.Rect(x, y, width, height)
+            if has_alpha:
+                # BLEND_RGBA_MAX на пустой (0, 0, 0, 0) странице копирует пиксели вместе с альфой без смешивания
+                self.pages[page_index].blit(sprite, rect, special_flags=pygame.BLEND_RGBA_MAX)
+            else:
+                self.pages[page_index].blit(sprite, rect)
+            placed.append((key, page_index, rect))
+
+            x += width + self.padding
+            shelf_height = max(shelf_height, height)
+
+        return placed
+
+    def _new_page(self, has_alpha):
+        """Создает новую страницу атласа.
+
+        Args:
+            has_alpha (bool): Нужна ли попиксельная прозрачность.
+
+        Returns:
+            int: Номер созданной страницы.
+        """
+        if has_alpha:
+            page = pygame.Surface(self.page_size, pygame.SRCALPHA)
+            page.fill((0, 0, 0, 0))
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+        else:
+            page = pygame.Surface(self.page_size)
+            if pygame.display.get_surface() is not None:
+                page = page.convert()
+        self.pages.append(page)
+        return len(self.pages) - 1
+
+    def get(self, key):
+        """Возвращает подповерхность атласа для ключа.
+
+        Args:
+            key: Ключ спрайта, переданный в pack.
+
+        Returns:
+            pygame.Surface: Подповерхность страницы или None, если ключа нет.
+        """
+        region = self.regions.get(key)
+        if region is None:
+            return None
+        page_index, rect = region
+        return self.pages[page_index].subsurface(rect)
+
+    def __len__(self):
+        return len(self.regions)
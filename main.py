@@ -4,11 +4,41 @@
 Этот модуль запускает игру, обрабатывает аргументы командной строки
 и управляет главным игровым циклом.
 """
+import os
 import pygame
 import sys
 import time
 import argparse
 from game.game_manager import GameManager
+from game.asset_cache import DiskAssetCache
+from game.asset_loader import ParallelAssetLoader
+from game.dirty_renderer import DirtyRectRenderer, present
+from game.fixed_step import FixedTimestep
+from game.sound_manager import SoundManager
+from game.replay import Replay, ReplayRecorder, ReplayPlayer, play_headless
+from game.autopilot import Autopilot
+from game.snapshot import GameSnapshot, SnapshotHistory
+
+
+def seed_value(text):
+    """Проверяет зерно из командной строки: повтор и снимок хранят его как uint32.
+
+    Args:
+        text (str): Значение аргумента --seed.
+
+    Returns:
+        int: Зерно от 0 до 2**32-1.
+
+    Raises:
+        argparse.ArgumentTypeError: Если это не целое число или оно вне диапазона.
+    """
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{text}'")
+    if not 0 <= seed < GameManager.SEED_RANGE:
+        raise argparse.ArgumentTypeError(f"seed must be in 0..{GameManager.SEED_RANGE - 1}, got {seed}")
+    return seed
 
 
 def parse_arguments():
@@ -57,7 +87,172 @@ def parse_arguments():
         help='Количество кадров в секунду'
     )
 
-    return parser.parse_args()         # Возвращаем распарсенные аргументы
+    parser.add_argument(         # Аргумент для частоты шагов симуляции (не зависит от FPS)
+        '--tick-rate', '-t',
+        type=int,
+        default=120,
+        help='Шагов симуляции в секунду'
+    )
+
+    parser.add_argument(         # Аргумент для хранилища препятствий
+        '--obstacle-backend',
+        choices=('list', 'array'),
+        default='list',
+        help='Хранить препятствия списком объектов или в массивах NumPy'
+    )
+
+    parser.add_argument(         # Аргумент для отключения дискового кэша ресурсов
+        '--no-asset-cache',
+        action='store_true',
+        help='Декодировать PNG и MP3 заново, не используя кэш .asset_cache'
+    )
+
+    parser.add_argument(         # Аргумент для количества потоков загрузки ресурсов
+        '--load-workers',
+        type=int,
+        default=None,
+        help='Потоков для параллельной загрузки ресурсов (0 - загружать последовательно)'
+    )
+
+    parser.add_argument(         # Аргумент для таймаута ожидания событий в простое
+        '--idle-timeout',
+        type=int,
+        default=500,
+        help='Сколько миллисекунд ждать события на паузе и экране Game Over'
+    )
+
+    parser.add_argument(         # Аргумент для режима отрисовки измененных областей
+        '--dirty-rects',
+        action='store_true',
+        help='Обновлять на экране только измененные области вместо всего окна'
+    )
+
+    parser.add_argument(         # Аргумент для зерна случайных чисел
+        '--seed',
+        type=seed_value,
+        default=None,
+        help='Зерно случайных чисел (одно зерно - одни и те же препятствия)'
+    )
+
+    parser.add_argument(         # Аргумент для записи повтора
+        '--record',
+        type=str,
+        default=None,
+        metavar='FILE',
+        help='Записать зерно и нажатия в файл повтора'
+    )
+
+    parser.add_argument(         # Аргумент для воспроизведения повтора
+        '--replay',
+        type=str,
+        default=None,
+        metavar='FILE',
+        help='Воспроизвести файл повтора'
+    )
+
+    parser.add_argument(         # Аргумент для воспроизведения без окна
+        '--headless',
+        action='store_true',
+        help='Воспроизвести повтор без окна и звука с максимальной скоростью (вместе с --replay)'
+    )
+
+    parser.add_argument(         # Аргумент для встроенного бота
+        '--autopilot',
+        action='store_true',
+        help='Прыгать автоматически: бот перебирает варианты будущего по правилам игры'
+    )
+
+    parser.add_argument(         # Аргумент для расписания препятствий
+        '--spawn-schedule',
+        action='store_true',
+        help='Готовить препятствия заранее в фоновом потоке и не выпускать непроходимые сочетания'
+    )
+
+    parser.add_argument(         # Аргумент для снимка состояния
+        '--snapshot',
+        type=str,
+        default=None,
+        metavar='FILE',
+        help='Продолжить игру из файла снимка и сохранять в него состояние (раз в несколько секунд и при выходе)'
+    )
+
+    parser.add_argument(         # Аргумент для перемотки после проигрыша
+        '--rewind',
+        action='store_true',
+        help='После Game Over клавиша B возвращает игру на несколько секунд назад'
+    )
+
+    args = parser.parse_args()
+    if (args.snapshot or args.rewind) and (args.record or args.replay):
+        parser.error('--snapshot и --rewind нельзя использовать вместе с --record и --replay')
+    if args.autopilot and args.replay:
+        parser.error('--autopilot и --replay нельзя использовать вместе')
+    if args.headless and not args.replay:
+        parser.error('--headless работает только вместе с --replay')
+    if args.record and args.replay:
+        parser.error('--record и --replay нельзя использовать вместе')
+    if args.record:     # заголовок повтора хранит эти параметры в uint16 - проверяем до начала игры
+        for option, value in (('--speed', args.speed), ('--width', args.width), ('--height', args.height),
+                              ('--tick-rate', args.tick_rate)):
+            if not 0 <= value < Replay.FIELD_RANGE:
+                parser.error(f'{option} must be in 0..{Replay.FIELD_RANGE - 1} with --record, got {value}')
+    return args         # Возвращаем распарсенные аргументы
+
+
+def wait_for_events(timeout_ms):
+    """Ждет события, не нагружая процессор.
+
+    Args:
+        timeout_ms (int): Максимальное время ожидания в миллисекундах.
+
+    Returns:
+        list: Полученные события (пустой, если за это время ничего не произошло).
+    """
+    event = pygame.event.wait(timeout_ms)      # Поток спит, пока нет событий
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()        # Забираем все, что накопилось следом
+
+
+def viewer_events(events):
+    """Оставляет только события выхода: при просмотре повтора нажатия берутся из файла.
+
+    Args:
+        events (list): События pygame.
+
+    Returns:
+        list: Закрытие окна и нажатия ESC.
+    """
+    return [event for event in events
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE)]
+
+
+def print_replay_result(replay, game_manager):
+    """Печатает результат повтора и совпал ли он с записью.
+
+    Args:
+        replay (Replay): Воспроизведенный повтор.
+        game_manager (GameManager): Игра после воспроизведения.
+    """
+    result = game_manager.get_game_result()
+    print(f"Replay: score {result['score']}, speed {result['speed']}, lives {result['lives']}, "
+          f"{game_manager.tick} ticks")
+    print(f"Matches recording: {replay.matches(game_manager)}")
+
+
+def draw_frame(game_manager, screen, renderer=None):
+    """Рисует кадр и показывает его на экране.
+
+    Args:
+        game_manager (GameManager): Игра.
+        screen (pygame.Surface): Поверхность окна.
+        renderer (DirtyRectRenderer, optional): Рендерер измененных областей.
+    """
+    if renderer:
+        present(renderer.render(screen))    # только измененные области (или весь экран)
+    else:
+        game_manager.draw(screen)
+        pygame.display.flip()     # Обновление экрана (показываем нарисованное)
 
 
 def main():
@@ -71,8 +266,21 @@ def main():
     print(f"Player: {args.player}")     # Имя игрока
     print(f"Window: {args.width}x{args.height}")       # Размер окна
     print(f"FPS: {args.fps}")       # Частота кадров
+    print(f"Tick rate: {args.tick_rate}")       # Частота шагов симуляции
     print("=" * 50)
 
+    # Повтор: параметры игры берутся из файла
+    replay = Replay.load(args.replay) if args.replay else None
+    if replay and args.headless:
+        started = time.perf_counter()
+        game_manager = play_headless(replay)      # Без окна и звука, с максимальной скоростью
+        elapsed = time.perf_counter() - started
+        print_replay_result(replay, game_manager)
+        print(f"Played in {elapsed * 1000:.0f} ms ({game_manager.tick / max(elapsed, 1e-9):.0f} ticks/s)")
+        return
+    if replay:
+        args.width, args.height, args.tick_rate = replay.width, replay.height, replay.tick_rate
+
     # Инициализация Pygame (запуск игрового движка)
     pygame.init()
 
@@ -91,32 +299,117 @@ def main():
 
     clock = pygame.time.Clock()     # Создаем объект для контроля времени (таймер для FPS)
 
-    # Инициализация игры
-    game_manager = GameManager(args.width, args.height, args.speed)
+    # Дисковый кэш готовых пикселей и PCM: второй запуск не декодирует PNG и MP3
+    asset_cache = None if args.no_asset_cache else DiskAssetCache.enable()
+
+    # Параллельная загрузка ресурсов: декодирование в пуле потоков, пока рисуется экран загрузки
+    load_time = 0.0
+    if args.load_workers != 0:
+        sound_paths = SoundManager().sound_files() if pygame.mixer.get_init() else []
+        loader = ParallelAssetLoader(GameManager.sprite_requests(), sound_paths, args.load_workers)
+        load_time = loader.run(screen, pygame.event.pump)      # pump - чтобы окно не "зависало" во время загрузки
+
+    # Инициализация игры (ресурсы уже в кэше, если загрузчик был запущен)
+    if replay:
+        game_manager = ReplayPlayer.create_game(replay)      # Те же параметры и зерно, что при записи
+    else:
+        game_manager = GameManager(args.width, args.height, args.speed, args.obstacle_backend, seed=args.seed,
+                                   spawn_schedule=args.spawn_schedule)
     game_manager.player_name = args.player  # Устанавливаем имя игрока
+    if args.snapshot and os.path.exists(args.snapshot):
+        try:
+            GameSnapshot.load(game_manager, args.snapshot)      # Продолжаем с места, где игра прервалась
+            game_manager.is_paused = True      # После загрузки игра ждет игрока
+            print(f"Snapshot loaded: {args.snapshot} (tick {game_manager.tick}, score {game_manager.score})")
+        except ValueError as e:
+            print(f"Snapshot ignored: {e}")
+    print(f"Seed: {game_manager.seed}")
+
+    # Запись нажатий в повтор и проигрыватель повтора (None - обычная игра)
+    recorder = ReplayRecorder(game_manager, args.tick_rate) if args.record else None
+    replay_player = ReplayPlayer(replay, game_manager) if replay else None
+
+    # Встроенный бот (None - прыгает игрок); поиск - не больше 40% кадра, остальное - на отрисовку
+    autopilot = Autopilot(tick_rate=args.tick_rate, time_budget=0.4 / args.fps) if args.autopilot else None
+
+    # Снимки для перемотки после проигрыша: раз в секунду, последние 10 секунд
+    history = SnapshotHistory(args.tick_rate) if args.rewind else None
+    snapshot_every = args.tick_rate * 5     # Снимок в файл - каждые 5 секунд игры
+
+    # Время запуска (загрузка ресурсов) в консоль
+    startup_ms = (load_time + game_manager.startup_time) * 1000
+    if asset_cache:
+        print(f"Startup: {startup_ms:.0f} ms "
+              f"(asset cache: {asset_cache.hits} hits, {asset_cache.misses} misses)")
+    else:
+        print(f"Startup: {startup_ms:.0f} ms (asset cache off)")
+    if pygame.mixer.get_init():
+        print(f"Audio: {game_manager.sound_manager.load_time * 1000:.1f} ms "
+              f"(music {'pre-decoded' if game_manager.sound_manager.music else 'streamed'})")
+
+    # Рендерер измененных областей (None - каждый кадр рисуется и показывается целиком)
+    renderer = DirtyRectRenderer(game_manager) if args.dirty_rects else None
 
     # Игровой цикл
     start_time = time.time()     # Запоминаем время начала игры
     running = True       # Флаг работы игрового цикла
 
+    idle_drawn = False   # Кадр паузы уже показан - пока нет событий, экран не перерисовываем
+
+    # Фиксированный шаг: физика одинакова при 30, 60 и 144 FPS
+    timestep = FixedTimestep(args.tick_rate)
+
     while running:     # Главный цикл игры
-        # dt = delta time (время с прошлого кадра в секундах)
-        # tick(60) ограничивает FPS до 60 и возвращает время в миллисекундах
-        dt = clock.tick(args.fps) / 1000.0
+        if replay_player:
+            replay_player.apply_due()      # Нажатия из файла, записанные на текущем шаге
+            if replay_player.done():       # Повтор закончился
+                draw_frame(game_manager, screen, renderer)
+                break
+
+        if game_manager.is_idle():
+            # Простой (пауза): спим до события или таймаута вместо 60 кадров в секунду
+            events = wait_for_events(args.idle_timeout)
+            running = game_manager.handle_events(events)
+            if idle_drawn and not events:
+                continue       # Ничего не произошло - сцена та же, не рисуем
+            clock.tick()       # Сбрасываем таймер: время простоя не должно попасть в dt
+            timestep.reset()
+            game_manager.render_alpha = 1.0    # На паузе рисуем точное положение
+            idle_drawn = True
+        else:
+            # dt = delta time (время с прошлого кадра в секундах)
+            # tick(60) ограничивает FPS до 60 и возвращает время в миллисекундах
+            dt = clock.tick(args.fps) / 1000.0
 
-        # Обработка событий (нажатия клавиш, закрытие окна и т.д.)
-        # handle_events() возвращает False если нужно выйти из игры
-        running = game_manager.handle_events()
+            # Обработка событий (нажатия клавиш, закрытие окна и т.д.)
+            # handle_events() возвращает False если нужно выйти из игры
+            if replay_player:
+                running = game_manager.handle_events(viewer_events(pygame.event.get()))
+            else:
+                running = game_manager.handle_events()
 
-        # Обновление игровой логики (передвижение объектов, физика и т.д.)
-        game_manager.update(dt)
+            # Обновление игровой логики целыми шагами симуляции (передвижение объектов, физика и т.д.)
+            for _ in range(timestep.advance(dt)):
+                if replay_player:
+                    replay_player.apply_due()      # нажатие могло быть записано между шагами одного кадра
+                elif autopilot and autopilot.decide(game_manager):
+                    game_manager.record_input('jump')      # прыжки бота тоже попадают в повтор
+                    game_manager.jump()
+                game_manager.update(timestep.step_dt)
+                if history:
+                    history.record(game_manager)
+                if args.snapshot and game_manager.tick % snapshot_every == 0:
+                    GameSnapshot.save(game_manager, args.snapshot)
+
+            # Отрисовка между двумя последними шагами, чтобы движение было плавным при любом FPS
+            game_manager.render_alpha = 1.0 if game_manager.is_idle() else timestep.alpha
+            idle_drawn = False
 
         # Отрисовка
-        game_manager.draw(screen)
-        pygame.display.flip()     # Обновление экрана (показываем нарисованное)
+        draw_frame(game_manager, screen, renderer)
 
         # Проверка завершения игры
-        if game_manager.game_over:     # Если игра окончена
+        if game_manager.game_over and running and not replay_player:     # Если игра окончена (повтор сам решает, что дальше)
             game_duration = int(time.time() - start_time)      # Вычисляем продолжительность игры в секундах
             game_result = game_manager.get_game_result()       # Получаем результаты игры
 
@@ -130,27 +423,68 @@ def main():
             print("=" * 50)
 
             # Ожидание рестарта или выхода
-            print("\n Press R to restart or ESC to quit")
+            print("\n Press R to restart" + (", B to rewind" if history else "") + " or ESC to quit")
             waiting = True    # Флаг ожидания
             while waiting and running:     # Обработка событий в режиме ожидания
-                for event in pygame.event.get():
+                events = wait_for_events(args.idle_timeout)      # Спим, пока игрок ничего не нажал
+                for event in events:
                     if event.type == pygame.QUIT:     # Закрытие окна
                         waiting = False
                         running = False
                     elif event.type == pygame.KEYDOWN:     # Нажатие клавиши
                         if event.key == pygame.K_r:        # R - рестарт
+                            game_manager.record_input('restart')
                             game_manager.reset_game()      # Сброс игры
+                            if history:
+                                history.snapshots.clear()      # Снимки прошлой игры больше не нужны
                             start_time = time.time()       # Сброс таймера
                             waiting = False                # Выход из режима ожидания
                             print("\nGame restarted!")
+                        elif event.key == pygame.K_b and history and history.rewind(game_manager, args.tick_rate * 3):
+                            game_manager.is_paused = True      # B - назад на 3 секунды, игра ждет игрока
+                            waiting = False
+                            print(f"\nRewound to tick {game_manager.tick}")
                         elif event.key == pygame.K_ESCAPE:  # ESC - выход
                             waiting = False
                             running = False
 
-                # Продолжаем отрисовку экрана Game Over
-                game_manager.draw(screen)
-                pygame.display.flip()
-                clock.tick(args.fps)    # Поддерживаем FPS
+                # Экран Game Over собран один раз - показываем его заново только после событий
+                if events and waiting:
+                    draw_frame(game_manager, screen, renderer)
+            clock.tick()    # Время ожидания не должно попасть в dt первого кадра новой игры
+            timestep.reset()
+
+    if recorder:
+        size = recorder.save(args.record)      # Зерно, нажатия и итог игры
+        print(f"Replay saved: {args.record} ({size} bytes, {len(recorder.replay.inputs)} inputs)")
+    if replay_player:
+        print_replay_result(replay, game_manager)
+    if args.snapshot:
+        if game_manager.game_over:
+            if os.path.exists(args.snapshot):
+                os.remove(args.snapshot)       # Игра закончена - в следующий раз начнется новая
+        else:
+            size = GameSnapshot.save(game_manager, args.snapshot)
+            print(f"Snapshot saved: {args.snapshot} ({size} bytes)")
+
+    if autopilot and autopilot.decisions:
+        print(f"Autopilot: {autopilot.decisions} decisions, "
+              f"{autopilot.total_branches / autopilot.decisions:.1f} branches per decision")
+
+    if game_manager.spawn_schedule:
+        schedule_stats = game_manager.spawn_schedule.stats()
+        print(f"Spawn schedule: {schedule_stats['chunks']} chunks in {schedule_stats['plan_ms']:.0f} ms, "
+              f"{schedule_stats['delayed']} delayed, game waited {schedule_stats['wait_ms']:.1f} ms")
+
+    if renderer:
+        print(f"Dirty rects: {renderer.partial_frames} partial, {renderer.full_frames} full frames")
+
+    text_stats = game_manager.text_cache.stats()     # Эффективность кэша надписей
+    print(f"Text cache: {text_stats['hit_rate']:.1%} hit rate ({text_stats['misses']} renders)")
+
+    pool_stats = game_manager.obstacle_pool.stats()      # Заполнение пула препятствий
+    print(f"Obstacle pool: {pool_stats['created']} created, {pool_stats['reused']} reused, "
+          f"high water {pool_stats['high_water']}/{pool_stats['capacity']}")
 
     # Завершение
     pygame.quit()    # Закрытие Pygame
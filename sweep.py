@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Модуль sweep - массовый прогон игр без окна для настройки сложности.
+
+Играет все сочетания ботов, настроек сложности и зерен в пуле процессов
+(по процессу на ядро) и печатает итог по каждому сочетанию: средние
+счет, время выживания и наибольшую скорость. Результаты каждой игры
+пишутся в файл JSON Lines; повторный запуск с тем же файлом доигрывает
+только то, чего в нем еще нет.
+
+Запуск: python sweep.py --seeds 1000 --speed 400 500 --interval 1.5 1.2 --policy random:0.02 periodic:97
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from game.sweep import run_sweep
+
+
+def parse_arguments():
+    """Парсит аргументы командной строки.
+
+    Returns:
+        argparse.Namespace: Объект с распарсенными аргументами.
+    """
+    parser = argparse.ArgumentParser(description='Moti Runner - прогон игр без окна по зернам и настройкам')
+    parser.add_argument('--seeds', type=int, default=1000, help='Количество зерен на каждое сочетание')
+    parser.add_argument('--seed-start', type=int, default=0, help='Первое зерно')
+    parser.add_argument('--speed', type=int, nargs='+', default=[400], help='Начальные скорости')
+    parser.add_argument('--interval', type=float, nargs='+', default=[1.5],
+                        help='Начальные интервалы появления препятствий (секунды)')
+    parser.add_argument('--speed-step', type=int, nargs='+', default=[5],
+                        help='Через сколько очков игра ускоряется')
+    parser.add_argument('--policy', nargs='+', default=['random:0.02'],
+                        help='Боты "имя:параметр": random:вероятность, periodic:шагов, autopilot:секунд')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Процессов (по умолчанию - по числу ядер)')
+    parser.add_argument('--chunk-size', type=int, default=50, help='Зерен в одной задаче процесса')
+    parser.add_argument('--max-seconds', type=float, default=600, help='Ограничение игрового времени одной игры')
+    parser.add_argument('--tick-rate', type=int, default=120, help='Шагов симуляции в секунду')
+    parser.add_argument('--output', '-o', default='sweep_results.jsonl', help='Файл результатов (JSON Lines)')
+    parser.add_argument('--fresh', action='store_true', help='Начать заново, удалив старый файл результатов')
+    return parser.parse_args()
+
+
+def print_summary(rows):
+    """Печатает итог по сочетаниям бота и настроек.
+
+    Args:
+        rows (list): Строки SweepStats.rows().
+    """
+    print(f"{'policy':<16}{'speed':>6}{'interval':>9}{'step':>5}{'games':>7}{'score':>8}"
+          f"{'best':>6}{'survival s':>11}{'max speed':>10}{'timeouts':>9}")
+    for row in rows:
+        print(f"{row['policy']:<16}{row['speed']:>6}{row['obstacle_interval']:>9.2f}"
+              f"{row['speed_increase_interval']:>5}{row['games']:>7}{row['mean_score']:>8.2f}"
+              f"{row['best_score']:>6}{row['mean_survival']:>11.1f}{row['mean_max_speed']:>10.0f}{row['timeouts']:>9}")
+
+
+def main():
+    """Запускает прогон и печатает итог."""
+    args = parse_arguments()
+    if args.fresh and os.path.exists(args.output):
+        os.remove(args.output)
+
+    settings_grid = [{'speed': speed, 'obstacle_interval': interval, 'speed_increase_interval': step}
+                     for speed in args.speed for interval in args.interval for step in args.speed_step]
+    seeds = range(args.seed_start, args.seed_start + args.seeds)
+
+    started = time.perf_counter()
+    def progress(played, total):
+        elapsed = time.perf_counter() - started
+        print(f"\rСыграно {played}/{total} ({played / elapsed:.0f} игр/с)", end='', file=sys.stderr, flush=True)
+
+    try:
+        stats = run_sweep(settings_grid, args.policy, seeds, args.output, args.workers, args.chunk_size,
+                          args.max_seconds, args.tick_rate, progress)
+    except ValueError as e:
+        sys.exit(f"Ошибка: {e}")
+    print(file=sys.stderr)
+    print_summary(stats.rows())
+    print(f"Всего игр: {stats.games}, результаты: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,12 +4,52 @@
 основных классов игры: BaseObject, Obstacle, Player и других.
 """
 
+import os
+import random
 import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')   # Тесты запускаются без настоящего окна
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')   # и без звуковой карты
+
 import pygame
 from game.base_object import BaseObject
 from game.obstacle import Obstacle
 from game.player import Player
 from game.sound_manager import SoundManager
+from game.sprite_loader import SpriteLoader
+from game.sprite_cache import SpriteCache
+from game.asset_manifest import AssetManifest
+from game.texture_atlas import TextureAtlas
+from game.asset_cache import DiskAssetCache
+from game.asset_loader import ParallelAssetLoader
+from game.dirty_renderer import DirtyRectRenderer
+from game.text_cache import TextCache
+from game.fixed_step import FixedTimestep
+from game.collision import swept_aabb, swept_collides
+from game.obstacle_array import ObstacleArray, np
+from game.obstacle_pool import ObstaclePool
+from game.scenery import Cloud
+from game.simulation import Simulation
+from game.replay import Replay, ReplayRecorder, ReplayPlayer, play_headless, state_digest
+from game.batch_env import BatchEnv
+from game.sweep import run_sweep, load_results, play_game
+from game.game_state import GameState
+from game.autopilot import Autopilot
+from game.snapshot import GameSnapshot, SnapshotHistory
+from game.spawn_schedule import JumpReachability, ScheduledSpawn, SpawnSchedule
+from game.game_manager import GameManager
+
+
+def init_display():     # convert()/convert_alpha() требуют созданного окна
+    pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+def make_game_manager(width=1200, height=800, **kwargs):      # Менеджер игры для тестов (нужны окно и шрифты)
+    init_display()
+    pygame.font.init()
+    return GameManager(width, height, **kwargs)
 
 class TestBaseObject(unittest.TestCase):
     def test_collides_with(self):    # Тестирование обнаружения столкновений между объектами
@@ -55,6 +95,16 @@ class TestObstacle(unittest.TestCase):
         other = BaseObject(10, 10, 50, 50)       # Создаем другой объект, который пересекается с препятствием
         self.assertTrue(obs.collides_with(other))  # Проверяем, что столкновение обнаруживается (с учетом хитбокса)
 
+    def test_collision_is_symmetric(self):      # Без картинки препятствие - сплошной прямоугольник с обеих сторон
+        player = Player(100, 500)
+        for overlap in (5, 10, 14):
+            obs = Obstacle(player.rect.right - overlap, 500, 60, 60)
+            obs.sprite = None
+            obs.rect.size = (60, 60)
+            self.assertEqual(obs.collides_with(player), player.collides_with(obs))
+            self.assertEqual(obs.collides_at(obs.rect, player, player.rect),
+                             player.collides_at(player.rect, obs, obs.rect))
+
 class TestPlayer(unittest.TestCase):
     def setUp(self):       # Настройка перед каждым тестом - создаем игрока
         self.player = Player(0, 400, jump_height=200, gravity=500)    # x=0, y=400 (высота земли), высота прыжка 200, гравитация 500
@@ -120,6 +170,1097 @@ class TestHeart(unittest.TestCase):     # Тесты для класса сер
         heart_no = Heart(200, 410, size=40)   # Создаем сердечко, которое НЕ пересекается с игроком
         self.assertFalse(player.collides_with(heart_no))    # Должно быть False
 
+class TestSpriteCache(unittest.TestCase):     # Тесты общего кэша спрайтов
+    def setUp(self):
+        init_display()
+        SpriteLoader.invalidate_cache()     # Каждый тест начинает с пустого кэша
+        SpriteLoader.cache.reset_stats()
+        self.path = os.path.join(SpriteLoader.get_assets_path(), 'obstacles', 'bird.png')
+
+    def test_second_load_is_hit(self):      # Повторная загрузка берется из кэша
+        first = SpriteLoader.load_sprite(self.path, 40, 20)
+        second = SpriteLoader.load_sprite(self.path, 40, 20)
+        self.assertIs(first, second)        # Та же самая поверхность, без повторного декодирования
+        self.assertEqual(SpriteLoader.cache.hits, 1)
+        self.assertEqual(SpriteLoader.cache.misses, 1)
+
+    def test_key_includes_size_and_flip(self):      # Разный размер и отражение - разные записи
+        normal = SpriteLoader.load_sprite(self.path, 40, 20)
+        bigger = SpriteLoader.load_sprite(self.path, 80, 40)
+        flipped = SpriteLoader.load_sprite(self.path, 40, 20, flip_x=True)
+        self.assertEqual(bigger.get_size(), (80, 40))
+        self.assertIsNot(normal, flipped)
+        self.assertEqual(len(SpriteLoader.cache), 3)
+
+    def test_size_bound(self):      # При переполнении вытесняется самая старая запись
+        cache = SpriteCache(max_size=2)
+        cache.put(('a',), pygame.Surface((1, 1)))
+        cache.put(('b',), pygame.Surface((1, 1)))
+        cache.get(('a',))       # 'a' стал самым свежим
+        cache.put(('c',), pygame.Surface((1, 1)))
+        self.assertIn(('a',), cache)
+        self.assertNotIn(('b',), cache)
+
+    def test_invalidate_path(self):     # Сброс по пути удаляет все размеры этого файла
+        SpriteLoader.load_sprite(self.path, 40, 20)
+        SpriteLoader.load_sprite(self.path)
+        self.assertEqual(SpriteLoader.invalidate_cache(self.path), 2)
+        self.assertEqual(len(SpriteLoader.cache), 0)
+
+class TestAssetManifest(unittest.TestCase):      # Тесты манифеста ресурсов
+    def setUp(self):
+        self.manifest = AssetManifest()
+        self.manifest.scan()
+
+    def test_obstacle_kinds(self):      # Птица - летающее препятствие, кости - наземные
+        flying = [entry.name for entry in self.manifest.obstacles['flying']]
+        ground = [entry.name for entry in self.manifest.obstacles['ground']]
+        self.assertEqual(flying, ['bird.png'])
+        self.assertEqual(ground, ['bone1.png', 'bone2.png', 'bone3.png'])
+
+    def test_dimensions_from_header(self):      # Размеры из заголовка PNG совпадают с реальными
+        for entry in self.manifest.files('player'):
+            self.assertEqual((entry.width, entry.height), pygame.image.load(entry.path).get_size())
+
+    def test_write_and_load(self):      # Сгенерированный файл читается обратно без сканирования
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.manifest.write(os.path.join(tmp, 'manifest.json'))
+            loaded = AssetManifest()
+            self.assertTrue(loaded.load(path))
+        self.assertEqual([e.name for e in loaded.obstacles['ground']],
+                         [e.name for e in self.manifest.obstacles['ground']])
+        self.assertEqual(loaded.files('ui')[0].width, self.manifest.files('ui')[0].width)
+
+    def test_overwritten_file_is_stale(self):      # Картинку перезаписали на месте - манифест сканируется заново
+        import shutil
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            obstacles = os.path.join(tmp, 'obstacles')
+            os.mkdir(obstacles)
+            path = os.path.join(obstacles, 'bone1.png')
+            pygame.image.save(pygame.Surface((40, 30)), path)
+            manifest = AssetManifest(tmp)
+            manifest.scan()
+            manifest.write()
+            self.assertTrue(AssetManifest(tmp).load())
+
+            folder_mtime = os.stat(obstacles).st_mtime_ns
+            new = os.path.join(tmp, 'new.png')
+            pygame.image.save(pygame.Surface((70, 50)), new)
+            shutil.copyfile(new, path)      # как cp new.png bone1.png
+            self.assertEqual(os.stat(obstacles).st_mtime_ns, folder_mtime)     # папка не изменилась
+
+            stale = AssetManifest(tmp)
+            self.assertFalse(stale.load())
+            stale.scan()
+            self.assertEqual((stale.obstacles['ground'][0].width, stale.obstacles['ground'][0].height), (70, 50))
+
+    def test_spawn_without_filesystem(self):    # Создание препятствия не обращается к файловой системе
+        from unittest import mock
+        init_display()
+        AssetManifest.shared().preload()
+        with mock.patch('os.listdir') as listdir, mock.patch('os.path.exists') as exists:
+            obs = Obstacle.create_random(800, 500, 300)
+        listdir.assert_not_called()
+        exists.assert_not_called()
+        self.assertIsNotNone(obs.sprite)
+
+class TestTextureAtlas(unittest.TestCase):      # Тесты атласа текстур
+    def setUp(self):
+        init_display()
+        folder = os.path.join(SpriteLoader.get_assets_path(), 'obstacles')
+        self.sprites = {name: SpriteLoader.decode_sprite(os.path.join(folder, name))
+                        for name in ('bird.png', 'bone1.png', 'bone2.png', 'bone3.png')}
+
+    def test_regions_do_not_overlap(self):      # Области спрайтов на странице не пересекаются
+        atlas = TextureAtlas(page_size=(128, 128))
+        atlas.pack(self.sprites)
+        rects = [rect for _, rect in atlas.regions.values()]
+        for i, rect in enumerate(rects):
+            self.assertEqual(rect.collidelist(rects[i + 1:]), -1)
+
+    def test_pixels_preserved(self):        # Подповерхность атласа совпадает с исходным спрайтом попиксельно
+        atlas = TextureAtlas(page_size=(80, 80))        # Маленькие страницы - спрайты разойдутся на несколько
+        packed = atlas.pack(self.sprites)
+        self.assertGreater(len(atlas.pages), 1)
+        for name, sprite in self.sprites.items():
+            region = packed[name]
+            self.assertEqual(region.get_size(), sprite.get_size())
+            for x in range(0, sprite.get_width(), 3):
+                for y in range(0, sprite.get_height(), 3):
+                    self.assertEqual(region.get_at((x, y)), sprite.get_at((x, y)))
+
+    def test_oversized_sprite_skipped(self):    # Спрайт больше страницы в атлас не попадает
+        atlas = TextureAtlas(page_size=(32, 32))
+        packed = atlas.pack({'big': pygame.Surface((64, 64))})
+        self.assertNotIn('big', packed)
+        self.assertEqual(len(atlas), 0)
+
+class TestDiskAssetCache(unittest.TestCase):    # Тесты дискового кэша готовых пикселей
+    def setUp(self):
+        import tempfile
+        init_display()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = DiskAssetCache(os.path.join(self.tmp.name, 'cache'))
+        self.source = os.path.join(self.tmp.name, 'sprite.png')     # Своя копия картинки, чтобы ее можно было менять
+        bird = pygame.image.load(os.path.join(SpriteLoader.get_assets_path(), 'obstacles', 'bird.png'))
+        pygame.image.save(bird, self.source)
+
+    def tearDown(self):
+        DiskAssetCache.disable()
+        self.tmp.cleanup()
+
+    def test_roundtrip(self):       # Прочитанные из кэша пиксели совпадают с декодированными
+        sprite = SpriteLoader.decode_sprite(self.source, 40, 20)
+        self.assertIsNone(self.cache.read_image(self.source, 40, 20))     # Кэш пока пуст
+        self.cache.write_image(self.source, 40, 20, sprite)
+        cached = self.cache.read_image(self.source, 40, 20)
+        self.assertEqual(cached.get_size(), (40, 20))
+        for x in range(40):
+            for y in range(20):
+                self.assertEqual(cached.get_at((x, y)), sprite.get_at((x, y)))
+
+    def test_touch_keeps_entry(self):       # Новый mtime с тем же содержимым - запись актуальна (сверка по хэшу)
+        self.cache.write_image(self.source, None, None, SpriteLoader.decode_sprite(self.source))
+        os.utime(self.source, ns=(1, 1))
+        self.assertIsNotNone(self.cache.read_image(self.source))
+        entry = self.cache._entry_path(self.source, (None, None), '.img')
+        with open(entry, 'rb') as f:        # Новый mtime записан - следующий запуск не считает хэш
+            self.assertEqual(DiskAssetCache.IMAGE_HEADER.unpack(f.read(DiskAssetCache.IMAGE_HEADER.size))[-3], 1)
+        self.assertIsNotNone(self.cache.read_image(self.source))
+
+    def test_changed_source_invalidates(self):      # Измененный исходник - запись устарела
+        self.cache.write_image(self.source, None, None, SpriteLoader.decode_sprite(self.source))
+        pygame.image.save(pygame.Surface((5, 5)), self.source)
+        self.assertIsNone(self.cache.read_image(self.source))
+
+    def test_decode_uses_active_cache(self):    # SpriteLoader пишет в кэш и при повторной загрузке читает из него
+        DiskAssetCache.active = self.cache
+        SpriteLoader.decode_sprite(self.source, 40, 20)
+        SpriteLoader.decode_sprite(self.source, 40, 20)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+class TestParallelAssetLoader(unittest.TestCase):       # Тесты параллельной загрузки ресурсов
+    def setUp(self):
+        init_display()
+        SpriteLoader.invalidate_cache()
+
+    def test_sprites_land_in_cache(self):       # Все запрошенные спрайты оказываются в кэше, повторные запросы - попадания
+        folder = os.path.join(SpriteLoader.get_assets_path(), 'player')
+        requests = [(os.path.join(folder, 'run1.png'), 90, 120), (os.path.join(folder, 'jump.png'), None, None)]
+        loader = ParallelAssetLoader(requests + requests, workers=2)      # Дубликаты загружаются один раз
+        loader.run()
+        self.assertEqual(loader.total, 2)
+        self.assertEqual(loader.progress(), 1.0)
+        SpriteLoader.cache.reset_stats()
+        self.assertEqual(SpriteLoader.load_sprite(*requests[0]).get_size(), (90, 120))
+        self.assertEqual(SpriteLoader.cache.hits, 1)
+
+    def test_missing_file_reported(self):       # Отсутствующий файл не останавливает загрузку
+        loader = ParallelAssetLoader([('no_such_file.png', None, None)], workers=1)
+        loader.run()
+        self.assertTrue(loader.done())
+        self.assertEqual(len(loader.errors), 1)
+
+class TestCollisionMasks(unittest.TestCase):    # Тесты попиксельных столкновений по маскам
+    def make_object(self, x, y, opaque_width):      # Объект 50x50, непрозрачна только левая полоса заданной ширины
+        sprite = pygame.Surface((50, 50), pygame.SRCALPHA)
+        sprite.fill((255, 0, 0, 255), (0, 0, opaque_width, 50))
+        obj = BaseObject(x, y, 50, 50)
+        obj.sprite = sprite
+        return obj
+
+    def test_transparent_overlap_is_not_hit(self):      # Прямоугольники пересекаются, но только прозрачными пикселями
+        left = self.make_object(0, 0, 10)
+        right = self.make_object(30, 0, 50)
+        self.assertTrue(left.rect.colliderect(right.rect))
+        self.assertFalse(left.collides_with(right))
+        self.assertFalse(right.collides_with(left))
+
+    def test_opaque_overlap_is_hit(self):       # Непрозрачные пиксели пересекаются - столкновение
+        left = self.make_object(0, 0, 40)
+        right = self.make_object(30, 0, 50)
+        self.assertTrue(left.collides_with(right))
+
+    def test_object_without_sprite_is_solid(self):      # Объект без спрайта считается сплошным прямоугольником
+        left = self.make_object(0, 0, 10)
+        self.assertTrue(left.collides_with(BaseObject(5, 5, 10, 10)))
+        self.assertFalse(left.collides_with(BaseObject(20, 5, 10, 10)))
+
+    def test_mask_built_once(self):     # Маска кадра строится один раз и переиспользуется
+        obj = self.make_object(0, 0, 10)
+        self.assertIs(obj.get_mask(), obj.get_mask())
+
+class TestBackgroundLayer(unittest.TestCase):       # Тесты заранее нарисованного фона
+    def setUp(self):
+        self.gm = make_game_manager(400, 300)
+
+    def test_same_pixels_as_per_row_drawing(self):      # Слой дает ту же картинку, что и старая отрисовка по строкам
+        screen = pygame.Surface((400, 300))
+        self.gm.draw_background(screen)
+
+        expected = pygame.Surface((400, 300))
+        for y in range(300):
+            pygame.draw.line(expected, (255, 200, 255), (0, y), (400, y))
+        for i in range(4):
+            expected.blit(self.gm.background_sprites['mountain'], (i * 400, self.gm.ground_y - 225))
+        for cloud in self.gm.clouds:
+            expected.blit(self.gm.background_sprites['cloud'], (cloud.x, cloud.y))
+        ground = self.gm.background_sprites['ground']
+        for x in range(0, 400, ground.get_width()):
+            expected.blit(ground, (x, self.gm.ground_y))
+
+        self.assertEqual(pygame.image.tobytes(screen, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+
+    def test_layer_rebuilt_only_on_resize(self):        # Слой переиспользуется, пока не изменится размер окна
+        self.gm.draw_background(pygame.Surface((400, 300)))
+        layer = self.gm.background_layer
+        self.gm.draw_background(pygame.Surface((400, 300)))
+        self.assertIs(self.gm.background_layer, layer)
+        self.gm.draw_background(pygame.Surface((500, 300)))
+        self.assertEqual(self.gm.background_layer.get_size(), (500, 300))
+
+
+class TestDirtyRectRenderer(unittest.TestCase):     # Тесты отрисовки только измененных областей
+    def setUp(self):
+        self.gm = make_game_manager()
+        self.gm.is_paused = False       # игра стартует с меню паузы
+        self.gm.spawn_interval = 0.1    # чтобы за несколько кадров появились препятствия
+
+    def test_same_pixels_as_full_draw(self):        # Частичная перерисовка дает тот же кадр, что и полная
+        renderer = DirtyRectRenderer(self.gm, threshold=1.0)
+        screen = pygame.Surface((1200, 800))
+        for _ in range(20):
+            self.gm.update(1 / 60)
+            if self.gm.game_over:
+                break
+            renderer.render(screen)
+            expected = pygame.Surface((1200, 800))
+            self.gm.draw(expected)
+            self.assertEqual(pygame.image.tobytes(screen, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+        self.assertGreater(renderer.partial_frames, 0)
+
+    def test_full_frame_on_pause(self):     # На паузе кадр показывается целиком
+        renderer = DirtyRectRenderer(self.gm)
+        screen = pygame.Surface((1200, 800))
+        renderer.render(screen)
+        self.assertIsNotNone(renderer.render(screen))   # обычный кадр - список прямоугольников
+        self.gm.is_paused = True
+        self.assertIsNone(renderer.render(screen))
+        self.assertEqual(renderer.render(screen), [])   # кадр паузы не изменился - экран не обновляется
+
+
+class TestTextCache(unittest.TestCase):     # Тесты кэша отрисованного текста
+    def setUp(self):
+        pygame.font.init()
+        self.font = pygame.font.SysFont(None, 24)
+
+    def test_same_text_rendered_once(self):     # Повторный запрос возвращает ту же поверхность
+        cache = TextCache()
+        first = cache.render(self.font, 'SCORE: 1', True, (200, 100, 150))
+        self.assertIs(cache.render(self.font, 'SCORE: 1', True, (200, 100, 150)), first)
+        self.assertIsNot(cache.render(self.font, 'SCORE: 1', True, (0, 0, 0)), first)    # другой цвет - другая надпись
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 2)
+
+    def test_lru_eviction(self):        # При переполнении удаляется самая давно использованная надпись
+        cache = TextCache(max_size=2)
+        cache.render(self.font, 'a', True, (0, 0, 0))
+        cache.render(self.font, 'b', True, (0, 0, 0))
+        cache.render(self.font, 'a', True, (0, 0, 0))
+        cache.render(self.font, 'c', True, (0, 0, 0))     # вытесняет 'b'
+        self.assertEqual(len(cache), 2)
+        cache.reset_stats()
+        cache.render(self.font, 'a', True, (0, 0, 0))
+        cache.render(self.font, 'b', True, (0, 0, 0))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_steady_hud_frames_hit_cache(self):     # Пока счет не меняется, HUD не растеризует текст
+        gm = make_game_manager()
+        gm.is_paused = False        # на паузе показывается собранный кадр без HUD-рендера
+        screen = pygame.Surface((1200, 800))
+        gm.draw(screen)
+        gm.text_cache.reset_stats()
+        for _ in range(5):
+            gm.draw(screen)
+        self.assertEqual(gm.text_cache.misses, 0)
+        self.assertEqual(gm.text_cache.stats()['hit_rate'], 1.0)
+
+
+class TestFrozenFrame(unittest.TestCase):       # Тесты собранного кадра паузы и Game Over
+    def setUp(self):
+        self.gm = make_game_manager()
+        self.screen = pygame.Surface((1200, 800))
+
+    def test_same_pixels_as_live_drawing(self):     # Собранный кадр совпадает с отрисовкой сцены и меню
+        self.gm.draw(self.screen)
+        expected = pygame.Surface((1200, 800))
+        self.gm.draw_scene(expected)
+        self.gm.draw_pause_menu(expected)
+        self.assertEqual(pygame.image.tobytes(self.screen, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+
+    def test_built_once_while_paused(self):     # На паузе кадр не пересобирается
+        for _ in range(10):
+            self.gm.draw(self.screen)
+        self.assertEqual(self.gm.frozen_frame_builds, 1)
+
+    def test_rebuilt_on_volume_change(self):        # Изменение громкости или звука пересобирает кадр
+        self.gm.draw(self.screen)
+        self.gm.sound_manager.volume = 0.8
+        self.gm.draw(self.screen)
+        self.gm.sound_manager.sound_enabled = not self.gm.sound_manager.sound_enabled
+        self.gm.draw(self.screen)
+        self.assertEqual(self.gm.frozen_frame_builds, 3)
+
+    def test_rebuilt_after_resume(self):        # После продолжения игры следующая пауза собирается заново
+        self.gm.draw(self.screen)
+        self.gm.is_paused = False
+        self.gm.draw(self.screen)
+        self.assertIsNone(self.gm.frozen_frame)
+        self.gm.is_paused = True
+        self.gm.draw(self.screen)
+        self.assertEqual(self.gm.frozen_frame_builds, 2)
+
+
+class TestFixedTimestep(unittest.TestCase):     # Тесты фиксированного шага симуляции
+    def test_steps_and_alpha(self):     # Время кадра делится на целые шаги, остаток - в alpha
+        timestep = FixedTimestep(tick_rate=100)
+        self.assertEqual(timestep.advance(0.025), 2)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+        self.assertEqual(timestep.advance(0.005), 1)
+        self.assertAlmostEqual(timestep.alpha, 0.0)
+
+    def test_long_frame_clamped(self):      # Подвисание окна не превращается в огромный dt
+        timestep = FixedTimestep(tick_rate=100, max_frame_time=0.25)
+        self.assertEqual(timestep.advance(5.0), 25)
+
+    def simulate(self, fps, seconds):       # Игра с прыжком при заданной частоте кадров
+        random.seed(7)
+        gm = make_game_manager()
+        gm.is_paused = False
+        timestep = FixedTimestep(tick_rate=120)
+        for frame in range(int(fps * seconds)):
+            if frame == fps // 2:
+                gm.player.jump()
+            for _ in range(timestep.advance(1.0 / fps)):
+                gm.update(timestep.step_dt)
+        return timestep.steps, gm.player.rect.topleft, [o.rect.topleft for o in gm.obstacles]
+
+    def test_same_simulation_at_any_fps(self):      # Результат не зависит от частоты кадров
+        self.assertEqual(self.simulate(30, 3), self.simulate(144, 3))
+
+    def test_render_interpolation(self):        # Отрисовка между прошлым и текущим положением
+        obj = BaseObject(100, 50, 10, 10)
+        obj.save_position()
+        obj.pos_x = 110
+        obj.update_rect()
+        self.assertEqual(obj.render_rect(0.0).x, 100)
+        self.assertEqual(obj.render_rect(0.5).x, 105)
+        self.assertEqual(obj.render_rect(1.0).x, 110)
+
+
+class TestSubPixelPosition(unittest.TestCase):      # Тесты дробных координат объектов
+    def setUp(self):
+        init_display()      # спрайты препятствий конвертируются под окно
+
+    def test_slow_motion_not_lost(self):        # Сдвиг меньше пикселя за кадр копится, а не теряется
+        obs = Obstacle(1000, 100, speed=60)
+        for _ in range(240):        # 1 секунда при 240 FPS: по 0.25 пикселя за кадр
+            obs.update(1 / 240)
+        self.assertEqual(obs.rect.x, 940)
+        self.assertAlmostEqual(obs.pos_x, 940.0)
+
+    def test_rect_teleport_is_picked_up(self):      # Прямое изменение rect переносит объект
+        obs = Obstacle(1000, 100, speed=300)
+        obs.rect.x = 100
+        obs.update(0.1)
+        self.assertEqual(obs.rect.x, 70)
+
+    def test_set_position(self):        # set_position ставит объект без интерполяции
+        obj = BaseObject(0, 0, 10, 10)
+        obj.set_position(12.6, 3.2)
+        self.assertEqual(obj.rect.topleft, (13, 3))
+        self.assertEqual(obj.render_rect(0.0).topleft, (13, 3))
+
+
+class TestSweptCollision(unittest.TestCase):        # Тесты непрерывной проверки столкновений
+    def setUp(self):
+        init_display()
+        random.seed(3)
+        self.player = Player(100, 500)
+
+    def pass_through(self, speed, y=490, obstacle_type=None, dt=1 / 60, check=swept_collides):     # Препятствие проходит мимо игрока
+        obstacle = Obstacle(self.player.rect.right + 5, y, speed=speed, obstacle_type=obstacle_type)
+        while obstacle.rect.right > self.player.rect.left - 5:      # шаги, пока препятствие не окажется левее игрока
+            self.player.save_position()
+            obstacle.save_position()
+            obstacle.update(dt)
+            if check(self.player, obstacle):
+                return True
+        return False
+
+    def test_swept_aabb_interval(self):     # Время входа и выхода по относительному движению
+        hit = swept_aabb(pygame.Rect(0, 0, 10, 10), pygame.Rect(100, 0, 10, 10),
+                         pygame.Rect(45, 0, 10, 10), pygame.Rect(45, 0, 10, 10))
+        self.assertAlmostEqual(hit[0], 0.35)
+        self.assertAlmostEqual(hit[1], 0.55)
+        self.assertIsNone(swept_aabb(pygame.Rect(0, 0, 10, 10), pygame.Rect(100, 0, 10, 10),
+                                     pygame.Rect(45, 20, 10, 10), pygame.Rect(45, 20, 10, 10)))
+
+    def test_no_tunneling_up_to_high_speed(self):       # Ни одного пропуска вплоть до очень большой скорости
+        naive_misses = 0
+        for speed in range(400, 200001, 400):
+            self.assertTrue(self.pass_through(speed), f"пропуск на скорости {speed}")
+            naive_misses += not self.pass_through(speed, check=Player.collides_with)
+        self.assertGreater(naive_misses, 0)     # обычная проверка на этих скоростях промахивается
+
+    def test_dt_spike(self):        # Долгий кадр тоже не дает проскочить
+        self.assertFalse(self.pass_through(400, dt=2.0, check=Player.collides_with))
+        self.assertTrue(self.pass_through(400, dt=2.0))
+
+    def test_no_false_hits_above_player(self):      # Птица высоко над игроком не задевает его
+        for speed in (400, 5000, 100000):
+            self.assertFalse(self.pass_through(speed, y=500 - 250, obstacle_type='bird'))
+
+
+@unittest.skipUnless(ObstacleArray.available(), "нужен NumPy")
+class TestObstacleArray(unittest.TestCase):     # Тесты хранилища препятствий в массивах NumPy
+    def test_move_score_and_cull(self):     # Движение, очки и удаление за экраном - векторные операции
+        array = ObstacleArray(capacity=2)
+        array.add(100, 0, 50, 50, speed=100)
+        array.add(300, 0, 50, 50, speed=100)
+        array.add(10, 0, 50, 50, speed=1000)     # массивы расширяются сами
+        array.update(0.5)
+        self.assertEqual(array.x[:3].tolist(), [50.0, 250.0, -490.0])
+        self.assertEqual(array.mark_passed(120), 2)     # 50 + 50 < 120 и -490 + 50 < 120
+        self.assertEqual(array.mark_passed(120), 0)     # повторно очки не начисляются
+        self.assertEqual(array.cull(), 1)
+        self.assertEqual(array.x[:len(array)].tolist(), [50.0, 250.0])
+
+    def test_same_game_as_list_backend(self):       # Игра с массивами совпадает с игрой на списке
+        def play(backend):
+            random.seed(5)
+            make_game_manager()     # окно и шрифты
+            gm = GameManager(obstacle_backend=backend)
+            gm.is_paused = False
+            gm.lives = 1000         # чтобы столкновения не закончили игру
+            for step in range(3000):
+                if step % 97 == 0:
+                    gm.player.jump()
+                gm.update(1 / 120)
+            if gm.obstacle_array is not None:
+                xs = [round(float(x)) for x in gm.obstacle_array.x[:len(gm.obstacle_array)]]
+            else:
+                xs = [obstacle.rect.x for obstacle in gm.obstacles]
+            return gm.score, gm.lives, xs
+
+        result = play('array')
+        self.assertLess(result[1], 1000)       # столкновения были
+        self.assertEqual(result, play('list'))
+
+    def test_spriteless_hit_matches_list_backend(self):     # Препятствие без картинки - сплошной прямоугольник в обоих хранилищах
+        def hit(backend, overlap):
+            game = Simulation(seed=0, obstacle_backend=backend).game
+            game.obstacle_timer = -100      # новые препятствия не появляются
+            x, y = game.player.rect.right - overlap, game.player.rect.y
+            if game.obstacle_array is not None:
+                game.obstacle_array.add(x, y, 60, 60, speed=0)
+            else:
+                obstacle = Obstacle(x, y, 60, 60, speed=0)
+                obstacle.sprite = None      # картинка из манифеста не нужна
+                obstacle.rect.size = (60, 60)
+                game.obstacles.append(obstacle)
+            game.update(1 / 120)
+            return game.lives < 3
+
+        results = [hit('list', overlap) for overlap in (5, 10, 14)]
+        self.assertTrue(any(results))
+        self.assertEqual([hit('array', overlap) for overlap in (5, 10, 14)], results)
+
+
+class TestObstaclePool(unittest.TestCase):      # Тесты пула переиспользуемых препятствий
+    def setUp(self):
+        init_display()
+
+    def test_release_and_reuse(self):       # Возвращенное препятствие выдается снова с новыми параметрами
+        pool = ObstaclePool(capacity=2)
+        first = pool.acquire(500, 100, 60, 40, speed=300, obstacle_type='bird')
+        first.passed = True
+        first.pos_x = -200
+        first.update_rect()
+        pool.release(first)
+
+        second = pool.acquire(1300, 490, 180, 190, speed=500)
+        self.assertIs(second, first)        # тот же объект
+        self.assertEqual((second.rect.x, second.rect.y), (1300, 490))
+        self.assertEqual(second.render_rect(0.0).x, 1300)       # без интерполяции от старого места
+        self.assertFalse(second.passed)
+        self.assertEqual(second.speed, 500)
+        self.assertIsNone(second.obstacle_type)
+        self.assertEqual(pool.stats()['created'], 1)
+        self.assertEqual(pool.stats()['reused'], 1)
+
+    def test_capacity_and_stats(self):      # Сверх емкости объекты создаются, но в пуле не хранятся
+        pool = ObstaclePool(capacity=2)
+        obstacles = [pool.acquire(0, 0) for _ in range(3)]
+        self.assertEqual(pool.overflow, 1)
+        self.assertEqual(pool.high_water, 3)
+        pool.release_all(obstacles)
+        self.assertEqual(pool.stats()['in_use'], 0)
+        self.assertEqual(pool.stats()['free'], 2)
+
+    def test_steady_state_game_creates_no_obstacles(self):      # В долгой игре объекты создаются только при разогреве
+        random.seed(5)
+        gm = make_game_manager()
+        gm.is_paused = False
+        gm.lives = 1000
+        for step in range(12000):
+            if step % 97 == 0:
+                gm.player.jump()
+            gm.update(1 / 120)
+        stats = gm.obstacle_pool.stats()
+        self.assertGreater(stats['reused'], stats['created'] * 5)
+        self.assertLessEqual(stats['created'], stats['high_water'])
+        self.assertEqual(stats['in_use'], len(gm.obstacles))
+
+
+class TestSlots(unittest.TestCase):     # Тесты компактных объектов со слотами
+    def setUp(self):
+        init_display()
+
+    def test_entities_have_no_dict(self):       # У игровых объектов нет словаря атрибутов
+        for obj in (BaseObject(0, 0, 10, 10), Player(100, 500), Obstacle(1250, 490), Cloud(10, 100, 40)):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+        with self.assertRaises(AttributeError):     # опечатка в имени атрибута больше не создает новый атрибут
+            Obstacle(1250, 490).pased = True
+
+    def test_clouds_are_records(self):      # Облака менеджера - записи Cloud
+        gm = make_game_manager()
+        self.assertEqual(len(gm.clouds), 5)
+        for cloud in gm.clouds:
+            self.assertIsInstance(cloud, Cloud)
+            self.assertTrue(50 <= cloud.y <= 300)
+
+
+class TestSimulation(unittest.TestCase):        # Тесты быстрой симуляции без окна
+    def test_headless_manager_has_no_fonts_or_sounds(self):     # Без окна не создаются шрифты и не грузятся звуки
+        sim = Simulation(seed=1)
+        self.assertTrue(sim.game.headless)
+        self.assertIsNone(sim.game.font)
+        self.assertEqual(sim.game.sound_manager.sounds, {})
+        self.assertFalse(sim.game.is_paused)
+
+    def test_same_result_as_windowed_game(self):        # Результат тот же, что у игры в окне с теми же нажатиями
+        jumps = set(range(0, 100000, 97))
+        sim = Simulation(seed=5)
+        result = sim.run(jumps=jumps, max_ticks=6000)
+
+        gm = make_game_manager(seed=5)
+        gm.is_paused = False
+        for tick in range(sim.ticks):
+            if tick in jumps:
+                gm.jump()
+            gm.update(1 / 120)
+        self.assertEqual(result, gm.get_game_result())
+        self.assertEqual(result, sim.result())
+
+    def test_controller_and_tick_limit(self):       # Контроллер вызывается на каждом шаге, max_ticks ограничивает игру
+        calls = []
+        sim = Simulation(seed=2)
+        sim.game.lives = 1000
+        sim.run(controller=lambda game, tick: calls.append(tick) or False, max_ticks=240)
+        self.assertEqual(sim.ticks, 240)
+        self.assertEqual(calls, list(range(240)))
+        self.assertAlmostEqual(sim.game_time(), 2.0)
+
+
+def key_event(key):     # Нажатие клавиши, как его присылает pygame
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+
+class TestReplay(unittest.TestCase):        # Тесты зерна случайных чисел и повторов
+    def test_same_seed_same_obstacles(self):        # Одно зерно - те же облака и препятствия, общий random не важен
+        games = []
+        for noise in (1, 2):
+            random.seed(noise)
+            sim = Simulation(seed=42)
+            sim.game.lives = 1000
+            sim.run(max_ticks=1200)
+            games.append(([(cloud.x, cloud.y) for cloud in sim.game.clouds],
+                          [(obstacle.pos_x, obstacle.rect.size) for obstacle in sim.game.obstacles]))
+        self.assertEqual(games[0], games[1])
+
+    def test_recorded_game_replays_exactly(self):       # Запись из handle_events повторяется бит в бит
+        gm = make_game_manager(seed=11)
+        recorder = ReplayRecorder(gm)
+        rng = random.Random(3)      # неровные кадры: от 0 до 4 шагов между обработками событий
+        gm.handle_events([key_event(pygame.K_p)])       # снимаем с паузы
+        frame = 0
+        while not gm.game_over:
+            frame += 1
+            events = []
+            if frame % 37 == 0:
+                events.append(key_event(pygame.K_SPACE))
+            if frame % 500 == 0:        # пауза и продолжение в одном кадре
+                events += [key_event(pygame.K_p), key_event(pygame.K_p)]
+            gm.handle_events(events)
+            for _ in range(rng.randint(0, 4)):
+                gm.update(1 / 120)
+        gm.handle_events([key_event(pygame.K_r)])       # рестарт тоже записывается
+        for _ in range(300):        # новая игра идет сразу, без паузы
+            gm.update(1 / 120)
+        self.assertFalse(gm.game_over)
+
+        recorder.replay.finish(gm)
+        replay = Replay.from_bytes(recorder.replay.to_bytes())
+        self.assertEqual(replay.inputs, recorder.replay.inputs)
+        self.assertLess(len(replay.to_bytes()), 64 + 3 * len(replay.inputs))     # пара байт на нажатие
+
+        replayed = play_headless(replay)
+        self.assertTrue(replay.matches(replayed))
+        self.assertEqual(replayed.get_game_result(), gm.get_game_result())
+
+    def test_player_applies_inputs_on_recorded_ticks(self):     # Проигрыватель нажимает на нужных шагах
+        replay = Replay(seed=1)
+        replay.add(0, 'pause')
+        replay.add(10, 'jump')
+        player = ReplayPlayer(replay, ReplayPlayer.create_game(replay, headless=True))
+        self.assertEqual(player.apply_due(), 1)
+        self.assertFalse(player.game.is_paused)
+        for _ in range(10):
+            player.game.update(1 / 120)
+        self.assertEqual(player.apply_due(), 1)
+        self.assertTrue(player.game.player.is_jumping)
+
+    def test_out_of_range_seed_is_normalized(self):       # Зерно вне uint32 не ломает запись повтора
+        for seed in (-5, 2 ** 32, 2 ** 40 + 7):
+            sim = Simulation(seed=seed)
+            self.assertEqual(sim.game.seed, seed % 2 ** 32)
+            recorder = ReplayRecorder(sim.game)
+            sim.run(jumps=range(0, 600, 61), max_ticks=600)
+            recorder.replay.finish(sim.game)
+            replay = Replay.from_bytes(recorder.replay.to_bytes())
+            self.assertEqual(replay.seed, seed % 2 ** 32)
+        self.assertEqual(Simulation(seed=-5).run(max_ticks=600), Simulation(seed=2 ** 32 - 5).run(max_ticks=600))
+
+    def test_header_values_are_checked_before_recording(self):     # Значение вне uint16 - ошибка сразу, а не при сохранении
+        for field in ('tick_rate', 'width', 'height', 'speed'):
+            for value in (-5, 70000):
+                with self.assertRaises(ValueError):
+                    Replay(seed=1, **{field: value})
+        sim = Simulation(seed=1)
+        sim.game.game_speed = 70000
+        with self.assertRaises(ValueError):
+            ReplayRecorder(sim.game)
+        Replay.from_bytes(Replay(seed=1, tick_rate=65535, width=0, speed=65535).to_bytes())
+
+    def test_rejects_other_files(self):         # Чужой или обрезанный файл - понятная ошибка
+        with self.assertRaises(ValueError):
+            Replay.from_bytes(b'PNG' + bytes(40))
+        with self.assertRaises(ValueError):
+            Replay.from_bytes(Replay(seed=1).to_bytes()[:-3])
+
+
+@unittest.skipUnless(ObstacleArray.available(), "нужен NumPy")
+class TestBatchEnv(unittest.TestCase):      # Тесты пакета игр для обучения ботов
+    def put_obstacle(self, env, x, y, width=60, height=40):     # Птица без маски в ячейке 0 игры 0
+        env.alive[0, 0] = True
+        env.obstacle_x[0, 0] = x
+        env.obstacle_y[0, 0] = y
+        env.obstacle_speed[0, 0] = 400
+        env.geometry[0, 0] = (width, height, True, -1)
+        env.obstacle_timer[:] = -100        # новые препятствия не появляются
+
+    def test_jump_matches_player(self):     # Прыжок идет по той же траектории, что и у Player
+        env = BatchEnv(2, seed=0)
+        env.obstacle_timer[:] = -100
+        player = Player(100, env.ground_y)
+        player.jump()
+        env.step([True, False])
+        player.update(1 / 120)
+        for _ in range(80):
+            self.assertEqual(env.player_y[0], player.pos_y)
+            env.step([False, False])
+            player.update(1 / 120)
+        self.assertEqual(env.player_y[1], env.ground_y)     # вторая игра не прыгала
+
+    def test_hit_costs_life_and_gives_invulnerability(self):      # Столкновение: минус жизнь и неуязвимость
+        env = BatchEnv(1, seed=0)
+        self.put_obstacle(env, env.player_x + 10, env.ground_y)
+        obs, rewards, dones, info = env.step([False])
+        self.assertEqual(rewards[0], -1)
+        self.assertEqual(env.lives[0], 2)
+        self.assertTrue(env.invulnerable[0])
+        self.assertFalse(env.alive[0, 0])       # препятствие удалено
+        self.assertFalse(dones[0])
+        self.assertEqual(obs[0, 3], 1.0)
+
+    def test_passed_obstacle_scores(self):      # Пройденное препятствие дает +1 один раз
+        env = BatchEnv(1, seed=0)
+        self.put_obstacle(env, env.player_x - 62, env.ground_y - 400)
+        rewards = [env.step([False])[1][0] for _ in range(3)]
+        self.assertEqual(rewards, [1, 0, 0])
+        self.assertEqual(env.score[0], 1)
+
+    def test_game_over_resets_env(self):        # Закончившаяся игра сразу начинается заново
+        env = BatchEnv(3, lives=1, seed=0)
+        self.put_obstacle(env, env.player_x + 10, env.ground_y)
+        obs, rewards, dones, info = env.step([False] * 3)
+        self.assertEqual(dones.tolist(), [True, False, False])
+        self.assertEqual(info['ticks'][0], 1)
+        self.assertEqual(env.lives[0], 1)       # новый эпизод
+        self.assertEqual(env.ticks[0], 0)
+        self.assertEqual(env.episodes, 1)
+        self.assertEqual(obs.shape, (3, env.observation_size))
+
+    def test_matches_simulation(self):      # Те же препятствия и прыжки - те же столкновения, что и в игре
+        manifest = AssetManifest.shared()
+        variants = manifest.obstacles['ground'] + manifest.obstacles['flying']
+        if not variants:
+            self.skipTest("нет картинок препятствий")
+        for variant in variants:
+            flying = variant.kind == 'flying'
+            for jump_tick in [None] + list(range(0, 100, 2)):     # прыжки до, над и после препятствия
+                sim = Simulation(seed=0)
+                env = BatchEnv(1, seed=0)
+                game = sim.game
+                y = game.ground_y - (225 if flying else Obstacle.GROUND_LIFT)
+                x = game.player.rect.right + 300
+                game.obstacles.append(Obstacle(x, y, speed=game.game_speed, variant=variant))
+                self.put_obstacle(env, x, y, variant.width, variant.height)
+                env.geometry[0, 0, 2:] = (flying, env._variant_mask(variant))
+                game.obstacle_timer = -100
+                for tick in range(200):
+                    sim.step(tick == jump_tick)
+                    env.step([tick == jump_tick])
+                    self.assertEqual(env.player_y[0], game.player.pos_y)
+                    self.assertEqual((env.lives[0], env.score[0]), (game.lives, game.score),
+                                     f"{variant.name}, прыжок {jump_tick}, шаг {tick}")
+
+    def test_spriteless_hit_matches_simulation(self):       # Препятствие без картинки - сплошной прямоугольник, как в игре
+        for overlap in (5, 10, 14):
+            sim = Simulation(seed=0)
+            game = sim.game
+            game.obstacle_timer = -100
+            x, y = game.player.rect.right - overlap, game.player.rect.y
+            obstacle = Obstacle(x, y, 60, 60, speed=0)
+            obstacle.sprite = None
+            obstacle.rect.size = (60, 60)
+            game.obstacles.append(obstacle)
+            sim.step()
+
+            env = BatchEnv(1, seed=0)
+            self.put_obstacle(env, x, y, 60, 60)
+            env.geometry[0, 0, 2] = False
+            env.obstacle_speed[0, 0] = 0
+            env.step([False])
+            self.assertEqual(env.lives[0], game.lives, f"перекрытие {overlap}")
+
+    def test_random_play_is_reproducible(self):     # Одно зерно - одинаковые эпизоды
+        def play():
+            env = BatchEnv(8, max_ticks=600, seed=4)
+            actions = np.random.default_rng(1)
+            total = np.zeros(8)
+            for _ in range(1200):
+                total += env.step(actions.random(8) < 0.02)[1]
+            return total.tolist(), env.episodes
+
+        first = play()
+        self.assertGreaterEqual(first[1], 8)        # эпизоды обрываются по max_ticks
+        self.assertEqual(first, play())
+
+
+class TestSweep(unittest.TestCase):      # Тесты массового прогона игр в пуле процессов
+    SETTINGS = {'speed': 400, 'obstacle_interval': 1.5, 'speed_increase_interval': 5}
+
+    def setUp(self):
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.tmp.name, 'results.jsonl')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_pool_matches_single_process(self):     # Процессы пула дают те же игры, что и один процесс
+        single = os.path.join(self.tmp.name, 'single.jsonl')
+        run_sweep([self.SETTINGS], ['random:0.02', 'periodic:97'], range(6), single, workers=1)
+        stats = run_sweep([self.SETTINGS], ['random:0.02', 'periodic:97'], range(6), self.output,
+                          workers=2, chunk_size=2)
+        by_key = lambda rows: sorted(rows, key=lambda row: (row['policy'], row['seed']))
+        self.assertEqual(by_key(load_results(self.output)), by_key(load_results(single)))
+        self.assertEqual(stats.games, 12)
+        self.assertEqual(len(stats.rows()), 2)
+
+    def test_resume_skips_played_games(self):       # Повторный запуск доигрывает только недостающее
+        run_sweep([self.SETTINGS], ['random:0.02'], range(3), self.output, workers=1)
+        with open(self.output, 'a') as file:
+            file.write('{"speed": 400, "obst')      # строка, оборванная при прерывании
+        played = []
+        stats = run_sweep([self.SETTINGS], ['random:0.02'], range(5), self.output, workers=1,
+                          progress=lambda done, total: played.append((done, total)))
+        self.assertEqual(played[-1], (2, 2))
+        self.assertEqual(stats.games, 5)
+        self.assertEqual(sorted(row['seed'] for row in load_results(self.output)), [0, 1, 2, 3, 4])
+
+    def test_difficulty_settings_apply(self):       # Настройки сложности попадают в игру
+        easy = play_game(dict(self.SETTINGS, obstacle_interval=1000), 'periodic:97', 1, max_seconds=20)
+        self.assertTrue(easy['timeout'])        # препятствий нет - игра обрывается по времени
+        self.assertEqual((easy['score'], easy['lives'], easy['ticks']), (0, 3, 2400))
+        with self.assertRaises(ValueError):
+            run_sweep([self.SETTINGS], ['teleport'], range(1), self.output, workers=1)
+
+
+class TestGameState(unittest.TestCase):       # Тесты компактного состояния игры для прогнозов
+    def play_until(self, seed, ticks, backend='list'):     # Игра без окна, остановленная на шаге ticks
+        sim = Simulation(seed=seed, obstacle_backend=backend)
+        sim.game.lives = 50     # чтобы игра не кончилась раньше
+        sim.run(jumps=range(0, ticks, 53), max_ticks=ticks)
+        sim.game.obstacle_interval = 1e9        # новые препятствия в прогнозе не появляются
+        return sim
+
+    def test_prediction_matches_game(self):     # Прогноз совпадает с игрой до бита
+        for backend in ('list', 'array') if ObstacleArray.available() else ('list',):
+            sim = self.play_until(4, 700, backend)
+            state = GameState.capture(sim.game)
+            for tick in range(300):
+                jump = tick % 71 == 0
+                state.step(1 / 120, jump)
+                sim.step(jump)
+            player = sim.game.player
+            self.assertEqual((state.tick, state.score, state.lives, state.game_speed),
+                             (sim.game.tick, sim.game.score, sim.game.lives, sim.game.game_speed))
+            self.assertEqual((state.player_y, state.velocity_y, state.invulnerable_timer),
+                             (player.pos_y, player.velocity_y, player.invulnerable_timer))
+            if backend == 'list':
+                self.assertEqual(state.obstacle_x, [obstacle.pos_x for obstacle in sim.game.obstacles])
+
+    def test_fork_is_independent(self):     # Копия не меняет оригинал и делит неизменные данные
+        state = GameState.capture(self.play_until(2, 400).game)
+        copy = state.fork()
+        self.assertIs(copy.shapes, state.shapes)
+        before = (state.tick, state.player_y, list(state.obstacle_x))
+        for _ in range(30):
+            copy.step(1 / 120, jump=True)
+        self.assertEqual((state.tick, state.player_y, state.obstacle_x), before)
+        self.assertNotEqual(copy.player_y, state.player_y)
+
+
+class TestAutopilot(unittest.TestCase):      # Тесты встроенного бота
+    def test_jumps_over_obstacle_ahead(self):       # Перед препятствием на земле бот прыгает вовремя
+        sim = Simulation(seed=0)
+        sim.game.obstacle_interval = 1e9
+        sim.game.obstacles.append(Obstacle(500, sim.game.ground_y - 10, 180, 180, speed=400))
+        pilot = Autopilot()
+        sim.run(controller=pilot.controller, max_ticks=400)
+        self.assertEqual((sim.game.lives, sim.game.score), (3, 1))
+        self.assertEqual(sim.jumps, 1)
+        self.assertGreater(pilot.decisions, 0)
+
+    def test_decides_on_landing_tick(self):      # После приземления бот решает сразу, не дожидаясь точки сетки
+        sim = Simulation(seed=0)
+        pilot = Autopilot()
+        landings = []
+        airborne = [False]
+        def controller(game, tick):
+            decisions = pilot.decisions
+            jump = pilot.decide(game)
+            if airborne[0] and not game.player.is_jumping and not game.player.invulnerable:
+                landings.append(jump or pilot.decisions > decisions)
+            airborne[0] = game.player.is_jumping
+            return jump
+        sim.run(controller=controller, max_ticks=1500)
+        self.assertTrue(landings)
+        self.assertTrue(all(landings))
+
+    def test_search_budget(self):       # Предел шагов и времени ограничивает поиск
+        pilot = Autopilot(max_steps=200)
+        hurried = Autopilot(time_budget=0.0)        # время вышло сразу: варианты обрываются через 16 шагов
+        steps = []
+        def controller(game, tick):
+            hurried.decide(game)
+            jump = pilot.decide(game)
+            steps.append((pilot.steps, hurried.steps))
+            return jump
+        Simulation(seed=2).run(controller=controller, max_ticks=1500)
+        self.assertLessEqual(max(step for step, _ in steps), 200 + (pilot.max_jumps + 1) * pilot.horizon_ticks)
+        self.assertLessEqual(max(step for _, step in steps), 2 * 16)
+
+    def test_outplays_random_bot(self):     # Бот играет намного лучше случайных прыжков
+        rng = random.Random(1)
+        baseline = Simulation(seed=1).run(controller=lambda game, tick: rng.random() < 0.02)
+        result = Simulation(seed=1).run(controller=Autopilot().controller, max_ticks=120 * 60)
+        self.assertGreater(result['score'], baseline['score'] + 10)
+
+
+class TestGameSnapshot(unittest.TestCase):       # Тесты двоичных снимков состояния
+    def play(self, sim, ticks):     # Продолжает игру на ticks шагов с прыжками по расписанию
+        for tick in range(ticks):
+            sim.step(tick % 47 == 0)
+
+    def test_restore_continues_exactly(self):       # Игра из снимка идет бит в бит как исходная
+        for backend in ('list', 'array') if ObstacleArray.available() else ('list',):
+            sim = Simulation(seed=7, obstacle_backend=backend)
+            sim.game.lives = 30     # чтобы игра не кончилась раньше
+            self.play(sim, 1500)
+            data = GameSnapshot.capture(sim.game)
+            self.play(sim, 1200)
+
+            restored = Simulation(seed=99, obstacle_backend=backend)       # другое зерно - все берется из снимка
+            GameSnapshot.restore(restored.game, data)
+            self.play(restored, 1200)
+            self.assertEqual(state_digest(restored.game), state_digest(sim.game))
+            self.assertEqual(GameSnapshot.capture(restored.game), GameSnapshot.capture(sim.game))
+
+    def test_restores_spawn_schedule(self):     # Очередь расписания тоже в снимке
+        sim = Simulation(seed=7, spawn_schedule=True)
+        sim.game.lives = 30
+        self.play(sim, 1500)
+        data = GameSnapshot.capture(sim.game)
+        tail = dict(sim.game.spawn_schedule.tail)
+        self.play(sim, 3000)
+        restored = Simulation(seed=99, spawn_schedule=True)
+        GameSnapshot.restore(restored.game, data)
+        self.assertTrue(tail)
+        self.assertEqual(restored.game.spawn_schedule.tail, tail)       # состояния проверки проходимости
+        self.play(restored, 3000)
+        self.assertEqual(state_digest(restored.game), state_digest(sim.game))
+        with self.assertRaises(ValueError):     # игра без расписания такой снимок не принимает
+            GameSnapshot.restore(Simulation(seed=7).game, data)
+
+    def test_out_of_range_seed(self):       # Любое зерно, принятое игрой, помещается в снимок
+        for seed in (-5, 2 ** 32):
+            sim = Simulation(seed=seed, spawn_schedule=True)
+            self.play(sim, 600)
+            restored = Simulation(seed=1, spawn_schedule=True)
+            GameSnapshot.restore(restored.game, GameSnapshot.capture(sim.game))
+            self.assertEqual(restored.game.seed, seed % 2 ** 32)
+            self.assertEqual(restored.game.spawn_schedule.seed, seed % 2 ** 32)
+
+    def test_rejects_bad_data(self):        # Чужие, обрезанные и несовместимые снимки не загружаются
+        data = GameSnapshot.capture(Simulation(seed=1).game)
+        game = Simulation(seed=2).game
+        for bad in (b'PNG' + data[3:], data[:-1], data[:4] + bytes([99]) + data[5:]):
+            with self.assertRaises(ValueError):
+                GameSnapshot.restore(game, bad)
+        with self.assertRaises(ValueError):
+            GameSnapshot.restore(Simulation(width=800, seed=1).game, data)
+
+    def test_history_rewinds_after_death(self):     # Перемотка возвращает игру до проигрыша
+        sim = Simulation(seed=3)
+        history = SnapshotHistory(interval=120)
+        while not sim.step():
+            history.record(sim.game)
+        self.assertTrue(history.rewind(sim.game, 360))
+        self.assertFalse(sim.game.game_over)
+        self.assertGreater(sim.game.lives, 0)
+
+
+class TestSpawnSchedule(unittest.TestCase):      # Тесты расписания проходимых препятствий
+    def test_reachability_by_jump_arc(self):        # Две кости через 0.5 с на скорости 400 не перепрыгнуть
+        player = Simulation(seed=0).game.player
+        check = JumpReachability(player)
+        bone = ScheduledSpawn(0.0, 1250, player.ground_y - 10, 50, 60, None, False, None)
+        self.assertTrue(check.passable([bone], 400, 1.0))
+        self.assertFalse(check.passable([bone, bone], 400, 0.5))     # после первого прыжка не успеть на землю
+        self.assertTrue(check.passable([bone, bone], 400, 0.3))      # обе - одним прыжком
+        self.assertTrue(check.passable([bone, bone.with_delay(0.5)], 400, 0.5))     # запас времени спасает
+
+    def test_reachability_carries_state(self):      # На 1000 px/s опоздание после прыжков копится от кости к кости
+        player = Simulation(seed=0).game.player
+        check = JumpReachability(player)
+        bone = ScheduledSpawn(0.0, 1250, player.ground_y - 10, 50, 60, None, False, None)
+        self.assertTrue(check.passable([bone] * 3, 1000, 0.8))      # любые три подряд "с земли" проходимы
+        self.assertFalse(check.passable([bone] * 4, 1000, 0.8))
+        state = check.advance(JumpReachability.START, bone, 1000, 0.8)
+        self.assertFalse(check.passable([bone] * 3, 1000, 0.8, state))
+
+    def test_schedule_is_passable(self):        # При малом интервале расписание отодвигает препятствия
+        for speed, interval in ((400, 0.6), (1000, 0.8)):
+            game = Simulation(seed=0).game
+            game.game_speed, game.obstacle_interval = speed, interval
+            schedule = SpawnSchedule(5, game.screen_width, game.ground_y, game.player, threaded=False)
+            spawns = [schedule.pop(game) for _ in range(40)]        # пять кусков: состояние переходит из куска в кусок
+            self.assertTrue(schedule.reachability.passable(spawns, speed, interval))
+            self.assertGreater(schedule.delayed, 0)
+
+    def test_schedule_grows_delay(self):        # Если запасов DELAYS не хватило, запас растет, а не сдается
+        game = Simulation(seed=0).game
+        game.obstacle_interval = 0.6
+        schedule = SpawnSchedule(5, game.screen_width, game.ground_y, game.player, threaded=False)
+        schedule.DELAYS = (0.0,)
+        schedule.ATTEMPTS = 1
+        spawns = [schedule.pop(game) for _ in range(40)]
+        self.assertGreater(schedule.forced, 0)
+        self.assertTrue(schedule.reachability.passable(spawns, game.game_speed, 0.6))
+
+    def test_thread_does_not_change_game(self):     # Игра с фоновым потоком и без него - одна и та же
+        digests = []
+        for threaded in (False, True):
+            sim = Simulation(seed=4, spawn_schedule=True)
+            sim.game.spawn_schedule.threaded = threaded
+            sim.game.lives = 20
+            sim.run(jumps=range(0, 6000, 53), max_ticks=6000)
+            digests.append(state_digest(sim.game))
+        self.assertEqual(digests[0], digests[1])
+
+    def test_replay_and_restart(self):      # Повтор игры с расписанием и рестартом совпадает с записью
+        sim = Simulation(seed=8, spawn_schedule=True)
+        recorder = ReplayRecorder(sim.game)
+        sim.game.record_input('pause')     # при воспроизведении игра стартует на паузе, как в окне
+        while sim.ticks < 4000:
+            if sim.ticks % 59 == 0:
+                sim.game.record_input('jump')
+                sim.game.jump()
+            if sim.step():
+                sim.game.record_input('restart')
+                sim.game.reset_game()
+        recorder.replay.finish(sim.game)
+        replay = Replay.from_bytes(recorder.replay.to_bytes())
+        self.assertTrue(replay.spawn_schedule)
+        self.assertTrue(replay.matches(play_headless(replay)))
+
+
+class TestSoundCache(unittest.TestCase):      # Тесты кэша декодированных звуков и канала музыки
+    def setUp(self):
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+
+    def test_sounds_path_independent_of_cwd(self):      # Звуки находятся из любой текущей папки
+        self.assertTrue(os.path.isabs(SoundManager.SOUNDS_PATH))
+        cwd = os.getcwd()
+        os.chdir(os.path.dirname(SoundManager.SOUNDS_PATH))
+        try:
+            self.assertTrue(SoundManager().sound_files())
+        finally:
+            os.chdir(cwd)
+
+    def test_second_manager_uses_memory_cache(self):     # Второй менеджер не декодирует звуки заново
+        first = SoundManager()
+        first.preload()
+        second = SoundManager()
+        second.preload()
+        self.assertIsNotNone(second.music)
+        self.assertIs(second.music, first.music)
+        self.assertNotIn('background', second.sounds)     # Музыка не среди эффектов
+        for name, sound in second.sounds.items():
+            self.assertIs(sound, first.sounds[name])
+
+    def test_toggle_pauses_predecoded_music(self):      # Выключение и включение - пауза канала, без загрузки файла
+        sm = SoundManager()
+        sm.preload()
+        sm.play_music()
+        self.assertIs(sm.music_channel.get_sound(), sm.music)
+        self.assertFalse(sm.toggle_music())
+        self.assertFalse(sm.music_playing)
+        self.assertTrue(sm.toggle_music())
+        self.assertTrue(sm.music_playing)
+        self.assertIs(sm.music_channel.get_sound(), sm.music)     # Та же музыка на том же канале
+        self.assertFalse(pygame.mixer.music.get_busy())        # Поток из файла не открывался
+        sm.set_volume(1.0)
+        self.assertAlmostEqual(sm.music_channel.get_volume(), 0.3, places=2)
+        sm.stop_music()
+
 if __name__ == '__main__':
     unittest.main()
-